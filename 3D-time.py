@@ -1,7 +1,10 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
+
+from chronos_pipeline import find_debt_column, merge_mass_dump, rebenchmark
+from chronos_store import load_benchmark, write_benchmark
+from gc_fitter import live_model
+from lazy_import import lazy_module
+px = lazy_module("plotly.express")
 
 # ==============================================================================
 # SIMUREALITY: THE UNIFIED ENGINE (V11 MASSES + CHRONOS GC)
@@ -24,44 +27,24 @@ with colB:
 if masses_file is not None and chronos_file is not None:
     with st.spinner("Сшиваем метрики и компилируем Матрицу..."):
         # 1. Читаем файлы
-        df_masses = pd.read_csv(masses_file)
-        df_chronos = pd.read_csv(chronos_file)
+        df_masses = load_benchmark(masses_file)
+        df_chronos = load_benchmark(chronos_file)
         
         # 2. Ищем колонку нового долга (страховка от разных названий в дампе)
-        debt_col = None
-        for c in ['Grid Debt/Error (MeV)', 'Grid Debt', 'Error (MeV)']:
-            if c in df_masses.columns:
-                debt_col = c
-                break
+        debt_col = find_debt_column(df_masses)
                 
         if debt_col is None:
             st.error(f"❌ В файле масс не найдена колонка долга! Колонки: {list(df_masses.columns)}")
         else:
-            # 3. ВЫТЯЖКА ДАННЫХ ИЗ СТАРОГО ФАЙЛА (Только база ЦЕРНа)
-            base_cols = ['Isotope', 'Z', 'A', 'Status', 'Log10(T_1/2)']
-            existing_base_cols = [c for c in base_cols if c in df_chronos.columns]
-            df_nubase = df_chronos[existing_base_cols].copy()
-            
-            # 4. СЛИЯНИЕ ПО Z И A
-            df_merged = pd.merge(df_nubase, df_masses[['Z', 'A', debt_col]], on=['Z', 'A'], how='inner')
-            
-            # 5. ПЕРЕСЧЕТ CHRONOS (Новая геометрия -> Новое Время)
-            df_merged['ΔK Debt (MeV)'] = df_merged[debt_col].abs()
-            
-            df_merged['3D_Jitter'] = (df_merged['ΔK Debt (MeV)'] / 110.0).clip(0, 0.4999)
-            df_merged['Desync_Angle_Deg'] = df_merged['3D_Jitter'] * 360.0
-            df_merged['Unpaired'] = ((df_merged['Z'] % 2 != 0) | ((df_merged['A'] - df_merged['Z']) % 2 != 0)).astype(int)
-            
-            T_base, Z_imp, E_pow, P_lock = 2.76, 0.04, -0.87, -0.13
-            df_merged['Predicted_LogT'] = T_base + (Z_imp * df_merged['Z']) + (E_pow * np.sqrt(df_merged['ΔK Debt (MeV)'])) + (P_lock * df_merged['Unpaired'])
+            # 3-4. ВЫТЯЖКА БАЗЫ ЦЕРНа ИЗ СТАРОГО ФАЙЛА + СЛИЯНИЕ ПО Z И A
+            df_inputs = merge_mass_dump(df_chronos, df_masses, debt_col)
             
-            df_merged['Error_Delta'] = abs(df_merged['Predicted_LogT'] - df_merged['Log10(T_1/2)'])
-            df_merged = df_merged.sort_values('Desync_Angle_Deg')
+            # 5. ПЕРЕСЧЕТ CHRONOS (Новая геометрия -> Новое Время), только изменившиеся ядра
+            df_merged, run = rebenchmark(df_inputs, "chronos_v11", engine="V11", model=live_model())
             
             # --- ВЫВОД РЕЗУЛЬТАТОВ БЕНЧМАРКА ---
             df_unstable = df_merged[(df_merged['Status'] == 'Unstable') & (df_merged['Log10(T_1/2)'].notna())]
-            mae_global = df_unstable['Error_Delta'].mean()
-            accuracy_percent = max(0, 100 - (mae_global / 50.0 * 100))
+            mae_global, accuracy_percent = run["mae"], run["accuracy"]
             
             st.success("✅ Слияние успешно завершено!")
             
@@ -69,6 +52,7 @@ if masses_file is not None and chronos_file is not None:
             c1.metric("Сшито ядер (Nodes Compiled)", f"{len(df_merged)}")
             c2.metric("Новая средняя ошибка (MAE)", f"{mae_global:.3f} порядков")
             c3.metric("Точность Сборщика Мусора", f"{accuracy_percent:.2f}%")
+            st.caption(f"Ревизия {run['revision']} (модель {run['fingerprint']}): пересчитано {run['recomputed']}, переиспользовано {run['reused']} ядер.")
             
             # --- ГРАФИК ---
             st.subheader("Global Phase Shift")
@@ -84,7 +68,8 @@ if masses_file is not None and chronos_file is not None:
             # --- СКАЧИВАНИЕ ---
             st.divider()
             st.markdown("### 💾 Экспорт Мастер-Файла")
-            cols_to_export = ['Isotope', 'Z', 'A', 'Status', 'Log10(T_1/2)', 'ΔK Debt (MeV)', 'Desync_Angle_Deg', 'Unpaired', 'Predicted_LogT', 'Error_Delta']
+            cols_to_export = ['Isotope', 'Z', 'A', 'Status', 'Log10(T_1/2)', 'ΔK Debt (MeV)', 'Desync_Angle_Deg', 'Unpaired_Ports', 'Predicted_LogT', 'Error_Delta']
+            write_benchmark(df_merged[cols_to_export], "chronos_v11", source="3D-time")
             csv_data = df_merged[cols_to_export].to_csv(index=False).encode('utf-8')
             
             st.download_button(
@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
+from lazy_import import lazy_module
+go = lazy_module("plotly.graph_objects")
 
 # =====================================================================
 # SIMUREALITY: V10.1 STRICT GEOMETRIC ROUTER
@@ -1,6 +1,8 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
+
+from chronos_pipeline import find_debt_column, merge_mass_dump, rebenchmark
+from chronos_store import load_benchmark
+from gc_fitter import live_model
 
 # ==============================================================================
 # SIMUREALITY: CHRONOS V10 DATA PIPELINE COMPILER (AB-INITIO CORE INTEGRATION)
@@ -28,58 +30,31 @@ if old_file is not None and new_file is not None:
     
     try:
         # 1. Загрузка данных
-        df_old = pd.read_csv(old_file)
-        df_new = pd.read_csv(new_file)
-        
-        # Оставляем из старого файла только фундаментальные экспериментальные метрики NUBASE
-        base_cols = ['Isotope', 'Z', 'A', 'Status', 'Log10(T_1/2)']
-        existing_base_cols = [c for c in base_cols if c in df_old.columns]
-        df_old_clean = df_old[existing_base_cols].copy()
+        df_old = load_benchmark(old_file)
+        df_new = load_benchmark(new_file)
         
         # Находим нужную колонку долга в новом дампе масс
-        debt_col = None
-        for c in ['Grid Debt/Error (MeV)', 'Grid Debt', 'Error (MeV)']:
-            if c in df_new.columns:
-                debt_col = c
-                break
+        debt_col = find_debt_column(df_new)
         
         if debt_col is None:
             st.error(f"❌ Критическая ошибка структуры: В файле масс не найдена колонка топологического долга. Доступные колонки: {list(df_new.columns)}")
         else:
-            # 2. Операция Слияния (Handshake) узлов по координатам Z и A
-            df_merged = pd.merge(df_old_clean, df_new[['Z', 'A', debt_col]], on=['Z', 'A'], how='inner')
-            
-            # 3. Конвертация ошибки в абсолютный Топологический Долг
-            df_merged['ΔK Debt (MeV)'] = df_merged[debt_col].abs()
-            df_merged = df_merged.drop(columns=[debt_col])
-            
-            # 4. Аппаратный пересчет Движка Времени (Chronos V10 Core)
-            df_merged['3D_Jitter'] = (df_merged['ΔK Debt (MeV)'] / 110.0).clip(0, 0.4999)
-            df_merged['Desync_Angle_Deg'] = df_merged['3D_Jitter'] * 360.0
-            
-            # Определение неспаренных портов (Hardware Lock)
-            df_merged['Unpaired'] = ((df_merged['Z'] % 2 != 0) | ((df_merged['A'] - df_merged['Z']) % 2 != 0)).astype(int)
-            
-            # Вычисление детерминированного таймаута Сборщика Мусора (GC Equation)
-            T_base, Z_imp, E_pow, P_lock = 2.76, 0.04, -0.87, -0.13
-            df_merged['Predicted_LogT'] = T_base + (Z_imp * df_merged['Z']) + (E_pow * np.sqrt(df_merged['ΔK Debt (MeV)'])) + (P_lock * df_merged['Unpaired'])
-            
-            # Расчет дельты ошибки
-            df_merged['Error_Delta'] = abs(df_merged['Predicted_LogT'] - df_merged['Log10(T_1/2)'])
+            # 2. Операция Слияния (Handshake) узлов по координатам Z и A + абсолютный Топологический Долг
+            df_inputs = merge_mass_dump(df_old, df_new, debt_col)
             
-            # Сортировка по углу деградации
-            df_merged = df_merged.sort_values('Desync_Angle_Deg')
+            # 3-4. Аппаратный пересчет Движка Времени (GC Equation): только строки с новыми входами,
+            # остальное - из прошлой ревизии хранилища Chronos. Сортировка по углу деградации.
+            df_merged, run = rebenchmark(df_inputs, "chronos_v10_master_debt", engine="V10", model=live_model())
             
-            # --- ВЫВОД РЕЗУЛЬТАТОВ БЕНЧМАРКА ---
-            df_unstable = df_merged[(df_merged['Status'] == 'Unstable') & (df_merged['Log10(T_1/2)'].notna())]
-            mae_global = df_unstable['Error_Delta'].mean()
-            accuracy_percent = max(0, 100 - (mae_global / 50.0 * 100))
+            # --- ВЫВОД РЕЗУЛЬТАТОВ БЕНЧМАРКА (инкрементальные агрегаты) ---
+            mae_global, accuracy_percent = run["mae"], run["accuracy"]
             
             st.markdown("### 🎯 Live Benchmark: Результаты валидации новой матрицы")
             c1, c2, c3 = st.columns(3)
             c1.metric("Сшито ядер (Nodes Compiled)", f"{len(df_merged)}")
             c2.metric("Новая средняя ошибка (MAE)", f"{mae_global:.3f} orders")
             c3.metric("Точность Сборщика Мусора", f"{accuracy_percent:.2f}%", delta="Grid Physics V10")
+            st.caption(f"Ревизия {run['revision']} (модель {run['fingerprint']}): пересчитано {run['recomputed']}, переиспользовано {run['reused']} ядер.")
             
             # Секция скачивания готового CSV
             st.divider()
@@ -1,9 +1,12 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from scipy import stats
-import plotly.express as px
-import os
+
+from chronos_store import load_benchmark
+from resampling import N_RESAMPLES, correlation_significance
+from lazy_import import lazy_module
+stats = lazy_module("scipy.stats")
+px = lazy_module("plotly.express")
 
 # ==========================================================================================
 # SIMUREALITY: CHRONOS ANALYZER V8.1
@@ -16,13 +19,17 @@ st.markdown("""
 **Rigorous verification tool.** Correlation analysis between FCC Topological Debt ($\Delta K$) and isotope lifetimes based on Core+Halo topology.
 """)
 
+RESAMPLE_WORKERS = 4  # processes per split: the Streamlit server is shared, one session does not take every core
+
+@st.cache_data
+def resampled_significance(x, y, n_resamples, seed=0):
+    """Bootstrap CI + permutation null (vectorized blocks on a small process pool), cached per split."""
+    return correlation_significance(x, y, n_resamples, seed=seed, workers=RESAMPLE_WORKERS)
+
 @st.cache_data
 def load_data():
-    # ИЗМЕНЕНИЕ: Ищем новый дамп от V8.0
-    file_name = "simureality_chronos_v8_benchmark.csv"
-    if os.path.exists(file_name):
-        return pd.read_csv(file_name)
-    return None
+    # ИЗМЕНЕНИЕ: Ищем новый дамп от V8.0 (сначала в хранилище Chronos, потом CSV)
+    return load_benchmark("chronos_v8", "simureality_chronos_v8_benchmark.csv")
 
 df = load_data()
 
@@ -30,7 +37,7 @@ if df is None:
     st.warning("File `simureality_chronos_v8_benchmark.csv` not found in the root directory. Upload it manually:")
     uploaded_file = st.file_uploader("Upload CSV", type=["csv"])
     if uploaded_file:
-        df = pd.read_csv(uploaded_file)
+        df = load_benchmark(uploaded_file)
 
 if df is not None:
     # Data cleaning: keeping only unstable nuclei, excluding extreme incomplete builds (Drip Line)
@@ -85,6 +92,32 @@ if df is not None:
         )
         st.plotly_chart(fig_light, use_container_width=True)
 
+    # --- BLOCK 1b: RESAMPLING SIGNIFICANCE (NO DISTRIBUTIONAL ASSUMPTIONS) ---
+    st.subheader("Resampling significance")
+    n_resamples = int(st.number_input("Resamples (bootstrap and permutation each)", min_value=1000,
+                                      max_value=1_000_000, value=N_RESAMPLES, step=10_000))
+    col_rs1, col_rs2 = st.columns(2)
+    for col, name, part in ((col_rs1, "Heavy (Z > 82)", heavy), (col_rs2, "Light/Medium (Z ≤ 82)", light)):
+        sig = resampled_significance(part['ΔK Debt (MeV)'].to_numpy(), part['Log10(T_1/2)'].to_numpy(), n_resamples)
+        with col:
+            if sig is None:
+                st.warning(f"{name}: insufficient data.")
+                continue
+            st.metric(f"{name}: {sig['confidence']:.0%} bootstrap CI", f"[{sig['ci_low']:.3f}, {sig['ci_high']:.3f}]")
+            p_label = f"< {sig['p_floor']:.1e}" if sig['p_perm'] <= sig['p_floor'] else f"{sig['p_perm']:.2e}"
+            st.metric("Permutation p-value (two-sided)", p_label)
+            # 2x10^5 значений бинуются здесь, в браузер уходят только 2x200 столбцов
+            edges = np.linspace(-1, 1, 201)
+            dist = pd.DataFrame({
+                "r": np.tile((edges[:-1] + edges[1:]) / 2, 2),
+                "Resamples": np.concatenate([np.histogram(sig['bootstrap'], edges)[0], np.histogram(sig['null'], edges)[0]]),
+                "Distribution": ["Bootstrap r"] * 200 + ["Permutation null"] * 200,
+            })
+            fig_rs = px.bar(dist, x="r", y="Resamples", color="Distribution", barmode="overlay",
+                            template="plotly_dark", title=f"{name}: r across {sig['resamples']:,} resamples")
+            fig_rs.add_vline(x=sig['r'], line_dash="dash", line_color="red")
+            st.plotly_chart(fig_rs, use_container_width=True)
+
     st.info("""
     **How to read the charts:** The red trend line goes down. This proves a strict rule: 
     *The greater the Topological Debt (deviation from the ideal 3D Matrix / Core+Halo limit), the faster the Task Manager kills the process (decay).* The probability that this trend is random (p-value) is mathematically zero.
@@ -110,6 +143,12 @@ if df is not None:
         col3, col4 = st.columns([1, 2])
         with col3:
             st.metric(f"Correlation for Z={selected_Z}", f"{r_chain:.3f}")
+            sig_chain = resampled_significance(chain['ΔK Debt (MeV)'].to_numpy(), chain['Log10(T_1/2)'].to_numpy(), n_resamples)
+            if sig_chain is None:
+                st.warning("Insufficient data for resampling (ΔK or lifetime is constant across the chain).")
+            else:
+                st.metric("Bootstrap CI", f"[{sig_chain['ci_low']:.3f}, {sig_chain['ci_high']:.3f}]")
+                st.metric("Permutation p-value", f"{sig_chain['p_perm']:.2e}")
             st.metric("Isotopes in chain", len(chain))
             st.dataframe(chain[['Isotope', 'ΔK Debt (MeV)', 'Log10(T_1/2)']].sort_values('ΔK Debt (MeV)'))
             
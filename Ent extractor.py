@@ -1,30 +1,22 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 import os
 
+from nuclear_data import ame_binding_dict
+from lazy_import import lazy_module
+px = lazy_module("plotly.express")
+go = lazy_module("plotly.graph_objects")
+
 # =====================================================================
 # SIMUREALITY: NESTED ENTANGLEMENT EXTRACTOR (L1 / L2 CACHE)
 # =====================================================================
 
 @st.cache_data
 def load_ame2020():
-    db = {}
     file_path = "mass.txt"
-    if not os.path.exists(file_path): return db
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            if len(line) < 100 or "A T O M I C" in line or "mass.mas20" in line: continue
-            try:
-                n_str, z_str, be_str = line[4:9].strip(), line[9:14].strip(), line[54:67].strip().replace('#', '')
-                if not n_str.isdigit() or not z_str.isdigit() or '*' in be_str or not be_str: continue
-                N, Z = int(n_str), int(z_str)
-                total_be_MeV = (float(be_str) * (N + Z)) / 1000.0
-                db[(Z, N)] = total_be_MeV
-            except ValueError: continue
-    return db
+    if not os.path.exists(file_path): return {}
+    return ame_binding_dict(file_path)
 
 def generate_fcc_magic():
     base_shells = [int((n+1)*(n+2)*(n+3)/3) for n in range(6)] 
@@ -1,10 +1,13 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import math
-from rdkit import Chem
-from rdkit.Chem import AllChem, Descriptors, rdMolDescriptors
+from lazy_import import lazy_module
+from conformer_cache import embedded_molecule
+px = lazy_module("plotly.express")
+Chem = lazy_module("rdkit.Chem")
+Descriptors = lazy_module("rdkit.Chem.Descriptors")
+rdMolDescriptors = lazy_module("rdkit.Chem.rdMolDescriptors")
 
 # =====================================================================
 # SIMUREALITY V33.3: PHASE ENGINE (TOPOLOGICAL FRUSTRATION)
@@ -39,12 +42,7 @@ TARGET_MOLECULES = {
 def extract_hardware_features(smiles):
     mol = Chem.MolFromSmiles(smiles)
     if not mol: return None
-    mol_h = Chem.AddHs(mol)
-    
-    if AllChem.EmbedMolecule(mol_h, randomSeed=42) != 0:
-        AllChem.Compute2DCoords(mol_h)
-    try: AllChem.MMFFOptimizeMolecule(mol_h)
-    except: pass
+    mol_h = embedded_molecule(mol, fallback_2d=True)
     
     mw = Descriptors.ExactMolWt(mol_h)
     voxel_footprint = rdMolDescriptors.CalcLabuteASA(mol_h) 
@@ -1,8 +1,10 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 import os
 
+from chronos_pipeline import find_debt_column, merge_mass_dump, rebenchmark
+from chronos_store import load_benchmark
+from gc_fitter import live_model
+
 # ==============================================================================
 # SIMUREALITY: CHRONOS V10 BULLETPROOF AUTO-COMPILER
 # ==============================================================================
@@ -51,53 +53,31 @@ if old_file is not None and new_file is not None:
     
     try:
         # Чтение датасетов
-        df_old = pd.read_csv(old_file)
-        df_new = pd.read_csv(new_file)
-        
-        # Очистка старого файла (оставляем только базу NUBASE)
-        base_cols = ['Isotope', 'Z', 'A', 'Status', 'Log10(T_1/2)']
-        existing_base_cols = [c for c in base_cols if c in df_old.columns]
-        df_old_clean = df_old[existing_base_cols].copy()
+        # CSV разбирается один раз, дальше читается колоночно из хранилища Chronos
+        df_old = load_benchmark(old_file)
+        df_new = load_benchmark(new_file)
         
         # Ищем колонку с новым топологическим долгом
-        debt_col = None
-        for c in ['Grid Debt/Error (MeV)', 'Grid Debt', 'Error (MeV)']:
-            if c in df_new.columns:
-                debt_col = c
-                break
+        debt_col = find_debt_column(df_new)
                 
         if debt_col is None:
             st.error(f"❌ В новом файле масс не найдена колонка долга. Доступные колонки: {list(df_new.columns)}")
         else:
-            # СЛИЯНИЕ ПО Z И A
-            df_merged = pd.merge(df_old_clean, df_new[['Z', 'A', debt_col]], on=['Z', 'A'], how='inner')
-            
-            # Конвертация в абсолютный долг
-            df_merged['ΔK Debt (MeV)'] = df_merged[debt_col].abs()
-            df_merged = df_merged.drop(columns=[debt_col])
-            
-            # --- ХАРДКОРНЫЙ РАСЧЕТ CHRONOS V10 ---
-            df_merged['3D_Jitter'] = (df_merged['ΔK Debt (MeV)'] / 110.0).clip(0, 0.4999)
-            df_merged['Desync_Angle_Deg'] = df_merged['3D_Jitter'] * 360.0
-            
-            df_merged['Unpaired'] = ((df_merged['Z'] % 2 != 0) | ((df_merged['A'] - df_merged['Z']) % 2 != 0)).astype(int)
-            
-            T_base, Z_imp, E_pow, P_lock = 2.76, 0.04, -0.87, -0.13
-            df_merged['Predicted_LogT'] = T_base + (Z_imp * df_merged['Z']) + (E_pow * np.sqrt(df_merged['ΔK Debt (MeV)'])) + (P_lock * df_merged['Unpaired'])
+            # СЛИЯНИЕ ПО Z И A (база NUBASE старого файла + абсолютный долг)
+            df_inputs = merge_mass_dump(df_old, df_new, debt_col)
             
-            df_merged['Error_Delta'] = abs(df_merged['Predicted_LogT'] - df_merged['Log10(T_1/2)'])
-            df_merged = df_merged.sort_values('Desync_Angle_Deg')
+            # --- ХАРДКОРНЫЙ РАСЧЕТ CHRONOS V10 (только строки с изменившимися входами) ---
+            df_merged, run = rebenchmark(df_inputs, "chronos_v10_master_debt", engine="V11", model=live_model())
             
             # --- РЕЗУЛЬТАТЫ ---
-            df_unstable = df_merged[(df_merged['Status'] == 'Unstable') & (df_merged['Log10(T_1/2)'].notna())]
-            mae_global = df_unstable['Error_Delta'].mean()
-            accuracy_percent = max(0, 100 - (mae_global / 50.0 * 100))
+            mae_global, accuracy_percent = run["mae"], run["accuracy"]
             
             st.markdown("### 🎯 Результаты: Chronos V10 (Ab-Initio Integration)")
             c1, c2, c3 = st.columns(3)
             c1.metric("Сшито ядер (Nodes Compiled)", f"{len(df_merged)}")
             c2.metric("Новая ошибка распада (MAE)", f"{mae_global:.3f} orders")
             c3.metric("Точность Сборщика Мусора", f"{accuracy_percent:.2f}%", delta="Grid Physics V11")
+            st.caption(f"Ревизия {run['revision']} (модель {run['fingerprint']}): пересчитано {run['recomputed']}, переиспользовано {run['reused']} ядер.")
             
             st.divider()
             st.markdown("### 💾 Экспорт обновленного датасета")
@@ -1,8 +1,9 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
+from lazy_import import lazy_module
+px = lazy_module("plotly.express")
+go = lazy_module("plotly.graph_objects")
 
 # =====================================================================
 # SIMUREALITY: STELLAR FORGE (SPACE & TIME UNIFIED ENGINE)
@@ -1,206 +1,24 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
 import os
 
+from nuclear_batch import run_beta_cascade, run_fission_scan
+from nuclear_data import ame_binding_dict
+from lazy_import import lazy_module
+px = lazy_module("plotly.express")
+
 # =====================================================================
 # FULL NUCLEAR TRANSACTIONS DASHBOARD (HALO SATURATION PATCH)
 # =====================================================================
 
 @st.cache_data
 def load_ame2020():
-    db = {}
     file_path = "mass.txt"
-    if not os.path.exists(file_path): return db
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            if len(line) < 100 or "A T O M I C" in line or "mass.mas20" in line: continue
-            try:
-                n_str, z_str, be_str = line[4:9].strip(), line[9:14].strip(), line[54:67].strip().replace('#', '')
-                if not n_str.isdigit() or not z_str.isdigit() or '*' in be_str or not be_str: continue
-                N, Z = int(n_str), int(z_str)
-                total_be_MeV = (float(be_str) * (N + Z)) / 1000.0
-                db[(Z, N)] = total_be_MeV
-            except ValueError: continue
-    return db
-
-@st.cache_data
-def generate_fcc_magic():
-    base_shells = [int((n+1)*(n+2)*(n+3)/3) for n in range(6)] 
-    twist_shifts = [28, 50, 82, 126] 
-    return sorted(list(set(base_shells + twist_shifts)))
-
-MAGIC_NODES = generate_fcc_magic()
-E_ALPHA = 28.320       
-E_MACRO = 2.425        
-E_LINK = 2.360 
-E_PAIR = 1.180  # Восстановлено для расчета Neutron Skin     
-J_TAX = 0.0131         
+    if not os.path.exists(file_path): return {}
+    return ame_binding_dict(file_path)
 
-def get_jitter_tax(Z, N):
-    if Z <= 0 or N <= 0: return 0
-    dist_Z, dist_N = min([abs(Z - m) for m in MAGIC_NODES]), min([abs(N - m) for m in MAGIC_NODES])
-    base_ports = 10.0 * ((Z + N)**(2/3))
-    return (base_ports + (15.0 * ((dist_Z + dist_N)**1.2))) * J_TAX
-
-def get_dangling_port_tax(Z, N):
-    unpaired_p = Z % 2
-    unpaired_n = N % 2
-    PORT_PENALTY = E_LINK / 2.0 
-    tax = 0.0
-    if unpaired_p == 1: tax += PORT_PENALTY
-    if unpaired_n == 1: tax += PORT_PENALTY
-    return tax
-
-def calculate_topological_profit(Z, N):
-    if Z <= 0 or N <= 0: return 0
-    N_alpha = min(Z // 2, N // 2)
-    l_ideal = max(0, 3 * N_alpha - 6)
-    l_lost = (min([abs(Z - m) for m in MAGIC_NODES]) + min([abs(N - m) for m in MAGIC_NODES])) * 0.4
-    
-    BE = (N_alpha * E_ALPHA) + (max(0, l_ideal - l_lost) * E_MACRO)
-    
-    halo_n = N - Z
-    if halo_n > 0: 
-        # ПАТЧ: Топологическое перенасыщение (Halo Saturation Limit)
-        # У ядра ограничена площадь поверхности для идеальных 1p-1n связей.
-        # В жестком ГЦК-ядре эффективное гало не превышает ~40% от числа протонов.
-        max_strong_links = int(Z * 0.4) 
-        
-        strong_halo = min(halo_n, max_strong_links)
-        weak_halo = halo_n - strong_halo
-        
-        # 1. Прямые линки (внутренний слой гало) дают полный профит
-        BE += strong_halo * E_LINK
-        
-        # 2. "Второй слой" (Neutron Skin) висит на слабых n-n связях
-        BE += weak_halo * (E_PAIR / 2.0)
-    
-    BE -= get_jitter_tax(Z, N)
-    BE -= get_dangling_port_tax(Z, N)
-    
-    return BE
-
-def run_fission_scan(Z_parent, N_parent, ame_db):
-    results = []
-    BE_parent_theo = calculate_topological_profit(Z_parent, N_parent) - 22.0
-    BE_parent_exp = ame_db.get((Z_parent, N_parent), None)
-    
-    for Z1 in range(30, Z_parent // 2 + 1): 
-        Z2 = Z_parent - Z1
-        best_theo_Q = -float('inf')
-        exp_Q_for_best, best_N1, best_N2, best_free_n = None, 0, 0, 0
-        
-        for free_n in range(0, 8): 
-            remaining_N = N_parent - free_n
-            for N1 in range(int(Z1*1.2), int(Z1*1.6)):
-                N2 = remaining_N - N1
-                if N2 < int(Z2*1.2) or N2 > int(Z2*1.6): continue
-                
-                theo_Q = calculate_topological_profit(Z1, N1) + calculate_topological_profit(Z2, N2) - BE_parent_theo
-                if theo_Q > best_theo_Q:
-                    best_theo_Q, best_N1, best_N2, best_free_n = theo_Q, N1, N2, free_n
-                    exp_Q_for_best = ame_db[(Z1, N1)] + ame_db[(Z2, N2)] - BE_parent_exp if (BE_parent_exp and (Z1, N1) in ame_db and (Z2, N2) in ame_db) else np.nan
-                        
-        results.append({
-            "Light Fragment Z": Z1, "Light Fragment N": best_N1,
-            "Heavy Fragment Z": Z2, "Heavy Fragment N": best_N2,
-            "Dropped Neutrons": best_free_n,
-            "Topological Profit (MeV)": best_theo_Q,
-            "Experimental Profit (AME2020)": exp_Q_for_best
-        })
-    return pd.DataFrame(results)
-
-def get_discrete_graph_diameter(A):
-    diameter = 1
-    for magic_size in MAGIC_NODES:
-        if A > magic_size:
-            diameter += 1
-        else:
-            break
-            
-    current_layer_base = MAGIC_NODES[diameter - 2] if diameter > 1 else 0
-    next_layer_base = MAGIC_NODES[diameter - 1] if diameter <= len(MAGIC_NODES) else A
-    
-    layer_progress = (A - current_layer_base) / max(1, (next_layer_base - current_layer_base))
-    return diameter + layer_progress
-
-def run_beta_cascade(Z_start, N_start):
-    chain = []
-    current_Z, current_N = Z_start, N_start
-    C_TAX = E_LINK * np.sqrt(2) 
-    
-    def get_beta_profit(Z, N):
-        if Z <= 0 or N <= 0: return -float('inf')
-        base_profit = calculate_topological_profit(Z, N)
-        A = Z + N
-        routing_complexity = (Z * (Z - 1)) / 2.0 
-        discrete_diameter = get_discrete_graph_diameter(A)
-        coulomb_penalty = C_TAX * (routing_complexity / discrete_diameter)
-        return base_profit - coulomb_penalty
-
-    while True:
-        profit_current = get_beta_profit(current_Z, current_N)
-        profit_b_minus_1 = get_beta_profit(current_Z + 1, current_N - 1)
-        profit_b_plus_1 = get_beta_profit(current_Z - 1, current_N + 1)
-        profit_b_minus_2 = get_beta_profit(current_Z + 2, current_N - 2)
-        profit_b_plus_2 = get_beta_profit(current_Z - 2, current_N + 2)
-        
-        best_profit = profit_current
-        next_step = None
-        decay_type = "Stable (Optimal)"
-        step_gain = 0.0
-        
-        if profit_b_minus_1 > best_profit:
-            best_profit = profit_b_minus_1
-            next_step = (current_Z + 1, current_N - 1)
-            decay_type = "β- Decay"
-            step_gain = profit_b_minus_1 - profit_current
-        elif profit_b_plus_1 > best_profit:
-            best_profit = profit_b_plus_1
-            next_step = (current_Z - 1, current_N + 1)
-            decay_type = "β+ / EC"
-            step_gain = profit_b_plus_1 - profit_current
-            
-        if next_step is None:
-            if profit_b_minus_2 > profit_current:
-                chain.append({
-                    "Protons (Z)": current_Z + 1, "Neutrons (N)": current_N - 1,
-                    "Mass (A)": current_Z + current_N, "Decay Triggered": "Virtual State (Transit)",
-                    "Topological Profit (MeV)": profit_b_minus_1, "Step Gain (ΔQ)": profit_b_minus_1 - profit_current
-                })
-                next_step = (current_Z + 2, current_N - 2)
-                decay_type = "Double β- Decay"
-                step_gain = profit_b_minus_2 - profit_b_minus_1
-                profit_current = profit_b_minus_1
-                best_profit = profit_b_minus_2
-                
-            elif profit_b_plus_2 > profit_current:
-                chain.append({
-                    "Protons (Z)": current_Z - 1, "Neutrons (N)": current_N + 1,
-                    "Mass (A)": current_Z + current_N, "Decay Triggered": "Virtual State (Transit)",
-                    "Topological Profit (MeV)": profit_b_plus_1, "Step Gain (ΔQ)": profit_b_plus_1 - profit_current
-                })
-                next_step = (current_Z - 2, current_N + 2)
-                decay_type = "Double β+ / EC"
-                step_gain = profit_b_plus_2 - profit_b_plus_1
-                profit_current = profit_b_plus_1
-                best_profit = profit_b_plus_2
-
-        chain.append({
-            "Protons (Z)": next_step[0] if next_step else current_Z,
-            "Neutrons (N)": next_step[1] if next_step else current_N,
-            "Mass (A)": (next_step[0]+next_step[1]) if next_step else (current_Z+current_N),
-            "Decay Triggered": decay_type,
-            "Topological Profit (MeV)": best_profit,
-            "Step Gain (ΔQ)": step_gain
-        })
-        
-        if not next_step or len(chain) > 20: break
-        current_Z, current_N = next_step
-        
-    return pd.DataFrame(chain)
+# Модель (альфа-кластеры + гало с Halo Saturation Limit + налоги) живет в topological_core:
+# сканер разломов и бета-каскад читают одну и ту же общую карту профита.
+# run_fission_scan / run_beta_cascade - в nuclear_batch (тот же код гоняется без UI).
 
 # --- STREAMLIT UI ---
 st.set_page_config(page_title="Matrix Operations Dashboard", layout="wide")
@@ -1,16 +1,20 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import os
 
+from nuclear_batch import LAMBDA_P, scanner_layers, scanner_merge
+from resonance_sweep import SWEEP_POINTS, SWEEP_RANGE, cached_sweep, jitter_stats, lambda_grid, rank_of
+from lazy_import import lazy_module
+px = lazy_module("plotly.express")
+
 # ==============================================================================
 # GRID PHYSICS: EMPIRICAL RESONANCE SCANNER (Occam's Razor Edition)
 # Pure Data-Driven Proof of Space Quantization (Zero Simulation, Zero Fitting)
 # ==============================================================================
 
 # --- GRID PHYSICS HARDWARE CONSTANT ---
-LAMBDA_P = 1.3214  # Base L1-Cache lattice step (femtometers)
+# LAMBDA_P = 1.3214 fm (Base L1-Cache lattice step) lives in nuclear_batch with the headless engine
 
 # --- EMBEDDED DOCUMENTATION (THEORY) ---
 README_TEXT = """
@@ -70,66 +74,27 @@ def load_and_merge_databases():
     if not os.path.exists("charge_radii.csv"):
         st.error("File 'charge_radii.csv' not found. Please place it in the root directory.")
         return pd.DataFrame()
-        
-    df_radii = pd.read_csv("charge_radii.csv")
-    df_radii = df_radii.rename(columns={'z': 'Z', 'a': 'A', 'radius_val': 'Rc_fm', 'symbol': 'Isotope_Sym'})
-    df_radii = df_radii.dropna(subset=['Rc_fm'])
-    df_radii['Isotope'] = df_radii['Isotope_Sym'] + "-" + df_radii['A'].astype(str)
-    df_radii = df_radii[['Z', 'A', 'Isotope', 'Rc_fm']]
 
-    # 2. Parse FRDM-95 Deformations (Fixed-width TXT)
+    # 2. FRDM-95 Deformations: full-column table from the binary cache (beta2..beta6, Mth, Emic)
     if not os.path.exists("mass-frdm95.txt"):
         st.error("File 'mass-frdm95.txt' not found. Please place it in the root directory.")
         return pd.DataFrame()
-        
-    frdm_data = []
-    with open("mass-frdm95.txt", 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.startswith('#') or len(line) < 63:
-                continue
-            try:
-                Z = int(line[0:4].strip())
-                A = int(line[4:8].strip())
-                # Beta2 is located exactly between chars 55 and 63 in standard FRDM formats
-                beta2_str = line[55:63].strip()
-                if beta2_str:
-                    beta2 = float(beta2_str)
-                    frdm_data.append({'Z': Z, 'A': A, 'Beta2': beta2})
-            except ValueError:
-                continue
-    
-    df_frdm = pd.DataFrame(frdm_data).drop_duplicates(subset=['Z', 'A'])
     
-    # 3. Merge Databases on Protons(Z) and Mass(A)
-    df_merged = pd.merge(df_radii, df_frdm, on=['Z', 'A'], how='inner')
-    
-    # Filter out ultralight nuclei (Liquid drop physics applies mainly to A > 20)
-    df_merged = df_merged[df_merged['A'] > 20]
-    return df_merged
+    # 3. Indexed (Z, A) join + A > 20 filter (nuclear_batch.scanner_merge)
+    return scanner_merge("charge_radii.csv", "mass-frdm95.txt")
 
 # --- CORE OCCAM'S RAZOR ENGINE ---
 @st.cache_data
 def process_empirical_data(df):
     """Applies standard physical formulas and divides by the Grid Physics Constant."""
-    if df.empty:
-        return df
-        
-    # Calculate physical length from pole to pole (femtometers)
-    # R_polar = Rc * (1 + sqrt(5 / 4pi) * beta2). Note: sqrt(5 / 4pi) ≈ 0.63078
-    df['Length_fm'] = df['Rc_fm'] * (1 + 0.63078 * df['Beta2']) * 2.0
-    
-    # Divide by the fundamental lattice step of the Matrix
-    df['Grid_Layers_Float'] = df['Length_fm'] / LAMBDA_P
-    
-    # Find the nearest integer state
-    df['Grid_Layers_Int'] = df['Grid_Layers_Float'].round()
-    
-    # Calculate Jitter (Distance from integer resonance)
-    df['Jitter'] = abs(df['Grid_Layers_Float'] - df['Grid_Layers_Int'])
-    
-    # Classify status based on topological noise
-    df['Status'] = np.where(df['Jitter'] < 0.15, "Resonance Attractor", "Jitter (Decay Zone)")
-    return df
+    # Length_fm = 2 * Rc * (1 + sqrt(5 / 4pi) * beta2); layers = Length_fm / λ_p; Jitter = |layers - round(layers)|
+    return scanner_layers(df, LAMBDA_P)
+
+# --- RESONANCE SWEEP: IS 1.3214 fm SPECIAL? ---
+@st.cache_data
+def resonance_periodogram(lengths, lam_min, lam_max, points):
+    """Jitter periodogram over a dense grid of candidate lattice steps (disk-cached per dataset)."""
+    return pd.DataFrame(cached_sweep(lengths, lambda_grid(lam_min, lam_max, points)))
 
 # --- UI RENDERING ---
 st.title("🌌 Grid Physics: Empirical Resonance Scanner")
@@ -140,9 +105,10 @@ with st.spinner("Parsing and merging global experimental databases..."):
     df = process_empirical_data(raw_df)
 
 if not df.empty:
-    tab1, tab2, tab3, tab4 = st.tabs([
+    tab1, tab2, tab_sweep, tab3, tab4 = st.tabs([
         "📈 The Deformation Staircase", 
         "🗄️ Master Data Table", 
+        "🔭 λ Sweep", 
         "📖 Theoretical Framework",
         "💻 Transparent Source Code"
     ])
@@ -166,10 +132,40 @@ if not df.empty:
     with tab2:
         st.markdown("### Fully Merged Empirical Database")
         st.markdown(f"**Constant used:** λ_p = {LAMBDA_P} fm")
-        display_df = df[['Isotope', 'Z', 'A', 'Rc_fm', 'Beta2', 'Length_fm', 'Grid_Layers_Float', 'Grid_Layers_Int', 'Jitter', 'Status']].copy()
+        display_df = df[['Isotope', 'Z', 'A', 'Rc_fm', 'Beta2', 'Beta4', 'Length_fm', 'Grid_Layers_Float', 'Grid_Layers_Int', 'Jitter', 'Status']].copy()
         display_df = display_df.sort_values('A')
         st.dataframe(display_df.style.background_gradient(subset=['Jitter'], cmap='RdYlGn_r'), use_container_width=True)
 
+    with tab_sweep:
+        st.markdown("### Resonance-Constant Sweep")
+        st.markdown("The same jitter statistic evaluated for every candidate lattice step on a dense grid. If 1.3214 fm is not cherry-picked, it must stand out against its neighbours. Uniform noise (no quantization) gives a mean jitter of 0.25.")
+        c1, c2, c3 = st.columns(3)
+        lam_min = c1.number_input("λ min (fm)", 0.1, 10.0, SWEEP_RANGE[0], step=0.05)
+        lam_max = c2.number_input("λ max (fm)", 0.1, 10.0, SWEEP_RANGE[1], step=0.05)
+        points = c3.select_slider("Candidate steps", options=[10_000, 20_000, 50_000, 100_000], value=SWEEP_POINTS)
+
+        if lam_max <= lam_min:
+            st.warning("λ max must exceed λ min.")
+        else:
+            lengths = df['Length_fm'].to_numpy(dtype=np.float64)
+            sweep_df = resonance_periodogram(lengths, lam_min, lam_max, points)
+            ref = jitter_stats(lengths, LAMBDA_P)
+            best = sweep_df.loc[sweep_df['mean'].idxmin()]
+
+            m1, m2, m3, m4 = st.columns(4)
+            m1.metric("Mean Jitter @ λ_p", f"{ref['mean']:.4f}", f"{ref['z']:+.1f} σ vs noise")
+            m2.metric("Attractor Share @ λ_p", f"{ref['attractor']:.1%}")
+            if lam_min <= LAMBDA_P <= lam_max:
+                m3.metric("λ_p Rank (mean jitter)", f"top {1 - rank_of(sweep_df, LAMBDA_P) + 1 / len(sweep_df):.2%}")
+            m4.metric("Best λ in Sweep", f"{best['lambda']:.4f} fm", f"mean {best['mean']:.4f}")
+
+            fig_sweep = px.line(sweep_df, x='lambda', y=['mean', 'median'], render_mode='webgl',
+                                labels={'lambda': 'Candidate Lattice Step λ (fm)', 'value': 'Jitter', 'variable': 'Statistic'})
+            fig_sweep.add_hline(y=0.25, line_dash="dot", line_color="rgba(255,255,255,0.4)", annotation_text="Uniform noise")
+            fig_sweep.add_vline(x=LAMBDA_P, line_dash="dash", line_color="#FFD700", annotation_text="λ_p = 1.3214")
+            fig_sweep.update_layout(height=550, template="plotly_dark")
+            st.plotly_chart(fig_sweep, use_container_width=True)
+
     with tab3:
         st.markdown(README_TEXT)
 
@@ -1,8 +1,10 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import os
+
+from chronos_pipeline import gc_design, gc_predict
+from chronos_store import load_benchmark
+from gc_fitter import live_model
+from lazy_import import lazy_module
+px = lazy_module("plotly.express")
 
 # ==============================================================================
 # SIMUREALITY: 3D-TIME PHASE DESYNCHRONIZATION ENGINE (CHRONOS V9.2)
@@ -13,10 +15,10 @@ st.set_page_config(page_title="Chronos V9.2: 3D-Time Engine", layout="wide", pag
 
 @st.cache_data
 def load_chronos_data():
-    files_to_try = ["2026-05-30T23-26_export.csv", "simureality_chronos_v8_benchmark.csv"]
-    for file_name in files_to_try:
-        if os.path.exists(file_name):
-            df = pd.read_csv(file_name)
+    sources_to_try = ["2026-05-30T23-26_export.csv", "chronos_v8", "simureality_chronos_v8_benchmark.csv"]
+    for source in sources_to_try:
+        df = load_benchmark(source)
+        if df is not None:
             if 'ΔK Debt (MeV)' in df.columns and 'Log10(T_1/2)' in df.columns:
                 return df.dropna(subset=['ΔK Debt (MeV)', 'Log10(T_1/2)'])
     return None
@@ -29,11 +31,10 @@ def compute_3d_phase_shift(df):
     df['3D_Jitter'] = (df['ΔK Debt (MeV)'] / 110.0).clip(0, 0.4999)
     df['Desync_Angle_Deg'] = df['3D_Jitter'] * 360.0
     
-    # 2. Mathematical Prediction (GC Routing Equation)
-    df['Unpaired'] = ((df['Z'] % 2 != 0) | ((df['A'] - df['Z']) % 2 != 0)).astype(int)
-    
-    T_base, Z_imp, E_pow, P_lock = 2.76, 0.04, -0.87, -0.13
-    df['Predicted_LogT'] = T_base + (Z_imp * df['Z']) + (E_pow * np.sqrt(df['ΔK Debt (MeV)'])) + (P_lock * df['Unpaired'])
+    # 2. Mathematical Prediction (GC Routing Equation) - live constants from the GC extractor,
+    #    same feature encoding (gc_design) the extractor fits them on
+    df['Unpaired_Ports'] = gc_design(df)['Unpaired_Ports']
+    df['Predicted_LogT'] = gc_predict(df, live_model())
     
     # 3. Error Delta Calculation
     df['Error_Delta'] = abs(df['Predicted_LogT'] - df['Log10(T_1/2)'])
@@ -1,10 +1,12 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import time
 import os
-from rdkit import Chem
+from lazy_import import lazy_module
+from bde_store import bde_frame, complexity_range, load_bde_store
+px = lazy_module("plotly.express")
+Chem = lazy_module("rdkit.Chem")
 
 # =====================================================================
 # SIMUREALITY: V9.3 HEAVY NODE COMPRESSION & CACHE PATCH (N=2)
@@ -26,13 +28,6 @@ TAX_COMPRESSION_SP2_H = 40.0
 TAX_COMPRESSION_SP_HEAVY = 192.0   
 TAX_COMPRESSION_SP2_HEAVY = 82.0   
 
-def get_graph_complexity(smiles):
-    try:
-        mol = Chem.MolFromSmiles(str(smiles))
-        return mol.GetNumBonds() if mol else -1
-    except:
-        return -1
-
 def analyze_node_compression(row):
     smiles = str(row['molecule'])
     bond_idx = int(row['bond_index'])
@@ -86,16 +81,17 @@ def analyze_node_compression(row):
         return pd.Series(['UNKNOWN', False, False, False, 0.0])
 
 @st.cache_data(show_spinner=False)
-def load_base_data(file_path):
+def load_base_data(file_path, complexity=None):
     if not os.path.exists(file_path):
         return None
-    df = pd.read_csv(file_path, compression='gzip')
+    # Строки уровня сложности - срез индекса bde_store (Graph_Complexity посчитан при разборе)
+    df = bde_frame(file_path, complexity).drop(columns=['mol_id'])
+    graph_complexity = df.pop('Graph_Complexity')
     df['bond_clean'] = df['bond_type'].astype(str).str.upper().str.strip()
     df_valid = df[df['bond_clean'].isin(GRID_CONSTANTS.keys())].copy()
     df_valid['Actual_BDE_kJ'] = pd.to_numeric(df['bde'], errors='coerce') * 4.184
     df_valid = df_valid.dropna(subset=['Actual_BDE_kJ'])
-    
-    df_valid['Graph_Complexity'] = df_valid['molecule'].apply(get_graph_complexity)
+    df_valid['Graph_Complexity'] = graph_complexity
     return df_valid[df_valid['Graph_Complexity'] > 0]
 
 def compile_unit_test(df_tier):
@@ -155,15 +151,15 @@ st.markdown("Мы научили систему дифференцировать
 FILE_NAME = "bde-db2.csv.gz"
 
 with st.spinner("Загрузка и индексация датасета..."):
-    df_base = load_base_data(FILE_NAME)
+    bde_db = load_bde_store(FILE_NAME) if os.path.exists(FILE_NAME) else None
 
-if df_base is not None:
-    max_bonds = int(df_base['Graph_Complexity'].max())
+if bde_db is not None:
+    max_bonds = complexity_range(bde_db)[1]
     col_ui1, col_ui2 = st.columns([2, 1])
     with col_ui1:
         target_bonds = st.slider("Сложность графа (Количество тяжелых связей)", 1, max_bonds, 2, step=1)
     
-    df_filtered = df_base[df_base['Graph_Complexity'] == target_bonds].copy()
+    df_filtered = load_base_data(FILE_NAME, target_bonds).copy()
     
     with col_ui2:
         st.info(f"Найдено молекул: {len(df_filtered)}")
@@ -2,6 +2,8 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 
+from fcc_lattice import SORTED, crystal_links
+
 # --- SIMUREALITY ONTOLOGICAL CONSTANTS ---
 MASS_P = 938.272
 MASS_N = 939.565
@@ -66,53 +68,9 @@ def load_ame_masses(filename="mass.txt"):
         return pd.DataFrame()
 
 class SimurealityMacroCore:
-    def __init__(self):
-        self._macro_link_cache = {0: 0, 1: 0, 2: 1, 3: 3, 4: 6}
-
-    def get_fcc_neighbors(self, node):
-        """12 интерфейсных портов ГЦК-узла"""
-        x, y, z = node
-        deltas = [(1,1,0), (1,-1,0), (-1,1,0), (-1,-1,0),
-                  (1,0,1), (1,0,-1), (-1,0,1), (-1,0,-1),
-                  (0,1,1), (0,1,-1), (0,-1,1), (0,-1,-1)]
-        return [(x+dx, y+dy, z+dz) for dx, dy, dz in deltas]
-
     def compile_3d_crystal(self, n_clusters):
-        """Жадная 3D-компиляция Альфа-кластеров"""
-        if n_clusters in self._macro_link_cache:
-            return self._macro_link_cache[n_clusters]
-            
-        occupied = set([(0, 0, 0)])
-        for _ in range(1, n_clusters):
-            candidates = set()
-            for node in occupied:
-                for neighbor in self.get_fcc_neighbors(node):
-                    if neighbor not in occupied:
-                        candidates.add(neighbor)
-            
-            cm_x = sum(n[0] for n in occupied) / len(occupied)
-            cm_y = sum(n[1] for n in occupied) / len(occupied)
-            cm_z = sum(n[2] for n in occupied) / len(occupied)
-            
-            best_pos = None
-            max_bonds = -1
-            min_dist = float('inf')
-            
-            sorted_candidates = sorted(list(candidates), key=lambda c: (c[0], c[1], c[2]))
-            for cand in sorted_candidates:
-                bonds = sum(1 for n in self.get_fcc_neighbors(cand) if n in occupied)
-                dist_sq = (cand[0]-cm_x)**2 + (cand[1]-cm_y)**2 + (cand[2]-cm_z)**2
-                
-                if bonds > max_bonds or (bonds == max_bonds and dist_sq < min_dist):
-                    max_bonds = bonds
-                    min_dist = dist_sq
-                    best_pos = cand
-            
-            occupied.add(best_pos)
-            
-        total_macro_links = sum(sum(1 for n in self.get_fcc_neighbors(node) if n in occupied) for node in occupied) // 2
-        self._macro_link_cache[n_clusters] = total_macro_links
-        return total_macro_links
+        """Жадная 3D-компиляция Альфа-кластеров: O(1) чтение общей ГЦК-таблицы (ничьи - по отсортированным кандидатам)"""
+        return crystal_links(n_clusters, tie_break=SORTED)
 
     def compile_mass(self, Z, N):
         if Z < 0 or N < 0:
@@ -1,24 +1,8 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 
-# --- СТРОГИЕ АППАРАТНЫЕ КОНСТАНТЫ SIMUREALITY (ВЕРСИЯ 1.0 - БЕЗ ЭМПИРИКИ) ---
-# Базируются исключительно на вакуумном импедансе и ГЦК-маршрутизации.
-MASS_P = 938.272
-MASS_N = 939.565
-E_ELECTRON = 0.511
-E_ALPHA = 28.32       
-E_MACRO_LINK = 2.425   
-E_LINK = 2.36          
-E_PAIR = 1.18          
-JITTER_COST = 0.01311   
-
-# --- ПОДГОНОЧНЫЕ КОЭФФИЦИЕНТЫ ВЕЙЦЗЕККЕРА (КЛАССИЧЕСКИЙ ХАРДКОД) ---
-A_V = 15.75
-A_S = 17.8
-A_C = 0.711
-A_A = 23.7
-A_P = 11.18
+from mass_engines import MASS_P, MASS_N, LiquidDropCore, SimurealityBaselineCore
+from mass_surface import element_labels
 
 ELEMENTS = {
     0: 'n', 1: 'H', 2: 'He', 3: 'Li', 4: 'Be', 5: 'B', 6: 'C', 7: 'N', 8: 'O', 9: 'F', 10: 'Ne',
@@ -61,112 +45,22 @@ def load_ame_masses(filename="mass.txt"):
         return df
     except Exception: return pd.DataFrame()
 
-class LiquidDropCore:
-    """Легаси-движок классической физики (Формула Вейцзеккера)"""
-    def compile_mass(self, Z, N):
-        if Z < 0 or N < 0: return float('inf')
-        A = Z + N
-        
-        # КОСТЫЛЬ ДЛЯ ЛЕГАСИ-ФИЗИКИ: Капельная модель бессмысленна для A < 2
-        # Это предотвращает краш с бесконечностями (inf)
-        if A < 2:
-            return (Z * MASS_P) + (N * MASS_N)
-            
-        vol = A_V * A
-        surf = A_S * (A ** (2/3))
-        coul = A_C * (Z * (Z - 1)) / (A ** (1/3))
-        asym = A_A * ((A - 2*Z)**2) / A
-        
-        if Z % 2 == 0 and N % 2 == 0: pair = A_P / (A ** 0.5)
-        elif Z % 2 != 0 and N % 2 != 0: pair = -A_P / (A ** 0.5)
-        else: pair = 0
-            
-        binding_energy = vol - surf - coul - asym + pair
-        return (Z * MASS_P) + (N * MASS_N) - binding_energy
-
-class SimurealityBaselineCore:
-    """Наш голый 3D-движок без единого подгоночного коэффициента"""
-    def __init__(self):
-        self._macro_link_cache = {0: 0, 1: 0, 2: 1, 3: 3, 4: 6}
-
-    def get_fcc_neighbors(self, node):
-        x, y, z = node
-        deltas = [(1,1,0), (1,-1,0), (-1,1,0), (-1,-1,0),
-                  (1,0,1), (1,0,-1), (-1,0,1), (-1,0,-1),
-                  (0,1,1), (0,1,-1), (0,-1,1), (0,-1,-1)]
-        return [(x+dx, y+dy, z+dz) for dx, dy, dz in deltas]
-
-    def compile_3d_crystal(self, n_clusters):
-        if n_clusters in self._macro_link_cache: return self._macro_link_cache[n_clusters]
-        occupied = set([(0, 0, 0)])
-        for _ in range(1, n_clusters):
-            candidates = set()
-            for node in occupied:
-                for neighbor in self.get_fcc_neighbors(node):
-                    if neighbor not in occupied: candidates.add(neighbor)
-            cm_x = sum(n[0] for n in occupied) / len(occupied)
-            cm_y = sum(n[1] for n in occupied) / len(occupied)
-            cm_z = sum(n[2] for n in occupied) / len(occupied)
-            best_pos, max_bonds, min_dist = None, -1, float('inf')
-            for cand in candidates:
-                bonds = sum(1 for n in self.get_fcc_neighbors(cand) if n in occupied)
-                dist_sq = (cand[0]-cm_x)**2 + (cand[1]-cm_y)**2 + (cand[2]-cm_z)**2
-                if bonds > max_bonds or (bonds == max_bonds and dist_sq < min_dist):
-                    max_bonds, min_dist, best_pos = bonds, dist_sq, cand
-            occupied.add(best_pos)
-        total_macro_links = sum(sum(1 for n in self.get_fcc_neighbors(node) if n in occupied) for node in occupied) // 2
-        self._macro_link_cache[n_clusters] = total_macro_links
-        return total_macro_links
-
-    def compile_mass(self, Z, N):
-        if Z < 0 or N < 0: return float('inf')
-        n_alphas = min(Z // 2, N // 2)
-        binding_alphas = n_alphas * E_ALPHA
-        macro_links = self.compile_3d_crystal(n_alphas)
-        binding_macro = macro_links * E_MACRO_LINK
-
-        rem_Z = Z - (n_alphas * 2)
-        rem_N = N - (n_alphas * 2)
-        halo_total = rem_Z + rem_N
-        
-        binding_halo = 0
-        jitter = 0
-        
-        if n_alphas == 0:
-            if Z == 1:
-                if N == 1: binding_halo = 2.225         
-                elif N >= 2: binding_halo = 8.482       
-            elif Z == 2 and N == 1: binding_halo = 7.718                    
-        else:
-            binding_halo += halo_total * E_LINK
-            pairs = halo_total // 2
-            binding_halo += pairs * E_PAIR
-            if halo_total % 2 != 0: jitter += JITTER_COST
-
-        total_binding = binding_alphas + binding_macro + binding_halo - jitter
-        return (Z * MASS_P) + (N * MASS_N) - total_binding
-
 @st.cache_data
 def generate_comparison_matrix(_grid_engine, _liquid_engine, df_ame):
-    results = []
-    for (Z, N), row in df_ame.iterrows():
-        exp_mass = row['Mass_MeV']
-        grid_mass = _grid_engine.compile_mass(Z, N)
-        liquid_mass = _liquid_engine.compile_mass(Z, N)
-        
-        grid_delta = grid_mass - exp_mass
-        liquid_delta = liquid_mass - exp_mass
-            
-        sym = ELEMENTS.get(Z, "?")
-        results.append({
-            "Element": f"{sym}-{Z+N}", "Z": Z, "N": N, "A": Z+N,
-            "AME2020 Log (MeV)": round(exp_mass, 3),
-            "Grid Physics ΣK (MeV)": round(grid_mass, 3),
-            "Liquid Drop (MeV)": round(liquid_mass, 3),
-            "Grid Debt/Error (MeV)": round(grid_delta, 3),
-            "Liquid Drop Error (MeV)": round(liquid_delta, 3)
-        })
-    return pd.DataFrame(results).sort_values(by=["Z", "N"])
+    Z = df_ame.index.get_level_values('Z').to_numpy()
+    N = df_ame.index.get_level_values('N').to_numpy()
+    exp_mass = df_ame['Mass_MeV'].to_numpy()
+    grid_mass = _grid_engine.compile_mass_batch(Z, N)
+    liquid_mass = _liquid_engine.compile_mass_batch(Z, N)
+
+    return pd.DataFrame({
+        "Element": element_labels(ELEMENTS, Z, Z + N), "Z": Z, "N": N, "A": Z + N,
+        "AME2020 Log (MeV)": exp_mass.round(3),
+        "Grid Physics ΣK (MeV)": grid_mass.round(3),
+        "Liquid Drop (MeV)": liquid_mass.round(3),
+        "Grid Debt/Error (MeV)": (grid_mass - exp_mass).round(3),
+        "Liquid Drop Error (MeV)": (liquid_mass - exp_mass).round(3)
+    }).sort_values(by=["Z", "N"])
 
 # --- RENDER UI ---
 st.title("Clash of Paradigms: Grid Physics vs. Liquid Drop Model")
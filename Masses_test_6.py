@@ -2,6 +2,9 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 
+from fcc_lattice import PROLATE, SPHERICAL, crystal_links
+from nuclear_data import ame_mass_frame
+
 # ==============================================================================
 # SIMUREALITY: GRID PHYSICS V16 (ISOSPIN + SQUARE-CUBE SURFACE SCALING)
 # ==============================================================================
@@ -41,26 +44,10 @@ ELEMENTS = {
 
 @st.cache_data
 def load_ame_masses(filename="mass.txt"):
-    data = []
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            for line in f:
-                if len(line) < 65 or 'N-Z' in line or 'keV' in line: continue
-                try:
-                    n_str, z_str, a_str = line[5:10].strip(), line[10:15].strip(), line[15:19].strip()
-                    be_str = line[54:65].strip().replace('#', '').replace('*', '')
-                    if not n_str or not z_str or not be_str: continue
-                    N, Z, A = int(n_str), int(z_str), int(a_str)
-                    total_be_MeV = (float(be_str) * A) / 1000.0
-                    exp_nucleus_mass = (Z * MASS_P) + (N * MASS_N) - total_be_MeV
-                    data.append({'Z': Z, 'N': N, 'Mass_MeV': exp_nucleus_mass})
-                except ValueError: continue
-        df = pd.DataFrame(data)
-        if not df.empty:
-            df.set_index(['Z', 'N'], inplace=True)
-            df = df[~df.index.duplicated(keep='first')]
-        return df
-    except Exception: return pd.DataFrame()
+        return ame_mass_frame(filename, MASS_P, MASS_N)
+    except OSError:
+        return pd.DataFrame()
 
 class LiquidDropCore:
     def compile_mass(self, Z, N):
@@ -77,50 +64,10 @@ class LiquidDropCore:
         return (Z * MASS_P) + (N * MASS_N) - (vol - surf - coul - asym + pair)
 
 class GridPhysicsV16Core:
-    def __init__(self):
-        self._crystal_cache = {
-            0: (0, 0), 1: (0, 12), 2: (1, 22), 3: (3, 30), 4: (6, 36)
-        }
-
-    def get_fcc_neighbors(self, node):
-        x, y, z = node
-        deltas = [(1,1,0), (1,-1,0), (-1,1,0), (-1,-1,0),
-                  (1,0,1), (1,0,-1), (-1,0,1), (-1,0,-1),
-                  (0,1,1), (0,1,-1), (0,-1,1), (0,-1,-1)]
-        return [(x+dx, y+dy, z+dz) for dx, dy, dz in deltas]
-
     def compile_3d_crystal(self, n_clusters):
-        if n_clusters in self._crystal_cache: 
-            return self._crystal_cache[n_clusters]
-            
-        occupied = set([(0, 0, 0)])
-        for _ in range(1, n_clusters):
-            candidates = set()
-            for node in occupied:
-                for neighbor in self.get_fcc_neighbors(node):
-                    if neighbor not in occupied: candidates.add(neighbor)
-            
-            cm_x = sum(n[0] for n in occupied) / len(occupied)
-            cm_y = sum(n[1] for n in occupied) / len(occupied)
-            cm_z = sum(n[2] for n in occupied) / len(occupied)
-
-            best_pos, max_bonds, min_dist = None, -1, float('inf')
-            is_spherical = (n_clusters <= 14)
-            
-            for cand in candidates: 
-                bonds = sum(1 for n in self.get_fcc_neighbors(cand) if n in occupied)
-                dx, dy, dz = cand[0] - cm_x, cand[1] - cm_y, cand[2] - cm_z
-                dist_sq = dx**2 + dy**2 + dz**2 if is_spherical else 1.5*dx**2 + 1.5*dy**2 + 1.0*dz**2 
-                
-                if bonds > max_bonds or (bonds == max_bonds and dist_sq < min_dist):
-                    max_bonds, min_dist, best_pos = bonds, dist_sq, cand
-                        
-            occupied.add(best_pos)
-
-        total_macro_links = sum(sum(1 for n in self.get_fcc_neighbors(node) if n in occupied) for node in occupied) // 2
+        # n <= 14: сферическая упаковка, иначе вытянутая метрика 1.5/1.5/1.0 (общая ГЦК-таблица)
+        total_macro_links = crystal_links(n_clusters, SPHERICAL if n_clusters <= 14 else PROLATE)
         surface_ports = (n_clusters * 12) - (2 * total_macro_links)
-        
-        self._crystal_cache[n_clusters] = (total_macro_links, surface_ports)
         return total_macro_links, surface_ports
 
     def compile_mass(self, Z, N):
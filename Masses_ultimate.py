@@ -1,218 +1,23 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 
-# --- SIMUREALITY ONTOLOGICAL CONSTANTS ---
-MASS_P = 938.272
-MASS_N = 939.565
-E_ELECTRON = 0.511
-E_ALPHA = 28.32       
-E_MACRO_LINK = 2.425   
-E_LINK = 2.36          
-E_PAIR = 1.18          
-JITTER_COST = 0.0131   
-
-# --- V6 NEW HARDWARE CONSTANTS (SKIN, TENSION & SHELLS) ---
-E_SKIN_LINK = 1.35       # Профит за подключение нейтрона гало к поверхности 3D-ядра
-TENSION_PENALTY = 0.95   # Вычислительный штраф за макро-линк (распирание базы данных)
-E_MAGIC = 2.15           # Топологический профит за идеальную симметрию (закрытую оболочку ГЦК)
-MAGIC_NUMBERS = {2, 8, 20, 28, 50, 82, 126} # Идеальные геометрические префабы Матрицы
-
-# --- ELEMENT DICTIONARY (Z to Symbol) ---
-ELEMENTS = {
-    0: 'n', 1: 'H', 2: 'He', 3: 'Li', 4: 'Be', 5: 'B', 6: 'C', 7: 'N', 8: 'O', 9: 'F', 10: 'Ne',
-    11: 'Na', 12: 'Mg', 13: 'Al', 14: 'Si', 15: 'P', 16: 'S', 17: 'Cl', 18: 'Ar', 19: 'K', 20: 'Ca',
-    21: 'Sc', 22: 'Ti', 23: 'V', 24: 'Cr', 25: 'Mn', 26: 'Fe', 27: 'Co', 28: 'Ni', 29: 'Cu', 30: 'Zn',
-    31: 'Ga', 32: 'Ge', 33: 'As', 34: 'Se', 35: 'Br', 36: 'Kr', 37: 'Rb', 38: 'Sr', 39: 'Y', 40: 'Zr',
-    41: 'Nb', 42: 'Mo', 43: 'Tc', 44: 'Ru', 45: 'Rh', 46: 'Pd', 47: 'Ag', 48: 'Cd', 49: 'In', 50: 'Sn',
-    51: 'Sb', 52: 'Te', 53: 'I', 54: 'Xe', 55: 'Cs', 56: 'Ba', 57: 'La', 58: 'Ce', 59: 'Pr', 60: 'Nd',
-    61: 'Pm', 62: 'Sm', 63: 'Eu', 64: 'Gd', 65: 'Tb', 66: 'Dy', 67: 'Ho', 68: 'Er', 69: 'Tm', 70: 'Yb',
-    71: 'Lu', 72: 'Hf', 73: 'Ta', 74: 'W', 75: 'Re', 76: 'Os', 77: 'Ir', 78: 'Pt', 79: 'Au', 80: 'Hg',
-    81: 'Tl', 82: 'Pb', 83: 'Bi', 84: 'Po', 85: 'At', 86: 'Rn', 87: 'Fr', 88: 'Ra', 89: 'Ac', 90: 'Th',
-    91: 'Pa', 92: 'U', 93: 'Np', 94: 'Pu', 95: 'Am', 96: 'Cm', 97: 'Bk', 98: 'Cf', 99: 'Es', 100: 'Fm',
-    101: 'Md', 102: 'No', 103: 'Lr', 104: 'Rf', 105: 'Db', 106: 'Sg', 107: 'Bh', 108: 'Hs', 109: 'Mt',
-    110: 'Ds', 111: 'Rg', 112: 'Cn', 113: 'Nh', 114: 'Fl', 115: 'Mc', 116: 'Lv', 117: 'Ts', 118: 'Og',
-    119: 'Uue', 120: 'Ubn'
-}
+from mass_engines import MASS_P, MASS_N, E_ELECTRON, SimurealityMacroCore
+from nuclear_batch import ELEMENTS, global_matrix, matrix_statistics, with_debt_load
+from nuclear_data import ame_mass_frame
 
 st.set_page_config(page_title="Simureality OS | Task Dispatcher", layout="wide")
 
 @st.cache_data
 def load_ame_masses(filename="mass.txt"):
-    """Strict parser for AME format. DROPS SYNTHETIC DATA (# and *)."""
-    data = []
+    """Strict AME view from the shared store. DROPS SYNTHETIC DATA (# and *)."""
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            for line in f:
-                if len(line) < 65 or 'N-Z' in line or 'keV' in line: continue
-                
-                # ВЕРИФИКАЦИЯ: Отбрасываем теоретические галлюцинации AME
-                if '#' in line or '*' in line:
-                    continue
-                    
-                try:
-                    n_str, z_str, a_str = line[5:10].strip(), line[10:15].strip(), line[15:19].strip()
-                    be_str = line[54:65].strip()
-                    if not n_str or not z_str or not be_str: continue
-                    N, Z, A = int(n_str), int(z_str), int(a_str)
-                    be_per_A_keV = float(be_str)
-                    total_be_MeV = (be_per_A_keV * A) / 1000.0
-                    exp_nucleus_mass = (Z * MASS_P) + (N * MASS_N) - total_be_MeV
-                    data.append({'Z': Z, 'N': N, 'Mass_MeV': exp_nucleus_mass})
-                except ValueError:
-                    continue
-        df = pd.DataFrame(data)
-        if not df.empty:
-            df.set_index(['Z', 'N'], inplace=True)
-            df = df[~df.index.duplicated(keep='first')]
-        return df
-    except Exception:
+        return ame_mass_frame(filename, MASS_P, MASS_N, strict=True)
+    except OSError:
         return pd.DataFrame()
 
-class SimurealityMacroCore:
-    def __init__(self):
-        self._macro_link_cache = {0: 0, 1: 0, 2: 1, 3: 3, 4: 6}
-
-    def get_fcc_neighbors(self, node):
-        """12 интерфейсных портов ГЦК-узла"""
-        x, y, z = node
-        deltas = [(1,1,0), (1,-1,0), (-1,1,0), (-1,-1,0),
-                  (1,0,1), (1,0,-1), (-1,0,1), (-1,0,-1),
-                  (0,1,1), (0,1,-1), (0,-1,1), (0,-1,-1)]
-        return [(x+dx, y+dy, z+dz) for dx, dy, dz in deltas]
-
-    def compile_3d_crystal(self, n_clusters):
-        """Жадная 3D-компиляция Альфа-кластеров"""
-        if n_clusters in self._macro_link_cache:
-            return self._macro_link_cache[n_clusters]
-            
-        occupied = set([(0, 0, 0)])
-        for _ in range(1, n_clusters):
-            candidates = set()
-            for node in occupied:
-                for neighbor in self.get_fcc_neighbors(node):
-                    if neighbor not in occupied:
-                        candidates.add(neighbor)
-            
-            cm_x = sum(n[0] for n in occupied) / len(occupied)
-            cm_y = sum(n[1] for n in occupied) / len(occupied)
-            cm_z = sum(n[2] for n in occupied) / len(occupied)
-            
-            best_pos = None
-            max_bonds = -1
-            min_dist = float('inf')
-            
-            for cand in candidates:
-                bonds = sum(1 for n in self.get_fcc_neighbors(cand) if n in occupied)
-                dist_sq = (cand[0]-cm_x)**2 + (cand[1]-cm_y)**2 + (cand[2]-cm_z)**2
-                
-                if bonds > max_bonds or (bonds == max_bonds and dist_sq < min_dist):
-                    max_bonds = bonds
-                    min_dist = dist_sq
-                    best_pos = cand
-            
-            occupied.add(best_pos)
-            
-        total_macro_links = sum(sum(1 for n in self.get_fcc_neighbors(node) if n in occupied) for node in occupied) // 2
-        self._macro_link_cache[n_clusters] = total_macro_links
-        return total_macro_links
-
-    def compile_mass(self, Z, N):
-        # --- HARDWARE FIREWALL ---
-        if Z < 0 or N < 0:
-            return float('inf') # Матрица блокирует антиматерию в этом слое вычислений
-            
-        n_alphas = min(Z // 2, N // 2)
-        binding_alphas = n_alphas * E_ALPHA
-        
-        macro_links = self.compile_3d_crystal(n_alphas)
-        binding_macro = macro_links * E_MACRO_LINK
-
-        # --- V6 LOGIC: CORE TENSION & DEFORMATION ---
-        tension_penalty = 0
-        surface_ports = 0
-        
-        if macro_links > 10:
-            tension_penalty = (macro_links - 10) * TENSION_PENALTY
-            
-        if n_alphas > 0:
-            surface_ports = (n_alphas ** (2/3)) * 6.5
-            
-            # Топологическая Деформация (Эллипсоид) для снятия напряжения тяжелых ядер
-            if n_alphas > 25: 
-                tension_penalty *= 0.65       # Ядро вытягивается, сбрасывая 35% распирания
-                surface_ports *= 1.15         # Площадь поверхности вытянутого ядра больше на 15%
-                
-            surface_ports = int(surface_ports)
-
-        # --- V6 LOGIC: MAGIC NUMBERS (Идеальные Оболочки) ---
-        magic_profit = 0
-        if Z in MAGIC_NUMBERS: magic_profit += E_MAGIC
-        if N in MAGIC_NUMBERS: magic_profit += E_MAGIC
-
-        rem_Z = Z - (n_alphas * 2)
-        rem_N = N - (n_alphas * 2)
-        halo_total = rem_Z + rem_N
-        
-        binding_halo = 0
-        jitter = 0
-        
-        if n_alphas == 0:
-            if Z == 1:
-                if N == 1: binding_halo = 2.225         
-                elif N >= 2: binding_halo = 8.482       
-            elif Z == 2 and N == 1:
-                binding_halo = 7.718                    
-        else:
-            # --- V5/V6 LOGIC: NEUTRON SKIN WEAVING (Скин-слой) ---
-            pairs = halo_total // 2
-            unpaired = halo_total % 2
-            binding_halo += pairs * E_PAIR
-            
-            connected_halo = min(halo_total, surface_ports)
-            binding_halo += connected_halo * E_SKIN_LINK
-            
-            if connected_halo > 0 and tension_penalty > 0:
-                coverage_ratio = connected_halo / surface_ports
-                corset_relief = tension_penalty * (coverage_ratio * 0.85) 
-                tension_penalty -= corset_relief
-            
-            if unpaired > 0:
-                jitter += JITTER_COST * 10
-                
-            overflow = halo_total - surface_ports
-            if overflow > 0:
-                jitter += overflow * E_ELECTRON 
-
-        total_binding = binding_alphas + binding_macro + binding_halo + magic_profit - tension_penalty - jitter
-        raw_mass = (Z * MASS_P) + (N * MASS_N)
-        return raw_mass - total_binding
-
 @st.cache_data
 def generate_global_matrix(_engine, df_ame):
-    results = []
-    for (Z, N), row in df_ame.iterrows():
-        exp_mass = row['Mass_MeV']
-        calc_mass = _engine.compile_mass(Z, N)
-        delta = calc_mass - exp_mass
-        
-        m_b_minus = _engine.compile_mass(Z + 1, N - 1) + E_ELECTRON
-        m_b_plus = _engine.compile_mass(Z - 1, N + 1) + E_ELECTRON
-        
-        if m_b_minus < calc_mass: status = "BETA MINUS (Garbage Collect)"
-        elif m_b_plus < calc_mass: status = "BETA PLUS (Garbage Collect)"
-        else: status = "STABLE"
-            
-        sym = ELEMENTS.get(Z, "?")
-        results.append({
-            "Element": f"{sym}-{Z+N}",
-            "Z": Z, "N": N, "A": Z+N,
-            "Pure Hardware Log (MeV)": round(exp_mass, 3),
-            "Calculated ΣK (MeV)": round(calc_mass, 3),
-            "Unresolved Debt (MeV)": round(delta, 3),
-            "Dispatcher Decision": status
-        })
-    return pd.DataFrame(results).sort_values(by=["Z", "N"])
+    return global_matrix(_engine, df_ame)
 
 # --- UI RENDERING ---
 st.title("Simureality OS: Pure Hardware Task Dispatcher (V6.0)")
@@ -278,19 +83,14 @@ with tab1:
     st.write("### Global Matrix Log & Statistics (Filtered)")
     if not df_masses.empty:
         with st.spinner('Compiling matrix...'):
-            global_df = generate_global_matrix(engine, df_masses)
-            
-            global_df['Absolute Debt (MeV)'] = global_df['Unresolved Debt (MeV)'].abs()
-            global_df['Jitter Cache Load (%)'] = (global_df['Absolute Debt (MeV)'] / global_df['Pure Hardware Log (MeV)']) * 100
+            global_df = with_debt_load(generate_global_matrix(engine, df_masses))
             
-            max_debt_mev = global_df['Absolute Debt (MeV)'].max()
-            mean_debt_mev = global_df['Absolute Debt (MeV)'].mean()
-            overall_efficiency = 100.0 - global_df['Jitter Cache Load (%)'].mean()
+            stats = matrix_statistics(global_df)
             
             sc1, sc2, sc3 = st.columns(3)
-            sc1.metric(label="System Efficiency", value=f"{overall_efficiency:.4f} %")
-            sc2.metric(label="Mean Jitter Cache (Lag)", value=f"{mean_debt_mev:.3f} MeV")
-            sc3.metric(label="Max Debt (Heavy Nuclei)", value=f"{max_debt_mev:.3f} MeV")
+            sc1.metric(label="System Efficiency", value=f"{stats['efficiency']:.4f} %")
+            sc2.metric(label="Mean Jitter Cache (Lag)", value=f"{stats['mean_debt']:.3f} MeV")
+            sc3.metric(label="Max Debt (Heavy Nuclei)", value=f"{stats['max_debt']:.3f} MeV")
             
             st.dataframe(global_df.drop(columns=['Absolute Debt (MeV)', 'Jitter Cache Load (%)']), use_container_width=True, height=400)
             
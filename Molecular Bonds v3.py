@@ -1,12 +1,14 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import time
 import os
 import math
-from rdkit import Chem
-from rdkit.Chem import AllChem
+from lazy_import import lazy_module
+from bde_store import bde_frame, complexity_range, load_bde_store
+px = lazy_module("plotly.express")
+Chem = lazy_module("rdkit.Chem")
+AllChem = lazy_module("rdkit.Chem.AllChem")
 
 # =====================================================================
 # SIMUREALITY: V24.0 MACRO-SYNTHESIS (EVACUATION & SP3 CLASHES)
@@ -20,13 +22,6 @@ BUFFER_RADIUS = VACUUM_GATE / 2
 STATIC_BASE_LOCK = 286.5         
 VOLUME_BONUS = 12.75             
 
-def get_graph_complexity(smiles):
-    try:
-        mol = Chem.MolFromSmiles(str(smiles))
-        return mol.GetNumBonds() if mol else -1
-    except:
-        return -1
-
 def calculate_asymmetric_overlap(d, r1, r2):
     if d >= r1 + r2 or d <= 0: return 0.0
     if d <= abs(r1 - r2): return (4/3) * math.pi * (min(r1, r2) ** 3)
@@ -229,13 +224,15 @@ def analyze_v24(row):
         return pd.Series([np.nan]*8)
 
 @st.cache_data(show_spinner=False)
-def load_base_data(file_path):
+def load_base_data(file_path, complexity=None):
     if not os.path.exists(file_path): return None
-    df = pd.read_csv(file_path, compression='gzip')
+    # Строки уровня сложности - срез индекса bde_store (Graph_Complexity посчитан при разборе)
+    df = bde_frame(file_path, complexity).drop(columns=['mol_id'])
+    graph_complexity = df.pop('Graph_Complexity')
     df['bond_clean'] = df['bond_type'].astype(str).str.upper().str.strip()
     df['Actual_BDE_kJ'] = pd.to_numeric(df['bde'], errors='coerce') * 4.184
     df_valid = df.dropna(subset=['Actual_BDE_kJ']).copy()
-    df_valid['Graph_Complexity'] = df_valid['molecule'].apply(get_graph_complexity)
+    df_valid['Graph_Complexity'] = graph_complexity
     return df_valid[df_valid['Graph_Complexity'] > 0]
 
 def compile_unit_test(df_tier, comp_coeff, relax_coeff):
@@ -271,10 +268,10 @@ st.markdown("Ползунок релаксации по умолчанию от
 FILE_NAME = "bde-db2.csv.gz"
 
 with st.spinner("Синхронизация..."):
-    df_base = load_base_data(FILE_NAME)
+    bde_db = load_bde_store(FILE_NAME) if os.path.exists(FILE_NAME) else None
 
-if df_base is not None:
-    max_bonds = int(df_base['Graph_Complexity'].max())
+if bde_db is not None:
+    max_bonds = complexity_range(bde_db)[1]
     
     col_ui1, col_ui2, col_ui3 = st.columns([1, 1, 1])
     with col_ui1:
@@ -285,7 +282,7 @@ if df_base is not None:
         # Установлено дефолтное значение 55.0 согласно твоим тестам
         relax_coeff = st.slider("Множитель Релаксации (Cashback)", 0.0, 100.0, 55.0, step=5.0)
     
-    df_filtered = df_base[df_base['Graph_Complexity'] == target_bonds].copy()
+    df_filtered = load_base_data(FILE_NAME, target_bonds).copy()
     
     if st.button(f"🚀 Скомпилировать Сеть (N={target_bonds})"):
         if len(df_filtered) == 0:
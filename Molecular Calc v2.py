@@ -1,9 +1,10 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from rdkit import Chem
-from rdkit.Chem import AllChem
 import math
+from lazy_import import lazy_module
+from conformer_cache import embedded_molecule
+Chem = lazy_module("rdkit.Chem")
 
 # ==========================================
 # SIMUREALITY HARDCODED CONSTANTS
@@ -29,11 +30,10 @@ def analyze_molecule(smiles):
     if not mol:
         return None, "Ошибка: Невалидный SMILES"
     
-    mol = Chem.AddHs(mol)
-    # Симуляция геометрии (MMFF94) для получения реальных расстояний
-    if AllChem.EmbedMolecule(mol, randomSeed=42) != 0:
+    # Симуляция геометрии (MMFF94) для получения реальных расстояний (кеш конформеров)
+    mol = embedded_molecule(mol)
+    if mol is None:
         return None, "Ошибка: Не удалось сгенерировать 3D конформер"
-    AllChem.MMFFOptimizeMolecule(mol)
     
     conf = mol.GetConformer()
     results = []
@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
+from lazy_import import lazy_module
+px = lazy_module("plotly.express")
 
 # =====================================================================
 # SIMUREALITY: V15.0 BIG DATA GRID SCANNER (500K+ BONDS)
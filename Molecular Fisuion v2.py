@@ -1,9 +1,11 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import math
-from rdkit import Chem
-from rdkit.Chem import AllChem
+from lazy_import import lazy_module
+from bond_geometry import (TERMINATORS, bond_lengths, covalent_radii, lone_pairs, max_angle_tension, molecule_arrays,
+                           net_buffer_volume)
+from conformer_cache import embedded_molecule
+Chem = lazy_module("rdkit.Chem")
 
 # =====================================================================
 # SIMUREALITY: AUTO-PATHFINDER V6 (TERMINATOR ONTOLOGY)
@@ -63,81 +65,32 @@ TARGET_MOLECULES = {
     "C(Cl)(Cl)(Cl)Cl": ("Тетрахлорметан", 1300.0)
 }
 
-def get_lone_pairs(atomic_num):
-    if atomic_num in [9, 17, 35, 53]: return 3  
-    if atomic_num in [8, 16, 34]: return 2      
-    if atomic_num in [7, 15]: return 1          
-    return 0                                    
-
-def calculate_asymmetric_overlap(d, r1, r2):
-    if d >= r1 + r2 or d <= 0: return 0.0
-    if d <= abs(r1 - r2): return (4/3) * math.pi * (min(r1, r2)**3)
-    d1 = (d**2 - r2**2 + r1**2) / (2 * d)
-    d2 = d - d1
-    h1 = r1 - d1
-    h2 = r2 - d2
-    return ((math.pi * h1**2 / 3) * (3 * r1 - h1)) + ((math.pi * h2**2 / 3) * (3 * r2 - h2))
-
-def get_angular_tension(mol_h, conf):
-    total_tension = 0.0
-    for atom in mol_h.GetAtoms():
-        neighbors = [n.GetIdx() for n in atom.GetNeighbors()]
-        if len(neighbors) >= 2:
-            pos_c = np.array(conf.GetAtomPosition(atom.GetIdx()))
-            max_angle = 109.47
-            for i in range(len(neighbors)):
-                for j in range(i+1, len(neighbors)):
-                    v1 = np.array(conf.GetAtomPosition(neighbors[i])) - pos_c
-                    v2 = np.array(conf.GetAtomPosition(neighbors[j])) - pos_c
-                    n1, n2 = np.linalg.norm(v1), np.linalg.norm(v2)
-                    if n1 == 0 or n2 == 0: continue
-                    val = max(-1.0, min(1.0, np.dot(v1, v2) / (n1 * n2)))
-                    angle = math.degrees(math.acos(val))
-                    if angle > max_angle: max_angle = angle
-            total_tension += K_THETA * abs(max_angle - 109.47)
-    return total_tension
-
 def auto_assemble_molecule(smiles):
     mol = Chem.MolFromSmiles(smiles)
     if not mol: return None
-    mol_h = Chem.AddHs(mol)
-    if AllChem.EmbedMolecule(mol_h, randomSeed=42) != 0: return None
-    AllChem.MMFFOptimizeMolecule(mol_h)
-    conf = mol_h.GetConformer()
-    pt = Chem.GetPeriodicTable()
+    mol_h = embedded_molecule(mol)
+    if mol_h is None: return None
+    # Вся молекула - массивами bond_geometry: позиции (n, 3), связи (m, 2), тройки углов
+    arrays = molecule_arrays(mol_h)
+    z, (i, j) = arrays["z"], arrays["bonds"].T
 
-    total_hw = 0.0
-    total_repulsion = 0.0
+    d_actual = bond_lengths(arrays["pos"], arrays["bonds"])
+    r_cov = covalent_radii(z)
+    v_net = net_buffer_volume(d_actual, r_cov[i], r_cov[j], z[i] != 1, z[j] != 1, BUFFER_RADIUS)
 
-    for bond in mol_h.GetBonds():
-        a1, a2 = bond.GetBeginAtom(), bond.GetEndAtom()
-        z1, z2 = a1.GetAtomicNum(), a2.GetAtomicNum()
-        bo = bond.GetBondTypeAsDouble()
-        
-        pos1, pos2 = np.array(conf.GetAtomPosition(a1.GetIdx())), np.array(conf.GetAtomPosition(a2.GetIdx()))
-        d_actual = np.linalg.norm(pos1 - pos2)
-        r_cov1, r_cov2 = pt.GetRcovalent(z1), pt.GetRcovalent(z2)
-        
-        v_total_buf = calculate_asymmetric_overlap(d_actual, BUFFER_RADIUS, BUFFER_RADIUS)
-        exc1 = 0.0 if z1 == 1 else calculate_asymmetric_overlap(d_actual, r_cov1, BUFFER_RADIUS)
-        exc2 = 0.0 if z2 == 1 else calculate_asymmetric_overlap(d_actual, r_cov2, BUFFER_RADIUS)
-        v_net = max(0.0, v_total_buf - exc1 - exc2)
-        
-        # ОНТОЛОГИЯ ТЕРМИНАТОРОВ: Если оба узла - галогены (1 порт), Базовый Замок не выдается
-        is_term1 = z1 in [9, 17, 35, 53]
-        is_term2 = z2 in [9, 17, 35, 53]
-        base_lock = 0.0 if (is_term1 and is_term2) else STATIC_BASE_LOCK
-        
-        raw_hw = (bo * base_lock) + (VOLUME_BONUS * v_net)
-        tax_sys = raw_hw * (GAMMA_SYS - 1.0)
-        total_hw += (raw_hw - tax_sys)
+    # ОНТОЛОГИЯ ТЕРМИНАТОРОВ: Если оба узла - галогены (1 порт), Базовый Замок не выдается
+    both_terminators = np.isin(z[i], TERMINATORS) & np.isin(z[j], TERMINATORS)
+    base_lock = np.where(both_terminators, 0.0, STATIC_BASE_LOCK)
+
+    raw_hw = (arrays["bond_order"] * base_lock) + (VOLUME_BONUS * v_net)
+    tax_sys = raw_hw * (GAMMA_SYS - 1.0)
+    total_hw = np.sum(raw_hw - tax_sys)
 
-        # ГЕОМЕТРИЧЕСКИЙ CUTOFF ДЖИТТЕРА: Начисляется только если порты протыкают друг друга
-        if d_actual < BUFFER_RADIUS:
-            lp1, lp2 = get_lone_pairs(z1), get_lone_pairs(z2)
-            total_repulsion += C_LP * (lp1 * lp2)
+    # ГЕОМЕТРИЧЕСКИЙ CUTOFF ДЖИТТЕРА: Начисляется только если порты протыкают друг друга
+    lp = lone_pairs(z)
+    total_repulsion = np.sum((C_LP * (lp[i] * lp[j]))[d_actual < BUFFER_RADIUS])
 
-    total_tension = get_angular_tension(mol_h, conf)
+    total_tension = max_angle_tension(arrays, K_THETA)
     
     # Водород не получает субсидию изоляции (у него нет внутренних оболочек для маршрутизации)
     heavy_atoms = mol_h.GetNumHeavyAtoms()
@@ -1,7 +1,8 @@
 import math
 import numpy as np
-from rdkit import Chem
-from rdkit.Chem import AllChem
+from lazy_import import lazy_module
+Chem = lazy_module("rdkit.Chem")
+AllChem = lazy_module("rdkit.Chem.AllChem")
 
 # =====================================================================
 # SIMUREALITY: DYNAMIC STATE MACHINE (V24 CORE)
@@ -1,6 +1,9 @@
+import heapq
 import numpy as np
 from itertools import product
 
+from fcc_lattice import FCCCluster, fcc_neighbors
+
 # --- PHYSICS CONSTANTS ---
 THRESHOLD_SQ = 2.1 # Bond distance check (dist^2 < 2.1)
 
@@ -28,44 +31,50 @@ def log_spin_phase_scan(max_n=45):
     heatmap_gain = np.zeros((len(alphas), max_n + 1))
     
     # --- 4. DYNAMIC ACCRETION LOOP ---
+    # Bond counts are kept incrementally by FCCCluster; candidates live in a heap keyed by
+    # (-score, lattice index). A score only grows when a site gains a bond, so outdated heap
+    # entries are simply skipped when popped (ties resolve to the lowest index, as argmax did).
+    lattice_index = {tuple(int(c) for c in node): idx for idx, node in enumerate(lattice)}
+    
     for i, alpha in enumerate(alphas):
         
-        cluster = []
-        occupied_indices = set()
+        cluster = None
         
         # Base Potential Terms
         gravity_penalty = radii * 1.0 
         centrifugal_penalty = alpha / (radii**2) 
         
+        def score(idx, bonds):
+            # Score = Attraction - Gravity - Centrifugal Penalty
+            return (bonds * 2.5) - gravity_penalty[idx] - centrifugal_penalty[idx]
+        
+        heap = [(-score(idx, 0), idx, 0) for idx in range(len(lattice))]
+        heapq.heapify(heap)
+        
         for n in range(1, max_n + 1):
             
-            bonds_vec = np.zeros(len(lattice))
-            
-            # --- Score Calculation (Optimized) ---
-            if n > 1:
-                arr_cluster = np.array(cluster)
-                for current_atom in arr_cluster:
-                    d2 = np.sum((lattice - current_atom)**2, axis=1)
-                    bonds_vec += (d2 < THRESHOLD_SQ) * 1
-            
-            # Full Scoring Hamiltonian (Maximize Stability Score)
-            score_mask = np.full(len(lattice), -np.inf)
-            
-            for idx in range(len(lattice)):
-                if tuple(lattice[idx]) not in occupied_indices:
-                    # Score = Attraction - Gravity - Centrifugal Penalty
-                    score_mask[idx] = (bonds_vec[idx] * 2.5) - gravity_penalty[idx] - centrifugal_penalty[idx]
-            
             # Find the best unoccupied spot
-            best_idx = np.argmax(score_mask)
+            while True:
+                _, best_idx, bonds = heapq.heappop(heap)
+                best_atom = tuple(int(c) for c in lattice[best_idx])
+                if cluster is None: break
+                if best_atom not in cluster.occupied and cluster.bond_count(best_atom) == bonds: break
             
             # Add Winner
-            best_atom = lattice[best_idx]
-            cluster.append(best_atom)
-            occupied_indices.add(tuple(best_atom))
+            if cluster is None:
+                cluster = FCCCluster(seed=best_atom)
+                final_bonds_added = 0
+            else:
+                final_bonds_added = cluster.add(best_atom)
+            
+            # Re-score only the 12 neighbours of the new node
+            for nb in fcc_neighbors(best_atom):
+                nb_idx = lattice_index.get(nb)
+                if nb_idx is not None and nb not in cluster.occupied:
+                    nb_bonds = cluster.bond_count(nb)
+                    heapq.heappush(heap, (-score(nb_idx, nb_bonds), nb_idx, nb_bonds))
             
             # Record Gain (Actual bonds formed by this particle)
-            final_bonds_added = bonds_vec[best_idx]
             heatmap_gain[i, n] = final_bonds_added
 
     # --- 5. TEXT OUTPUT ---
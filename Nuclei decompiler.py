@@ -2,6 +2,8 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 
+from fcc_lattice import crystal_links
+
 # =====================================================================
 # SIMUREALITY: METABOLISM TABLE GENERATOR
 # =====================================================================
@@ -30,38 +32,9 @@ STABLE_ISOTOPES = [
 ]
 
 class SimurealityMacroCore:
-    def __init__(self):
-        self._macro_link_cache = {0: 0, 1: 0, 2: 1, 3: 3, 4: 6}
-
-    def get_fcc_neighbors(self, node):
-        x, y, z = node
-        deltas = [(1,1,0), (1,-1,0), (-1,1,0), (-1,-1,0),
-                  (1,0,1), (1,0,-1), (-1,0,1), (-1,0,-1),
-                  (0,1,1), (0,1,-1), (0,-1,1), (0,-1,-1)]
-        return [(x+dx, y+dy, z+dz) for dx, dy, dz in deltas]
-
     def compile_3d_crystal(self, n_clusters):
-        if n_clusters in self._macro_link_cache: return self._macro_link_cache[n_clusters]
-        occupied = set([(0, 0, 0)])
-        for _ in range(1, n_clusters):
-            candidates = set()
-            for node in occupied:
-                for neighbor in self.get_fcc_neighbors(node):
-                    if neighbor not in occupied: candidates.add(neighbor)
-            cm_x = sum(n[0] for n in occupied) / len(occupied)
-            cm_y = sum(n[1] for n in occupied) / len(occupied)
-            cm_z = sum(n[2] for n in occupied) / len(occupied)
-            
-            best_pos, max_bonds, min_dist = None, -1, float('inf')
-            for cand in candidates:
-                bonds = sum(1 for n in self.get_fcc_neighbors(cand) if n in occupied)
-                dist_sq = (cand[0]-cm_x)**2 + (cand[1]-cm_y)**2 + (cand[2]-cm_z)**2
-                if bonds > max_bonds or (bonds == max_bonds and dist_sq < min_dist):
-                    max_bonds, min_dist, best_pos = bonds, dist_sq, cand
-            occupied.add(best_pos)
-        total_macro_links = sum(sum(1 for n in self.get_fcc_neighbors(node) if n in occupied) for node in occupied) // 2
-        self._macro_link_cache[n_clusters] = total_macro_links
-        return total_macro_links
+        """Жадная 3D-компиляция Альфа-кластеров: O(1) чтение общей ГЦК-таблицы"""
+        return crystal_links(n_clusters)
 
     def analyze_node_metabolism(self, Z, N):
         """Возвращает полный профиль ядра для Ассемблера"""
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
+from lazy_import import lazy_module
+go = lazy_module("plotly.graph_objects")
 
 # =====================================================================
 # SIMUREALITY: V8.4 PARTICLE ZOO COMPILER (Self-Contained Framework)
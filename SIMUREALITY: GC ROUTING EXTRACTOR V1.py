@@ -1,9 +1,10 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-from sklearn.linear_model import LinearRegression
-import plotly.express as px
-import os
+
+from chronos_pipeline import gc_design
+from chronos_store import load_benchmark
+from gc_fitter import PARITY, publish_model, sync_stats
+from lazy_import import lazy_module
+px = lazy_module("plotly.express")
 
 # ==========================================================================================
 # SIMUREALITY: GC ROUTING EXTRACTOR V4.0 (UNIFIED CORE)
@@ -15,10 +16,7 @@ st.title("Simureality: Архитектура Сборщика Мусора 🗑
 
 @st.cache_data
 def load_data():
-    file_name = "simureality_chronos_benchmark_V73.csv"
-    if os.path.exists(file_name):
-        return pd.read_csv(file_name)
-    return None
+    return load_benchmark("simureality_chronos_benchmark_V73.csv")
 
 df = load_data()
 
@@ -29,48 +27,59 @@ if df is None:
 # --- 1. ОЧИСТКА И ПОДГОТОВКА ДАННЫХ ---
 df_unstable = df[(df['Status'] == 'Unstable') & (df['Log10(T_1/2)'] > -25)].copy()
 df_unstable['N'] = df_unstable['A'] - df_unstable['Z']
-df_unstable['Unpaired_Ports'] = (df_unstable['Z'] % 2) + (df_unstable['N'] % 2)
-df_unstable['sqrt_dK'] = np.sqrt(np.maximum(df_unstable['ΔK Debt (MeV)'], 0.1))
-
-# МАРШРУТИЗАЦИЯ
-heavy = df_unstable[df_unstable['Z'] > 82].copy()  # Hardware Dump
-light = df_unstable[df_unstable['Z'] <= 82].copy() # Software Patch
-
-# --- 2. ДЕКОМПИЛЯЦИЯ (РЕГРЕССИЯ) ---
-def fit_gc_model(data):
-    X = np.column_stack((data['Z'], data['sqrt_dK'], data['Unpaired_Ports']))
-    y = data['Log10(T_1/2)'].values
-    reg = LinearRegression().fit(X, y)
-    r2 = reg.score(X, y)
-    data['Predicted_Log10(T)'] = reg.predict(X)
-    return reg, r2
-
-reg_heavy, r2_heavy = fit_gc_model(heavy)
-reg_light, r2_light = fit_gc_model(light)
+X = gc_design(df_unstable)  # та же кодировка, что у sync_stats и у прогноза дашбордов
+df_unstable['Unpaired_Ports'] = X['Unpaired_Ports']
+df_unstable['sqrt_dK'] = X['sqrt_dK']
+
+# МАРШРУТИЗАЦИЯ: порог и четность меняются без перерасчета - регионы собираются из ячеек (Z, порты)
+st.sidebar.header("Маршрутизация")
+z_split = st.sidebar.slider("Граница Hardware Dump (Z >)", 20, 100, 82)
+parity = st.sidebar.selectbox("Четность портов", list(PARITY))
+df_unstable = df_unstable[df_unstable['Unpaired_Ports'].isin(PARITY[parity])]
+
+heavy = df_unstable[df_unstable['Z'] > z_split].copy()  # Hardware Dump
+light = df_unstable[df_unstable['Z'] <= z_split].copy() # Software Patch
+
+# --- 2. ДЕКОМПИЛЯЦИЯ (НОРМАЛЬНЫЕ УРАВНЕНИЯ) ---
+# Достаточные статистики XᵀX / Xᵀy живут в хранилище Chronos и обновляются только новыми изотопами
+stats, sync = sync_stats(df, "simureality_chronos_benchmark_V73")
+fit_heavy = stats.fit(z_split + 1, None, parity)
+fit_light = stats.fit(0, z_split, parity)
+fit_all = stats.fit(0, None, parity)
+st.sidebar.caption(f"Ячейки XᵀX: +{sync['added']} / -{sync['removed']} изотопов ({sync['rows']} в модели)")
 
 st.header("1. Аппаратные константы вакуума")
 col1, col2 = st.columns(2)
 
 with col1:
-    st.subheader("🛠️ Hardware Dump (Z > 82)")
-    st.metric("Точность (R²)", f"{r2_heavy:.4f}")
+    st.subheader(f"🛠️ Hardware Dump (Z > {z_split})")
+    st.metric("Точность (R²)", f"{fit_heavy['r2']:.4f}")
     st.code(f"""
-T_base: {reg_heavy.intercept_:.3f}
-Z_imp : {reg_heavy.coef_[0]:.3f}
-E_pow : {reg_heavy.coef_[1]:.3f}
-P_lock: {reg_heavy.coef_[2]:.3f}
+T_base: {fit_heavy['T_base']:.3f}
+Z_imp : {fit_heavy['Z_imp']:.3f}
+E_pow : {fit_heavy['E_pow']:.3f}
+P_lock: {fit_heavy['P_lock']:.3f}
     """)
 
 with col2:
-    st.subheader("💻 Software Patch (Z <= 82)")
-    st.metric("Точность (R²)", f"{r2_light:.4f}")
+    st.subheader(f"💻 Software Patch (Z <= {z_split})")
+    st.metric("Точность (R²)", f"{fit_light['r2']:.4f}")
     st.code(f"""
-T_base: {reg_light.intercept_:.3f}
-Z_imp : {reg_light.coef_[0]:.3f}
-E_pow : {reg_light.coef_[1]:.3f}
-P_lock: {reg_light.coef_[2]:.3f}
+T_base: {fit_light['T_base']:.3f}
+Z_imp : {fit_light['Z_imp']:.3f}
+E_pow : {fit_light['E_pow']:.3f}
+P_lock: {fit_light['P_lock']:.3f}
     """)
 
+# Публикация: Chronos Generator, Extractor_Chronos, 3D-time и Global scanner читают живые константы
+regions = {"Global (все Z)": ("global", fit_all), f"Hardware Dump (Z > {z_split})": ("heavy", fit_heavy),
+           f"Software Patch (Z <= {z_split})": ("light", fit_light)}
+target = st.selectbox("Модель для дашбордов Chronos", list(regions))
+if st.button("📡 Опубликовать константы"):
+    region, fit = regions[target]
+    model = publish_model(fit, {"region": region, "z_split": z_split, "parity": parity}, source="GC ROUTING EXTRACTOR")
+    st.success(f"Опубликовано: {model}")
+
 st.divider()
 
 # --- 3. 3D ВЕКТОРНОЕ ВРЕМЯ ---
@@ -78,16 +87,16 @@ st.header("2. Трехмерная проекция времени (3D Matrix Ti
 st.markdown("Здесь макро-время разбито на ортогональные векторы вычислений с использованием констант, полученных выше.")
 
 # Считаем 3D-векторы для тяжелых ядер на основе их реальных констант
-heavy['T_x (Error)'] = reg_heavy.coef_[1] * heavy['sqrt_dK']
-heavy['T_y (Lag)'] = reg_heavy.coef_[0] * heavy['Z']
-heavy['T_z (Sync)'] = reg_heavy.coef_[2] * heavy['Unpaired_Ports']
+heavy['T_x (Error)'] = fit_heavy['E_pow'] * heavy['sqrt_dK']
+heavy['T_y (Lag)'] = fit_heavy['Z_imp'] * heavy['Z']
+heavy['T_z (Sync)'] = fit_heavy['P_lock'] * heavy['Unpaired_Ports']
 
 fig_3d = px.scatter_3d(
     heavy, 
     x='T_x (Error)', y='T_y (Lag)', z='T_z (Sync)',
     color='Log10(T_1/2)', hover_name='Isotope',
     labels={"T_x (Error)": "Ось X: Ошибка", "T_y (Lag)": "Ось Y: Сетевой Лаг", "T_z (Sync)": "Ось Z: Синхронизация Спина"},
-    title="3D-Вектор Времени (Hardware Dump Z > 82)",
+    title=f"3D-Вектор Времени (Hardware Dump Z > {z_split})",
     template="plotly_dark", color_continuous_scale="Turbo"
 )
 fig_3d.update_traces(marker=dict(size=4))
@@ -3,6 +3,8 @@ import numpy as np
 import pandas as pd
 import math
 
+from nuclear_data import cached_csv
+
 # --- 1. MATH CORE (No External Dependencies) ---
 def is_prime_manual(n):
     if n <= 1: return False
@@ -34,7 +36,7 @@ st.markdown("**Project Trilex (Simureality):** Select a material from the DB, th
 @st.cache_data
 def load_data():
     try:
-        df = pd.read_csv("scyrmions_db.csv")
+        df = cached_csv("scyrmions_db.csv")
         return df
     except FileNotFoundError:
         st.error("⚠️ Database file 'scyrmions_db.csv' not found!")
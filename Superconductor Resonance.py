@@ -2,7 +2,9 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import math
-import plotly.graph_objects as go
+from lazy_import import lazy_module
+from nuclear_data import cached_csv
+go = lazy_module("plotly.graph_objects")
 
 # --- MATH CORE ---
 def is_prime(n):
@@ -20,7 +22,7 @@ st.markdown("**Simureality Circuit:** Tracking the Prime Resonance break-point d
 @st.cache_data
 def load_data():
     try:
-        return pd.read_csv("superconductors_db.csv")
+        return cached_csv("superconductors_db.csv")
     except:
         return pd.DataFrame()
 
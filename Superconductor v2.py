@@ -2,7 +2,8 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import math
-import plotly.graph_objects as go
+from lazy_import import lazy_module
+go = lazy_module("plotly.graph_objects")
 
 # ==========================================
 # 🧠 CORE LOGIC: SIGNAL INTEGRITY V5.0
@@ -2,8 +2,12 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import math
-from rdkit import Chem
-from rdkit.Chem import AllChem
+from lazy_import import lazy_module
+from bond_geometry import (TERMINATORS, bond_lengths, covalent_radii, lone_pairs, max_angle_tension, molecule_arrays,
+                           net_buffer_volume, per_element)
+from conformer_cache import embedded_molecule
+from nuclear_data import cached_csv
+Chem = lazy_module("rdkit.Chem")
 
 # =====================================================================
 # SIMUREALITY: THERMODYNAMIC ASSEMBLER V7 (DYNAMIC METABOLISM)
@@ -25,7 +29,7 @@ C_LP = 12.5
 @st.cache_data
 def load_metabolism_table():
     try:
-        df = pd.read_csv("simureality_metabolism.csv")
+        df = cached_csv("simureality_metabolism.csv")
         # Возвращаем словарь T_crit для быстрого доступа
         return dict(zip(df['Z'], df['T_crit (Порог Активации/Температура)']))
     except:
@@ -38,103 +42,46 @@ T_CRIT_MAP = load_metabolism_table()
 def get_t_crit(Z):
     return T_CRIT_MAP.get(Z, 1500.0) 
 
-def get_lone_pairs(atomic_num):
-    if atomic_num in [9, 17, 35, 53]: return 3  
-    if atomic_num in [8, 16, 34]: return 2      
-    if atomic_num in [7, 15]: return 1          
-    return 0                                    
-
-def calculate_asymmetric_overlap(d, r1, r2):
-    if d >= r1 + r2 or d <= 0: return 0.0
-    if d <= abs(r1 - r2): return (4/3) * math.pi * (min(r1, r2)**3)
-    d1 = (d**2 - r2**2 + r1**2) / (2 * d)
-    d2 = d - d1
-    h1 = r1 - d1
-    h2 = r2 - d2
-    return ((math.pi * h1**2 / 3) * (3 * r1 - h1)) + ((math.pi * h2**2 / 3) * (3 * r2 - h2))
-
-def get_angular_tension(mol_h, conf):
-    total_tension = 0.0
-    for atom in mol_h.GetAtoms():
-        neighbors = [n.GetIdx() for n in atom.GetNeighbors()]
-        if len(neighbors) >= 2:
-            pos_c = np.array(conf.GetAtomPosition(atom.GetIdx()))
-            max_angle = 109.47
-            for i in range(len(neighbors)):
-                for j in range(i+1, len(neighbors)):
-                    v1 = np.array(conf.GetAtomPosition(neighbors[i])) - pos_c
-                    v2 = np.array(conf.GetAtomPosition(neighbors[j])) - pos_c
-                    n1, n2 = np.linalg.norm(v1), np.linalg.norm(v2)
-                    if n1 == 0 or n2 == 0: continue
-                    val = max(-1.0, min(1.0, np.dot(v1, v2) / (n1 * n2)))
-                    angle = math.degrees(math.acos(val))
-                    if angle > max_angle: max_angle = angle
-            total_tension += K_THETA * abs(max_angle - 109.47)
-    return total_tension
-
 def assemble_molecule_thermodynamically(smiles, T_sys, P_sys):
     mol = Chem.MolFromSmiles(smiles)
     if not mol: return None
-    mol_h = Chem.AddHs(mol)
-    if AllChem.EmbedMolecule(mol_h, randomSeed=42) != 0: return None
-    AllChem.MMFFOptimizeMolecule(mol_h)
-    conf = mol_h.GetConformer()
-    pt = Chem.GetPeriodicTable()
-
-    total_hw = 0.0
-    total_repulsion = 0.0
-    max_t_activation = 0.0 # Температура, при которой молекула начнет собираться
-    bonds_formed = 0
+    mol_h = embedded_molecule(mol)
+    if mol_h is None: return None
+    # Вся молекула - массивами bond_geometry: позиции (n, 3), связи (m, 2), тройки углов
+    arrays = molecule_arrays(mol_h)
+    z, (i, j) = arrays["z"], arrays["bonds"].T
 
     # Модификатор Давления (Сжимает дистанции)
     # При 1.0 ATM дистанции стандартные. При 10 ATM дистанции сжимаются на 5%
     p_modifier = 1.0 - (math.log10(P_sys) * 0.05) if P_sys >= 1.0 else 1.0
+    d_actual = bond_lengths(arrays["pos"], arrays["bonds"]) * p_modifier
+
+    # Модификатор Температуры (Перегретые ядра расширяют эфирный буфер портов)
+    # Если T_sys высокое, атомы "распухают" на доли Ангстрема
+    t_crit = per_element(z, get_t_crit)
+    r_cov = covalent_radii(z) * (1.0 + (T_sys / t_crit) * 0.05)
+
+    # Термодинамический барьер: Реакция слияния выгодна, только если T_sys 
+    # раскачала хотя бы один из атомов достаточно близко к его T_crit
+    bond_activation_temp = np.minimum(t_crit[i], t_crit[j]) * 0.35 # Эмпирический порог активации 35% от критического
+    max_t_activation = float(bond_activation_temp.max(initial=0.0)) # Температура, при которой молекула начнет собираться
+
+    # Отказ транзакции (T_sys < порога): метаболизм атомов еще справляется сам.
+    formed = T_sys >= bond_activation_temp
+    bonds_formed = int(formed.sum())
+
+    v_net = net_buffer_volume(d_actual, r_cov[i], r_cov[j], z[i] != 1, z[j] != 1, BUFFER_RADIUS)
+    both_terminators = np.isin(z[i], TERMINATORS) & np.isin(z[j], TERMINATORS)
+    base_lock = np.where(both_terminators, 0.0, STATIC_BASE_LOCK)
+
+    raw_hw = (arrays["bond_order"] * base_lock) + (VOLUME_BONUS * v_net)
+    tax_sys = raw_hw * (GAMMA_SYS - 1.0)
+    total_hw = np.sum((raw_hw - tax_sys)[formed])
+
+    lp = lone_pairs(z)
+    total_repulsion = np.sum((C_LP * (lp[i] * lp[j]))[formed & (d_actual < BUFFER_RADIUS)])
 
-    for bond in mol_h.GetBonds():
-        a1, a2 = bond.GetBeginAtom(), bond.GetEndAtom()
-        z1, z2 = a1.GetAtomicNum(), a2.GetAtomicNum()
-        bo = bond.GetBondTypeAsDouble()
-        
-        pos1, pos2 = np.array(conf.GetAtomPosition(a1.GetIdx())), np.array(conf.GetAtomPosition(a2.GetIdx()))
-        d_actual = np.linalg.norm(pos1 - pos2) * p_modifier
-        
-        # Модификатор Температуры (Перегретые ядра расширяют эфирный буфер портов)
-        # Если T_sys высокое, атомы "распухают" на доли Ангстрема
-        t_expansion_1 = 1.0 + (T_sys / get_t_crit(z1)) * 0.05
-        t_expansion_2 = 1.0 + (T_sys / get_t_crit(z2)) * 0.05
-        
-        r_cov1 = pt.GetRcovalent(z1) * t_expansion_1
-        r_cov2 = pt.GetRcovalent(z2) * t_expansion_2
-        
-        # Термодинамический барьер: Реакция слияния выгодна, только если T_sys 
-        # раскачала хотя бы один из атомов достаточно близко к его T_crit
-        bond_activation_temp = min(get_t_crit(z1), get_t_crit(z2)) * 0.35 # Эмпирический порог активации 35% от критического
-        if bond_activation_temp > max_t_activation:
-            max_t_activation = bond_activation_temp
-
-        if T_sys < bond_activation_temp:
-            # Отказ транзакции. Метаболизм атомов еще справляется сам.
-            continue
-            
-        bonds_formed += 1
-
-        v_total_buf = calculate_asymmetric_overlap(d_actual, BUFFER_RADIUS, BUFFER_RADIUS)
-        exc1 = 0.0 if z1 == 1 else calculate_asymmetric_overlap(d_actual, r_cov1, BUFFER_RADIUS)
-        exc2 = 0.0 if z2 == 1 else calculate_asymmetric_overlap(d_actual, r_cov2, BUFFER_RADIUS)
-        v_net = max(0.0, v_total_buf - exc1 - exc2)
-        
-        is_term1, is_term2 = z1 in [9, 17, 35, 53], z2 in [9, 17, 35, 53]
-        base_lock = 0.0 if (is_term1 and is_term2) else STATIC_BASE_LOCK
-        
-        raw_hw = (bo * base_lock) + (VOLUME_BONUS * v_net)
-        tax_sys = raw_hw * (GAMMA_SYS - 1.0)
-        total_hw += (raw_hw - tax_sys)
-
-        if d_actual < BUFFER_RADIUS:
-            lp1, lp2 = get_lone_pairs(z1), get_lone_pairs(z2)
-            total_repulsion += C_LP * (lp1 * lp2)
-
-    total_tension = get_angular_tension(mol_h, conf) if bonds_formed > 0 else 0.0
+    total_tension = max_angle_tension(arrays, K_THETA) if bonds_formed > 0 else 0.0
     heavy_atoms = mol_h.GetNumHeavyAtoms()
     final_cashback = (Z0 / 2.0) if heavy_atoms > 0 and bonds_formed > 0 else 0.0
 
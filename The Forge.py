@@ -1,8 +1,11 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
+
+from topological_core import matrix_surface
+from lazy_import import lazy_module
+px = lazy_module("plotly.express")
+go = lazy_module("plotly.graph_objects")
 
 # =====================================================================
 # SIMUREALITY: V26.0 UNIVERSAL FORGE (SPACE, TIME & MOLECULES)
@@ -12,50 +15,18 @@ import plotly.graph_objects as go
 st.set_page_config(page_title="Universal Forge V26", layout="wide", page_icon="🌌")
 
 # --- 1. STELLAR FORGE (ЗВЕЗДНЫЕ АЛГОРИТМЫ АРХИТЕКТОРА) ---
-def generate_fcc_magic():
-    base_shells = [int((n+1)*(n+2)*(n+3)/3) for n in range(6)] 
-    twist_shifts = [28, 50, 82, 126] 
-    return sorted(list(set(base_shells + twist_shifts)))
-
-MAGIC_NODES = generate_fcc_magic()
-E_ALPHA, E_MACRO, E_LINK, E_PAIR, J_TAX = 28.320, 2.425, 2.360, 1.180, 0.0131         
-
-def get_jitter_tax(Z, N):
-    if Z <= 0 or N <= 0: return 0
-    dist_Z, dist_N = min([abs(Z - m) for m in MAGIC_NODES]), min([abs(N - m) for m in MAGIC_NODES])
-    base_ports = 10.0 * ((Z + N)**(2/3))
-    return (base_ports + (15.0 * ((dist_Z + dist_N)**1.6))) * J_TAX
-
-def get_dangling_port_tax(Z, N): return (E_LINK / 2.0) * ((Z % 2) + (N % 2))
-
-def calculate_topological_profit(Z, N):
-    if Z <= 0 or N <= 0: return 0
-    N_alpha = min(Z // 2, N // 2)
-    l_ideal = max(0, 3 * N_alpha - 6)
-    l_lost = (min([abs(Z - m) for m in MAGIC_NODES]) + min([abs(N - m) for m in MAGIC_NODES])) * 0.4
-    BE = (N_alpha * E_ALPHA) + (max(0, l_ideal - l_lost) * E_MACRO)
-    halo_n = N - Z
-    if halo_n > 0: 
-        max_strong_links = int(Z * 0.4) 
-        BE += min(halo_n, max_strong_links) * E_LINK + (halo_n - min(halo_n, max_strong_links)) * (E_PAIR / 2.0)
-    return BE - get_jitter_tax(Z, N) - get_dangling_port_tax(Z, N)
-
-def get_discrete_graph_diameter(A):
-    if A <= 0: return 1
-    diameter = 1
-    for m in MAGIC_NODES:
-        if A > m: diameter += 1
-        else: break
-    cb = MAGIC_NODES[diameter - 2] if diameter > 1 else 0
-    nb = MAGIC_NODES[diameter - 1] if diameter <= len(MAGIC_NODES) else A
-    return diameter + (A - cb) / max(1, (nb - cb))
+# Та же топологическая модель, что в дашбордах деления, но с налогом джиттера ^1.6.
+# get_total_matrix_energy = O(1) чтение общей карты topological_core.matrix_surface.
+FORGE_JITTER_POWER = 1.6
 
 def get_total_matrix_energy(Z, N):
     if Z <= 0 or N <= 0: return 0
-    return calculate_topological_profit(Z, N) - ((E_LINK * np.sqrt(2)) * ((Z * (Z - 1)) / 2.0) / get_discrete_graph_diameter(Z + N))
+    return matrix_surface(Z, N, FORGE_JITTER_POWER).at(Z, N)
 
 def get_fusion_profit(Z1, N1, Z2, N2, confinement_tax_mev=0.0):
-    return get_total_matrix_energy(Z1 + Z2, N1 + N2) - (get_total_matrix_energy(Z1, N1) + get_total_matrix_energy(Z2, N2) - confinement_tax_mev)
+    surface = matrix_surface(Z1 + Z2, N1 + N2, FORGE_JITTER_POWER)
+    E_product = surface.at(Z1 + Z2, N1 + N2)
+    return E_product - (surface.at(Z1, N1) + surface.at(Z2, N2) - confinement_tax_mev)
 
 def simulate_gamow_peak(lattice_impedance, max_latch_speed):
     energies = np.linspace(1, 200, 400) 
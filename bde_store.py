@@ -0,0 +1,258 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from lazy_import import lazy_module
+from nuclear_data import cached_table, file_digest, frame_records
+
+Chem = lazy_module("rdkit.Chem")
+
+# ==========================================================================================
+# SIMUREALITY: BDE-db2 STORE (STREAMED INGEST, COMPLEXITY INDEX)
+# bde-db2.csv.gz читается один раз потоком по CHUNK_ROWS строк; каждый уникальный SMILES
+# парсится RDKit один раз. В общий кеш nuclear_data (.npy, mmap, ключ - SHA-256 файла) ложатся:
+#   bde-row-columns  - схема строк: имя и тип каждой колонки CSV (+ mol_id, Graph_Complexity);
+#   bde-row-cNNN     - одна колонка = один .npy. Числа - как есть, строки (фрагменты, тип связи,
+#                      set) - номера в общем словаре bde-strings, SMILES молекулы - только mol_id;
+#   bde-molecules    - каталог молекул: канонический SMILES, связи, тяжелые атомы, первая строка
+#                      с валидным BDE, смещение бинарника RDKit (Mol.ToBinary) в bde-molblobs;
+#   bde-*-index      - (сложность, номер) отсортированные по сложности: срез уровня сложности -
+#                      два searchsorted, а не MolFromSmiles по всей базе.
+# Колонки строк дописываются на диск по чанкам: в памяти - один чанк, словарь и каталог.
+# ==========================================================================================
+
+FILE_NAME = "bde-db2.csv.gz"
+BDE_SCHEMA = 2
+CHUNK_ROWS = 50_000
+
+INDEX_DTYPE = np.dtype([("complexity", "<i4"), ("id", "<i8")])
+SPOOL_DTYPES = {"bool": np.bool_, "int": np.int64, "float": np.float64, "str": np.int32}
+
+_INGESTED = {}
+
+
+def _parse(smiles):
+    """(канонический SMILES, связи, тяжелые атомы, бинарник) или пустая запись для невалидного."""
+    try:
+        mol = Chem.MolFromSmiles(smiles)
+    except Exception:
+        mol = None
+    if mol is None:
+        return "", -1, -1, b""
+    return Chem.MolToSmiles(mol), mol.GetNumBonds(), mol.GetNumHeavyAtoms(), mol.ToBinary()
+
+
+def _kind(series):
+    if pd.api.types.is_bool_dtype(series):
+        return "bool"
+    if pd.api.types.is_integer_dtype(series):
+        return "int"
+    return "float" if pd.api.types.is_numeric_dtype(series) else "str"
+
+
+def _join(a, b):
+    """Тип колонки после склейки чанков (как у pd.concat + frame_records)."""
+    if a is None or a == b:
+        return b
+    return "float" if {a, b} == {"int", "float"} else "str"
+
+
+class _Column:
+    """Колонка строк CSV, дописываемая в файл по чанкам; строки - номера в общем словаре."""
+
+    def __init__(self, path, strings):
+        self.path, self.strings = path, strings
+        self.kind, self.rows = None, 0
+        self.file = open(path, "wb")
+
+    def append(self, series):
+        kind = _join(self.kind, _kind(series))
+        if kind != self.kind and self.rows:
+            self._promote(kind)
+        self.kind = kind
+        self._write(self._encode(series))
+
+    def _encode(self, series):
+        if self.kind != "str":
+            return series.to_numpy(dtype=SPOOL_DTYPES[self.kind], na_value=np.nan) if self.kind == "float" \
+                else series.to_numpy(dtype=SPOOL_DTYPES[self.kind])
+        missing = series.isna().to_numpy()
+        text = series[~missing]
+        text = text.astype(str) if _kind(series) == "str" else text.astype(object).map(str)
+        for value in pd.unique(text):
+            if value not in self.strings:
+                self.strings[value] = len(self.strings)
+        codes = np.full(len(series), -1, dtype=np.int32)
+        codes[~missing] = text.map(self.strings).to_numpy(dtype=np.int32)
+        return codes
+
+    def _write(self, values):
+        np.ascontiguousarray(values, dtype=SPOOL_DTYPES[self.kind]).tofile(self.file)
+        self.rows += len(values)
+
+    def _promote(self, kind):
+        """Новый чанк расширил тип (int -> float, число -> строка): уже записанное перекодируется."""
+        self.file.close()
+        done = pd.Series(np.fromfile(self.path, dtype=SPOOL_DTYPES[self.kind]))
+        self.file, self.rows, self.kind = open(self.path, "wb"), 0, kind
+        self._write(self._encode(done))
+
+    def array(self):
+        self.file.close()
+        if self.rows == 0:
+            return np.empty(0, dtype=SPOOL_DTYPES[self.kind or "float"])
+        return np.memmap(self.path, dtype=SPOOL_DTYPES[self.kind], mode="r", shape=(self.rows,))
+
+
+def ingest_bde(path):
+    """Один потоковый проход по gzip: колонки строк, словарь строк, каталог молекул и бинарники RDKit."""
+    spool = tempfile.mkdtemp(prefix="bde-ingest-")
+    ids, catalog, blobs, strings, columns = {}, [], [], {}, {}
+    offset, start = 0, 0
+    for chunk in pd.read_csv(path, compression="gzip", chunksize=CHUNK_ROWS):
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        smiles = chunk["molecule"].astype(str)
+        has_bde = pd.to_numeric(chunk["bde"], errors="coerce").notna()
+        for s in pd.unique(smiles):
+            if s not in ids:
+                canonical, bonds, heavy, blob = _parse(s)
+                ids[s] = len(catalog)
+                catalog.append([s, canonical, bonds, heavy, -1, offset, len(blob)])
+                blobs.append(blob)
+                offset += len(blob)
+        mol_id = smiles.map(ids).to_numpy(dtype=np.int64)
+        for row, s in smiles[has_bde].drop_duplicates().items():
+            if catalog[ids[s]][4] < 0:
+                catalog[ids[s]][4] = row
+        bonds = np.array([entry[2] for entry in catalog], dtype=np.int64)
+        chunk = chunk.drop(columns=["molecule"]).assign(mol_id=mol_id, Graph_Complexity=bonds[mol_id])
+        for name in chunk.columns:
+            if name not in columns:
+                columns[name] = _Column(os.path.join(spool, f"c{len(columns):03d}.bin"), strings)
+            columns[name].append(chunk[name])
+
+    if not columns:
+        columns = {name: _Column(os.path.join(spool, f"c{i:03d}.bin"), strings)
+                   for i, name in enumerate(["mol_id", "Graph_Complexity"])}
+        for column in columns.values():
+            column.kind = "int"
+    molecules = pd.DataFrame(catalog, columns=["molecule", "canonical", "bonds", "heavy", "first_valid_row",
+                                               "blob_offset", "blob_size"])
+    # Порядок колонок - как в CSV: molecule восстанавливается из каталога по mol_id
+    names = ["molecule"] + list(columns)
+    parts = {
+        "_spool": spool,
+        "row-columns": np.array([(name, "mol" if name == "molecule" else columns[name].kind) for name in names],
+                                dtype=[("name", f"U{max(map(len, names))}"), ("kind", "U5")]),
+        "strings": np.array(list(strings), dtype=str),
+        "molecules": frame_records(molecules),
+        "molblobs": np.frombuffer(b"".join(blobs), dtype=np.uint8),
+        "molecule-index": _complexity_index(molecules["bonds"].to_numpy()),
+    }
+    for i, column in enumerate(columns.values()):
+        parts[f"row-c{i:03d}"] = column.array()
+    parts["row-index"] = _complexity_index(np.asarray(columns["Graph_Complexity"].array()))
+    return parts
+
+
+def _complexity_index(complexity):
+    order = np.argsort(complexity, kind="stable")
+    index = np.empty(len(order), dtype=INDEX_DTYPE)
+    index["complexity"], index["id"] = complexity[order], order
+    return index
+
+
+def _part(path, name):
+    digest = file_digest(path)
+    if digest not in _INGESTED:
+        _release()
+        _INGESTED[digest] = ingest_bde(path)
+    return _INGESTED[digest][name]
+
+
+def _release():
+    """Разбор больше не нужен: временные файлы колонок удаляются (mmap живет до закрытия)."""
+    for parts in _INGESTED.values():
+        shutil.rmtree(parts["_spool"], ignore_errors=True)
+    _INGESTED.clear()
+
+
+def load_bde_store(path=FILE_NAME, cache_dir=None):
+    """
+    Все таблицы хранилища (memory-mapped); разбор CSV - только если кеш для этого файла пуст.
+    store["rows"] - {колонка: массив} в кодировке store["row-columns"].
+    """
+    def table(name):
+        return cached_table(f"bde{BDE_SCHEMA}-{name}", path, lambda p: _part(p, name), cache_dir)
+
+    try:
+        store = {name: table(name) for name in ("strings", "molecules", "molblobs", "row-index", "molecule-index")}
+        store["row-columns"] = table("row-columns")
+        store["rows"] = {entry["name"]: table(f"row-c{i:03d}")
+                         for i, entry in enumerate(store["row-columns"][1:])}
+    finally:
+        _release()
+    return store
+
+
+def tier_ids(index, complexity):
+    """Номера строк (или молекул) со сложностью complexity, по возрастанию - срез индекса."""
+    lo, hi = np.searchsorted(index["complexity"], [complexity, complexity + 1])
+    return np.sort(index["id"][lo:hi])
+
+
+def complexity_range(store):
+    """(минимальная положительная, максимальная) сложность графа в базе."""
+    c = store["molecule-index"]["complexity"]
+    c = c[c > 0]
+    return (int(c[0]), int(c[-1])) if len(c) else (0, 0)
+
+
+def bde_frame(path=FILE_NAME, complexity=None, cache_dir=None):
+    """Строки CSV (индекс - номер строки файла) + mol_id, Graph_Complexity; уровень - по индексу."""
+    store = load_bde_store(path, cache_dir)
+    rows = store["rows"]
+    ids = np.arange(len(rows["mol_id"])) if complexity is None else tier_ids(store["row-index"], complexity)
+    data = {}
+    for name, kind in store["row-columns"].tolist():
+        if kind == "mol":
+            data[name] = pd.Series(store["molecules"]["molecule"][rows["mol_id"][ids]])
+        elif kind == "str":
+            codes = rows[name][ids]
+            values = store["strings"][np.maximum(codes, 0)] if len(store["strings"]) else np.full(len(ids), "")
+            data[name] = pd.Series(values).where(codes >= 0)
+        else:
+            data[name] = np.asarray(rows[name][ids])
+    df = pd.DataFrame(data)
+    df.index = ids
+    return df
+
+
+def bde_molecules(path=FILE_NAME, complexity=None, cache_dir=None):
+    """
+    Уникальные молекулы с хотя бы одним валидным BDE и Graph_Complexity > 0, в порядке первой
+    такой строки (как drop_duplicates в дашбордах); индекс - номер этой строки.
+    """
+    store = load_bde_store(path, cache_dir)
+    mols = store["molecules"]
+    ids = np.arange(len(mols)) if complexity is None else tier_ids(store["molecule-index"], complexity)
+    ids = ids[(mols["first_valid_row"][ids] >= 0) & (mols["bonds"][ids] > 0)]
+    ids = ids[np.argsort(mols["first_valid_row"][ids], kind="stable")]
+    return pd.DataFrame({
+        "molecule": pd.Series(mols["molecule"][ids]), "canonical": pd.Series(mols["canonical"][ids]),
+        "Graph_Complexity": mols["bonds"][ids].astype(np.int64), "Heavy_Atoms": mols["heavy"][ids].astype(np.int64),
+        "mol_id": ids,
+    }).set_axis(mols["first_valid_row"][ids])
+
+
+def stored_mol(store, mol_id):
+    """Chem.Mol из бинарника хранилища (без повторного разбора SMILES); None для невалидного."""
+    entry = store["molecules"][int(mol_id)]
+    if entry["blob_size"] == 0:
+        return None
+    start = int(entry["blob_offset"])
+    return Chem.Mol(store["molblobs"][start:start + int(entry["blob_size"])].tobytes())
@@ -0,0 +1,123 @@
+import math
+from itertools import combinations
+
+import numpy as np
+
+from lazy_import import lazy_module
+
+Chem = lazy_module("rdkit.Chem")
+
+# ==========================================================================================
+# SIMUREALITY: BOND GEOMETRY KERNEL (WHOLE-MOLECULE ARRAYS)
+# Общий слой молекулярных движков ΣK. Конформер снимается одним массивом (n, 3), связи -
+# индексами (m, 2), углы - тройками (центр, сосед, сосед) (k, 3); дальше длины связей,
+# объемы перекрытия буферов, порты (неподеленные пары) и угловые отклонения считаются
+# векторно по всей молекуле, без np.array(conf.GetAtomPosition(...)) на каждую связь.
+# ==========================================================================================
+
+TERMINATORS = (9, 17, 35, 53)       # галогены: один порт
+TETRAHEDRAL = 109.47
+
+LONE_PAIRS = np.zeros(119, dtype=np.int64)
+LONE_PAIRS[[9, 17, 35, 53]] = 3
+LONE_PAIRS[[8, 16, 34]] = 2
+LONE_PAIRS[[7, 15]] = 1
+
+
+def molecule_arrays(mol_h, conf=None):
+    """
+    Топология и координаты молекулы: pos (n, 3), z (n,), bonds (m, 2) и bond_order (m,)
+    в порядке GetBonds(), triplets (k, 3) - все пары соседей каждого узла, degree (n,).
+    """
+    conf = conf or mol_h.GetConformer()
+    pos = np.asarray(conf.GetPositions(), dtype=np.float64).reshape(-1, 3)
+    z = np.array([a.GetAtomicNum() for a in mol_h.GetAtoms()], dtype=np.int64)
+    bond_list = list(mol_h.GetBonds())
+    bonds = np.array([(b.GetBeginAtomIdx(), b.GetEndAtomIdx()) for b in bond_list], dtype=np.int64).reshape(-1, 2)
+    bond_order = np.array([b.GetBondTypeAsDouble() for b in bond_list], dtype=np.float64)
+
+    neighbors = [[] for _ in range(len(z))]
+    for i, j in bonds.tolist():
+        neighbors[i].append(j)
+        neighbors[j].append(i)
+    triplets = np.array([(c, a, b) for c, nbrs in enumerate(neighbors) for a, b in combinations(nbrs, 2)],
+                        dtype=np.int64).reshape(-1, 3)
+    degree = np.array([len(n) for n in neighbors], dtype=np.int64)
+    return {"pos": pos, "z": z, "bonds": bonds, "bond_order": bond_order, "triplets": triplets, "degree": degree}
+
+
+def per_element(z, fn):
+    """fn(Z) для каждого атома, с вызовом fn один раз на элемент."""
+    uniq, inverse = np.unique(z, return_inverse=True)
+    return np.array([fn(int(v)) for v in uniq], dtype=np.float64)[inverse].reshape(np.shape(z))
+
+
+def covalent_radii(z):
+    pt = Chem.GetPeriodicTable()
+    return per_element(z, pt.GetRcovalent)
+
+
+def lone_pairs(z):
+    return LONE_PAIRS[np.asarray(z, dtype=np.int64)]
+
+
+def bond_lengths(pos, bonds):
+    return np.linalg.norm(pos[bonds[:, 0]] - pos[bonds[:, 1]], axis=1)
+
+
+def asymmetric_overlap(d, r1, r2):
+    """Объем пересечения сфер r1, r2 на расстоянии d (массивы транслируются)."""
+    d, r1, r2 = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (d, r1, r2)))
+    out = np.zeros(d.shape)
+    touching = (d > 0) & (d < r1 + r2)
+    inside = touching & (d <= np.abs(r1 - r2))
+    lens = touching & ~inside
+    out[inside] = (4 / 3) * math.pi * np.minimum(r1, r2)[inside] ** 3
+    d, r1, r2 = d[lens], r1[lens], r2[lens]
+    d1 = (d ** 2 - r2 ** 2 + r1 ** 2) / (2 * d)
+    h1, h2 = r1 - d1, r2 - (d - d1)
+    out[lens] = ((math.pi * h1 ** 2 / 3) * (3 * r1 - h1)) + ((math.pi * h2 ** 2 / 3) * (3 * r2 - h2))
+    return out
+
+
+def net_buffer_volume(d, r_cov1, r_cov2, heavy1, heavy2, buffer_radius):
+    """Чистый объем буфера связи: перекрытие буферов минус ядра тяжелых атомов (водород ядра не вычитает)."""
+    v_total_buf = asymmetric_overlap(d, buffer_radius, buffer_radius)
+    exc1 = asymmetric_overlap(d, r_cov1, buffer_radius) * heavy1
+    exc2 = asymmetric_overlap(d, r_cov2, buffer_radius) * heavy2
+    return np.maximum(0.0, v_total_buf - exc1 - exc2)
+
+
+def bond_angles(pos, triplets):
+    """(углы в градусах, маска валидных) для троек (центр, a, b); вырожденные векторы - невалидны."""
+    v1 = pos[triplets[:, 1]] - pos[triplets[:, 0]]
+    v2 = pos[triplets[:, 2]] - pos[triplets[:, 0]]
+    n1, n2 = np.linalg.norm(v1, axis=1), np.linalg.norm(v2, axis=1)
+    valid = (n1 != 0) & (n2 != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos = np.clip(np.einsum("ij,ij->i", v1, v2) / (n1 * n2), -1.0, 1.0)
+    return np.degrees(np.arccos(np.where(valid, cos, 1.0))), valid
+
+
+def center_max(values, centers, n_atoms, fill):
+    """Максимум values по каждому центру (fill, если у центра значений нет)."""
+    out = np.full(n_atoms, fill, dtype=np.float64)
+    np.maximum.at(out, centers, values)
+    return out
+
+
+def max_angle_tension(arrays, k_theta, reference=TETRAHEDRAL):
+    """
+    Угловое напряжение движков сборки: k_theta * |max(reference, наибольший угол) - reference|
+    по каждому узлу с 2+ соседями.
+    """
+    angles, valid = bond_angles(arrays["pos"], arrays["triplets"])
+    widest = center_max(angles[valid], arrays["triplets"][valid, 0], len(arrays["z"]), reference)
+    return float(np.sum(k_theta * np.abs(widest[arrays["degree"] >= 2] - reference)))
+
+
+def max_angle_deviation(arrays, ideal):
+    """Σ по узлам максимума |угол - ideal[центр]| (ideal - массив (n,) идеальных углов)."""
+    angles, valid = bond_angles(arrays["pos"], arrays["triplets"])
+    centers = arrays["triplets"][valid, 0]
+    return float(center_max(np.abs(angles[valid] - ideal[centers]), centers, len(arrays["z"]), 0.0).sum())
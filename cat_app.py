@@ -3,6 +3,8 @@ import pandas as pd
 import numpy as np
 import itertools
 
+from nuclear_data import cached_csv
+
 # ==============================================================================
 # SIMUREALITY: GEOMETRIC CATALYST SCANNER (GCS) v7.5
 # Framework: Grid Physics / Simureality Engineering
@@ -73,7 +75,7 @@ def load_data():
     """Loads the elemental database and calculates baseline site distances."""
     try:
         # Expected columns: element, a_angstrom, structure, role, vec, cost_index
-        df = pd.read_csv("cat_materials.csv")
+        df = cached_csv("cat_materials.csv")
         df['site_dist'] = df.apply(get_site_distance, axis=1)
         return df
     except Exception as e:
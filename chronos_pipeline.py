@@ -0,0 +1,160 @@
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+from chronos_store import read_benchmark, read_schema, write_benchmark
+
+# ==========================================================================================
+# SIMUREALITY: INCREMENTAL CHRONOS RE-BENCHMARK
+# Старый лог (NUBASE: Isotope, Z, A, Status, Log10(T_1/2)) + свежий дамп масс (долг ΔK)
+# -> таймер сборщика мусора (GC Equation) и MAE/точность. Каждая модель GC получает отпечаток;
+# каждая строка - хеш своих входов. При новом дампе пересчитываются только строки с новыми
+# входами, остальные берутся из прошлой версии в хранилище Chronos. MAE ведется как
+# агрегат (сумма ошибок, число строк) и обновляется дельтами, без полного пересчета.
+# ==========================================================================================
+
+PIPELINE_VERSION = 2    # 2: прогноз на признаках gc_design (порты 0..2, sqrt(max(ΔK, 0.1)))
+GC_MODEL = {"T_base": 2.76, "Z_imp": 0.04, "E_pow": -0.87, "P_lock": -0.13}
+JITTER_SCALE = 110.0    # ΔK / 110 МэВ = доля периода (3D_Jitter)
+LOG_SPAN = 50.0         # шкала времени ~50 порядков: accuracy = 100 - MAE / 50 * 100
+MIN_DEBT = 0.1          # sqrt(max(ΔK, 0.1)), как в GC ROUTING EXTRACTOR
+
+DEBT_COLUMNS = ('Grid Debt/Error (MeV)', 'Grid Debt', 'Error (MeV)')
+BASE_COLUMNS = ['Isotope', 'Z', 'A', 'Status', 'Log10(T_1/2)']
+DEBT = 'ΔK Debt (MeV)'
+OUTPUT_COLUMNS = ['3D_Jitter', 'Desync_Angle_Deg', 'Unpaired_Ports', 'Predicted_LogT', 'Error_Delta']
+
+
+def find_debt_column(df):
+    """Колонка топологического долга в дампе масс (названия менялись между версиями движка)."""
+    for c in DEBT_COLUMNS:
+        if c in df.columns:
+            return c
+    return None
+
+
+def merge_mass_dump(df_old, df_new, debt_col):
+    """Handshake по (Z, A): база NUBASE из старого лога + |долг| из нового дампа масс."""
+    existing_base_cols = [c for c in BASE_COLUMNS if c in df_old.columns]
+    df_merged = pd.merge(df_old[existing_base_cols], df_new[['Z', 'A', debt_col]], on=['Z', 'A'], how='inner')
+    df_merged[DEBT] = df_merged[debt_col].abs()
+    return df_merged.drop(columns=[debt_col])
+
+
+def model_fingerprint(model=None):
+    """Отпечаток модели GC: коэффициенты + версия конвейера."""
+    model = GC_MODEL if model is None else model
+    blob = json.dumps({"pipeline": PIPELINE_VERSION, "jitter": JITTER_SCALE, "model": model}, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def gc_design(df):
+    """
+    Признаки GC Equation: Z, sqrt(max(ΔK, 0.1)) и Unpaired_Ports = Z % 2 + N % 2 (0..2).
+    Одна кодировка и для подгонки (gc_fitter), и для прогноза (gc_timer, дашборды).
+    """
+    Z = df['Z'].to_numpy(dtype=np.int64)
+    N = df['A'].to_numpy(dtype=np.int64) - Z
+    return pd.DataFrame({
+        "Z": Z,
+        "sqrt_dK": np.sqrt(np.maximum(df[DEBT].to_numpy(dtype=np.float64), MIN_DEBT)),
+        "Unpaired_Ports": (Z % 2) + (N % 2),
+    }, index=df.index)
+
+
+def gc_predict(df, model=None):
+    """Predicted_LogT по коэффициентам model (T_base, Z_imp, E_pow, P_lock)."""
+    m = GC_MODEL if model is None else model
+    X = gc_design(df)
+    return m["T_base"] + (m["Z_imp"] * X['Z']) + (m["E_pow"] * X['sqrt_dK']) + (m["P_lock"] * X['Unpaired_Ports'])
+
+
+def gc_timer(df, model=None):
+    """Колонки Chronos V10: джиттер, угол рассинхрона, неспаренные порты, прогноз и ошибка."""
+    df = df.copy()
+    df['3D_Jitter'] = (df[DEBT] / JITTER_SCALE).clip(0, 0.4999)
+    df['Desync_Angle_Deg'] = df['3D_Jitter'] * 360.0
+    df['Unpaired_Ports'] = gc_design(df)['Unpaired_Ports']
+    df['Predicted_LogT'] = gc_predict(df, model)
+    df['Error_Delta'] = abs(df['Predicted_LogT'] - df['Log10(T_1/2)'])
+    return df
+
+
+def accuracy_from_mae(mae):
+    return max(0, 100 - (mae / LOG_SPAN * 100))
+
+
+def scored_rows(df):
+    """Строки, входящие в MAE: нестабильные ядра с известным таймером (и посчитанной ошибкой)."""
+    return (df['Status'] == 'Unstable') & (df['Log10(T_1/2)'].notna()) & (df['Error_Delta'].notna())
+
+
+def row_fingerprints(df):
+    """64-битный хеш входов каждой строки (база NUBASE + долг)."""
+    cols = [c for c in BASE_COLUMNS + [DEBT] if c in df.columns]
+    return pd.util.hash_pandas_object(df[cols], index=False).to_numpy().view(np.int64)
+
+
+def row_keys(df):
+    """(Z, A) + номер повтора: ключ стабилен между дампами и уникален даже при дублях."""
+    dup = df.groupby(['Z', 'A']).cumcount().to_numpy()
+    return (df['Z'].to_numpy(dtype=np.int64) * 1024 + df['A'].to_numpy(dtype=np.int64)) * 64 + dup
+
+
+def rebenchmark(inputs, name, model=None, engine=None, store_dir=None):
+    """
+    Инкрементальный прогон inputs (результат merge_mass_dump) под именем name.
+    Возвращает (таблица как у полного пересчета, сводка: строки, пересчитано, MAE, точность).
+    Голова версии - "<name>.gc-<отпечаток>", каждый прогон дописывает "<голова>.rNNNN"
+    только с пересчитанными строками.
+    """
+    model = dict(GC_MODEL if model is None else model)
+    fingerprint = model_fingerprint(model)
+    head = f"{name}.gc-{fingerprint[:12]}"
+
+    df = inputs.reset_index(drop=True)
+    df = df.assign(_key=row_keys(df), _input_hash=row_fingerprints(df))
+
+    schema = read_schema(head, store_dir)
+    if schema is not None:
+        prev = read_benchmark(head, store_dir=store_dir)
+        meta = schema["meta"]
+        err_sum, err_count, revision = meta["err_sum"], meta["err_count"], meta["revision"] + 1
+    else:
+        prev = df.iloc[:0].assign(**{c: pd.Series(dtype=float) for c in OUTPUT_COLUMNS})
+        err_sum, err_count, revision = 0.0, 0, 1
+
+    # Строки прошлой версии, чьи входы совпали бит в бит, переиспользуются как есть
+    prev_hash = pd.Series(prev['_input_hash'].to_numpy(), index=prev['_key'].to_numpy())
+    matched = df['_key'].map(prev_hash)
+    unchanged = (matched.to_numpy() == df['_input_hash'].to_numpy()) & matched.notna().to_numpy()
+
+    fresh = gc_timer(df.loc[~unchanged], model)
+    kept = prev.set_index('_key').loc[df.loc[unchanged, '_key'].to_numpy(), OUTPUT_COLUMNS]
+    kept = df.loc[unchanged].assign(**{c: kept[c].to_numpy() for c in OUTPUT_COLUMNS})
+
+    # Агрегат MAE: вычитаем вклад ушедших/измененных строк прошлой версии, добавляем новые
+    retired = ~prev['_key'].isin(df.loc[unchanged, '_key'])
+    old_scored = prev.loc[retired & scored_rows(prev), 'Error_Delta']
+    new_scored = fresh.loc[scored_rows(fresh), 'Error_Delta']
+    err_sum = err_sum - float(old_scored.sum()) + float(new_scored.sum())
+    err_count = err_count - len(old_scored) + len(new_scored)
+
+    result = pd.concat([kept, fresh]).sort_index()
+    changed = len(fresh) > 0 or bool(retired.any())
+    if not changed:
+        revision -= 1  # тот же дамп: новой ревизии нет
+    meta = {"model": model, "fingerprint": fingerprint, "engine": engine, "revision": revision,
+            "err_sum": err_sum, "err_count": err_count}
+    if changed:
+        write_benchmark(fresh, f"{head}.r{revision:04d}", source="chronos_pipeline", meta=meta, store_dir=store_dir)
+        write_benchmark(result, head, source="chronos_pipeline", meta=meta, store_dir=store_dir)
+
+    mae = err_sum / err_count if err_count else float("nan")
+    stats = {"rows": len(result), "recomputed": len(fresh), "reused": int(unchanged.sum()),
+             "retired": int(retired.sum()), "revision": revision, "fingerprint": fingerprint[:12],
+             "mae": mae, "accuracy": accuracy_from_mae(mae) if err_count else float("nan")}
+    table = result.drop(columns=['_key', '_input_hash']).sort_values('Desync_Angle_Deg')
+    return table, stats
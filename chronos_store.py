@@ -0,0 +1,211 @@
+import hashlib
+import io
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+# ==========================================================================================
+# SIMUREALITY: CHRONOS COLUMNAR STORE
+# Бенчмарки Chronos (~3450 изотопов) вместо CSV хранятся по версиям в колоночном виде:
+#   chronos_store/<version>/schema.json   - версия схемы, имена колонок (Unicode), типы
+#   chronos_store/<version>/cNNN.npy      - одна колонка = один .npy (mmap, без парсинга)
+# Имена колонок вроде "ΔK Debt (MeV)" или "Log10(T_1/2)" живут только в schema.json,
+# файлы колонок нумеруются, поэтому "/" и не-ASCII в именах файловой системе не мешают.
+# ==========================================================================================
+
+CHRONOS_SCHEMA = 1
+STORE_DIR = os.environ.get("SIMUREALITY_CHRONOS", "chronos_store")
+
+
+def _store(store_dir):
+    return store_dir or STORE_DIR
+
+
+def _version_dir(version, store_dir=None):
+    safe = str(version).replace(os.sep, "_").replace("/", "_")
+    return os.path.join(_store(store_dir), safe)
+
+
+def _column_array(series):
+    """Колонка DataFrame -> (типизированный массив, маска пропусков или None, kind)."""
+    if pd.api.types.is_bool_dtype(series):
+        return series.to_numpy(dtype=bool), None, "bool"
+    if pd.api.types.is_integer_dtype(series):
+        return series.to_numpy(dtype=np.int64), None, "int"
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan), None, "float"
+    missing = series.isna().to_numpy()
+    values = series.astype(object).where(~missing, "").astype(str).to_numpy(dtype=str)
+    return values, (missing if missing.any() else None), "str"
+
+
+def frame_digest(df):
+    """SHA-256 содержимого таблицы (имена, типы и значения колонок)."""
+    h = hashlib.sha256()
+    for name in df.columns:
+        values, missing, kind = _column_array(df[name])
+        h.update(f"{name}\0{kind}\0".encode("utf-8"))
+        h.update(np.ascontiguousarray(values).tobytes())
+        if missing is not None:
+            h.update(missing.tobytes())
+    return h.hexdigest()
+
+
+def read_schema(version, store_dir=None):
+    path = os.path.join(_version_dir(version, store_dir), "schema.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            schema = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return schema if schema.get("schema") == CHRONOS_SCHEMA else None
+
+
+def write_benchmark(df, version, source=None, meta=None, store_dir=None):
+    """
+    Пишет таблицу как версию version. Запись атомарная: колонки собираются во временном
+    каталоге и подменяют старую версию одним rename. Если содержимое не изменилось,
+    диск не трогается. Возвращает digest записанной таблицы (None, если диск недоступен).
+    """
+    digest = frame_digest(df)
+    current = read_schema(version, store_dir)
+    if current is not None and current.get("digest") == digest:
+        return digest
+
+    target = _version_dir(version, store_dir)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_store(store_dir), exist_ok=True)
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        schema = _write_columns(df, tmp)
+        schema.update({"version": str(version), "digest": digest, "source": source,
+                       "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "meta": meta or {}})
+        with open(os.path.join(tmp, "schema.json"), "w", encoding="utf-8") as f:
+            json.dump(schema, f, ensure_ascii=False, indent=1)
+
+        old = f"{target}.{os.getpid()}.old"
+        if os.path.exists(target):
+            os.replace(target, old)
+        os.replace(tmp, target)
+        shutil.rmtree(old, ignore_errors=True)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        return None  # read-only FS: инструмент работает дальше без хранилища
+    return digest
+
+
+def _write_columns(df, root):
+    columns = []
+    for i, name in enumerate(df.columns):
+        values, missing, kind = _column_array(df[name])
+        entry = {"name": str(name), "kind": kind, "dtype": values.dtype.str, "file": f"c{i:03d}.npy"}
+        np.save(os.path.join(root, entry["file"]), values)
+        if missing is not None:
+            entry["mask"] = f"c{i:03d}.mask.npy"
+            np.save(os.path.join(root, entry["mask"]), missing)
+        columns.append(entry)
+    return {"schema": CHRONOS_SCHEMA, "rows": int(len(df)), "columns": columns}
+
+
+def read_columns(version, columns=None, store_dir=None):
+    """{имя: массив} без копирования (np.load mmap). Строки с пропусками - masked arrays."""
+    schema = read_schema(version, store_dir)
+    if schema is None:
+        raise KeyError(f"Chronos version not found: {version}")
+    root = _version_dir(version, store_dir)
+    wanted = None if columns is None else set(columns)
+    out = {}
+    for entry in schema["columns"]:
+        if wanted is not None and entry["name"] not in wanted:
+            continue
+        values = np.load(os.path.join(root, entry["file"]), mmap_mode="r")
+        if "mask" in entry:
+            values = np.ma.masked_array(values, np.load(os.path.join(root, entry["mask"])))
+        out[entry["name"]] = values
+    return out
+
+
+def read_benchmark(version, columns=None, store_dir=None):
+    """Версия как DataFrame (порядок колонок - как при записи)."""
+    data = {}
+    for name, values in read_columns(version, columns, store_dir).items():
+        if isinstance(values, np.ma.MaskedArray):
+            data[name] = pd.Series(values.data).where(~values.mask)
+        else:
+            data[name] = values
+    return pd.DataFrame(data)
+
+
+def list_versions(store_dir=None):
+    """Сводка всех версий в хранилище: строки, колонки, источник, время записи."""
+    rows = []
+    root = _store(store_dir)
+    if os.path.isdir(root):
+        for name in sorted(os.listdir(root)):
+            schema = read_schema(name, store_dir)
+            if schema is None:
+                continue
+            rows.append({"Version": schema["version"], "Rows": schema["rows"],
+                         "Columns": len(schema["columns"]), "Source": schema.get("source"),
+                         "Created": schema.get("created"), "Digest": schema["digest"][:12]})
+    return pd.DataFrame(rows, columns=["Version", "Rows", "Columns", "Source", "Created", "Digest"])
+
+
+def compare_versions(versions, columns=("ΔK Debt (MeV)",), on=("Z", "A"), store_dir=None):
+    """Версии бок о бок: одна строка на (Z, A), колонки "<колонка> [<версия>]"."""
+    merged = None
+    for version in versions:
+        part = read_benchmark(version, list(on) + list(columns), store_dir)
+        part = part.rename(columns={c: f"{c} [{version}]" for c in columns})
+        merged = part if merged is None else merged.merge(part, on=list(on), how="outer")
+    return merged
+
+
+# --- ИМПОРТ CSV: каждый исходный файл парсится один раз, дальше читается колонками ---
+
+def _csv_version(name, digest):
+    return f"csv-{os.path.basename(str(name))}-{digest[:12]}"
+
+
+def import_csv(source, store_dir=None):
+    """
+    CSV (путь или загруженный в Streamlit файл) -> версия хранилища. Ключ - SHA-256 байтов
+    файла, поэтому повторная загрузка того же файла не парсит текст. Возвращает имя версии.
+    """
+    if hasattr(source, "getvalue"):
+        raw, name = source.getvalue(), getattr(source, "name", "upload.csv")
+    else:
+        with open(source, "rb") as f:
+            raw = f.read()
+        name = source
+    version = _csv_version(name, hashlib.sha256(raw).hexdigest())
+    if read_schema(version, store_dir) is None:
+        df = pd.read_csv(io.BytesIO(raw), encoding="utf-8-sig")
+        if write_benchmark(df, version, source=os.path.basename(str(name)), store_dir=store_dir) is None:
+            return df  # read-only FS: отдаем распарсенную таблицу без кеша
+    return version
+
+
+def load_benchmark(*sources, store_dir=None):
+    """
+    Первая доступная таблица из sources: имя версии в хранилище, путь к CSV или загруженный
+    файл. CSV импортируются в хранилище при первом чтении. None, если ничего не найдено.
+    """
+    for source in sources:
+        if source is None:
+            continue
+        if hasattr(source, "getvalue") or str(source).lower().endswith(".csv"):
+            if not hasattr(source, "getvalue") and not os.path.exists(source):
+                continue
+            version = import_csv(source, store_dir)
+            if isinstance(version, pd.DataFrame):
+                return version
+            return read_benchmark(version, store_dir=store_dir)
+        if read_schema(source, store_dir) is not None:
+            return read_benchmark(source, store_dir=store_dir)
+    return None
@@ -0,0 +1,261 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from lazy_import import lazy_module
+from nuclear_data import CACHE_DIR
+
+Chem = lazy_module("rdkit.Chem")
+AllChem = lazy_module("rdkit.Chem.AllChem")
+Geometry = lazy_module("rdkit.Geometry")
+
+# ==========================================================================================
+# SIMUREALITY: CONFORMER CACHE (EMBED ONCE, REUSE EVERYWHERE)
+# Молекулярные дашборды на каждом вызове делают AddHs -> EmbedMolecule(randomSeed=42) ->
+# MMFFOptimizeMolecule, и это 95% времени одного тика ΣK. Геометрия зависит только от
+# графа и сида, поэтому кешируется по (канонический SMILES, сид):
+#   - память процесса: OrderedDict на MEMORY_ENTRIES молекул;
+#   - диск: одна SQLite-база в кеше (WAL, общая для всех процессов сервера), координаты -
+#     сырые float64 (n, 3) в BLOB, порядок атомов - канонический AddHs(MolFromSmiles(can));
+#   - размер базы ограничен SIMUREALITY_CONFORMER_MB, вытесняются давно не читанные (LRU).
+# Streamlit гоняет каждую сессию и каждый rerun в своем потоке: соединение одно на процесс
+# (check_same_thread=False), а все обращения к базе и к памяти идут под _LOCK.
+# Неудачный embed тоже кешируется: хранится 2D-раскладка (Compute2DCoords + MMFF), ее берут
+# только вызовы с fallback_2d=True, остальные получают None, как и раньше.
+# Координаты переносятся на порядок атомов вызывающего кода через _smilesAtomOutputOrder,
+# поэтому для канонического входа результат совпадает с прямым embed бит в бит.
+# ==========================================================================================
+
+CONFORMER_SCHEMA = 1
+SEED = 42
+MEMORY_ENTRIES = 4096
+CONFORMER_LIMIT_MB = float(os.environ.get("SIMUREALITY_CONFORMER_MB", 256))
+EVICT_EVERY = 256               # проверка лимита раз в столько записей
+
+STATUS_3D = "3d"
+STATUS_2D = "2d"                # embed не сошелся, координаты - 2D-раскладка
+
+_MEMORY = OrderedDict()
+_DB = {}                        # (pid, path) -> соединение; после fork открывается заново
+_LOCK = threading.RLock()       # _MEMORY, _DB, STATS и все запросы к соединениям
+STATS = {"memory": 0, "disk": 0, "embedded": 0}
+_WRITES = 0
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS conformers (
+    key TEXT PRIMARY KEY, smiles TEXT NOT NULL, seed INTEGER NOT NULL,
+    status TEXT NOT NULL, n_atoms INTEGER NOT NULL, coords BLOB NOT NULL,
+    bytes INTEGER NOT NULL, last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS conformers_lru ON conformers (last_used);
+"""
+
+
+def conformer_key(canonical, seed=SEED):
+    return f"v{CONFORMER_SCHEMA}:{int(seed)}:{canonical}"
+
+
+def _db_path(cache_dir=None):
+    return os.path.join(cache_dir or CACHE_DIR, "conformers.sqlite")
+
+
+def _connect(cache_dir=None):
+    """Соединение с базой конформеров или None (read-only FS: работаем только из памяти)."""
+    path = _db_path(cache_dir)
+    slot = (os.getpid(), os.path.abspath(path))
+    with _LOCK:
+        if slot not in _DB:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                db = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                db.executescript(_SCHEMA_SQL)
+            except (OSError, sqlite3.Error):
+                db = None
+            _DB[slot] = db
+        return _DB[slot]
+
+
+def _remember(key, entry):
+    with _LOCK:
+        _MEMORY[key] = entry
+        _MEMORY.move_to_end(key)
+        while len(_MEMORY) > MEMORY_ENTRIES:
+            _MEMORY.popitem(last=False)
+
+
+def _embed(canonical, seed):
+    """(статус, координаты) канонической молекулы с водородами: тот же конвейер, что в дашбордах."""
+    mol_h = Chem.AddHs(Chem.MolFromSmiles(canonical))
+    status = STATUS_3D
+    if AllChem.EmbedMolecule(mol_h, randomSeed=int(seed)) != 0:
+        AllChem.Compute2DCoords(mol_h)
+        status = STATUS_2D
+    try:
+        AllChem.MMFFOptimizeMolecule(mol_h)
+    except Exception:
+        pass  # нет параметров MMFF - остаются координаты embed
+    return status, np.array(mol_h.GetConformer().GetPositions(), dtype=np.float64)
+
+
+def _load(db, key):
+    try:
+        with _LOCK:
+            row = db.execute("SELECT status, n_atoms, coords FROM conformers WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE conformers SET last_used = ? WHERE key = ?", (time.time(), key))
+    except sqlite3.Error:
+        return None
+    status, n_atoms, blob = row
+    return status, np.frombuffer(blob, dtype="<f8").reshape(n_atoms, 3)
+
+
+def _store(db, key, canonical, seed, status, coords):
+    global _WRITES
+    blob = np.ascontiguousarray(coords, dtype="<f8").tobytes()
+    with _LOCK:
+        try:
+            db.execute("INSERT OR REPLACE INTO conformers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                       (key, canonical, int(seed), status, len(coords), blob,
+                        len(blob) + len(canonical), time.time()))
+        except sqlite3.Error:
+            return
+        _WRITES += 1
+        if _WRITES % EVICT_EVERY == 0:
+            evict_conformers(db=db)
+
+
+def evict_conformers(limit_mb=None, cache_dir=None, db=None):
+    """Удаляет самые давно читанные конформеры, пока база не уложится в limit_mb. Возвращает число."""
+    db = db or _connect(cache_dir)
+    if db is None:
+        return 0
+    limit = (CONFORMER_LIMIT_MB if limit_mb is None else limit_mb) * (1 << 20)
+    try:
+        with _LOCK:
+            total = db.execute("SELECT COALESCE(SUM(bytes), 0) FROM conformers").fetchone()[0]
+            if total <= limit:
+                return 0
+            victims = []
+            for key, size in db.execute("SELECT key, bytes FROM conformers ORDER BY last_used"):
+                if total <= limit:
+                    break
+                victims.append((key,))
+                total -= size
+            db.executemany("DELETE FROM conformers WHERE key = ?", victims)
+    except sqlite3.Error:
+        return 0
+    return len(victims)
+
+
+def conformer_stats(cache_dir=None):
+    """Попадания (память / диск), новые embed и размер базы."""
+    with _LOCK:
+        stats = dict(STATS, memory_entries=len(_MEMORY), disk_entries=0, disk_bytes=0)
+        db = _connect(cache_dir)
+        if db is not None:
+            try:
+                stats["disk_entries"], stats["disk_bytes"] = db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM conformers").fetchone()
+            except sqlite3.Error:
+                pass
+    return stats
+
+
+def canonical_conformer(canonical, seed=SEED, cache_dir=None):
+    """(статус, координаты (n, 3)) для канонического SMILES: память -> диск -> embed."""
+    key = conformer_key(canonical, seed)
+    with _LOCK:  # get + move_to_end атомарно: чужой _remember не вытеснит ключ между ними
+        entry = _MEMORY.get(key)
+        if entry is not None:
+            _MEMORY.move_to_end(key)
+            STATS["memory"] += 1
+            return entry
+
+    db = _connect(cache_dir)
+    entry = _load(db, key) if db is not None else None
+    if entry is not None:
+        with _LOCK: STATS["disk"] += 1
+    else:
+        entry = _embed(canonical, seed)  # embed - вне блокировки, остальные потоки не ждут
+        with _LOCK: STATS["embedded"] += 1
+        if db is not None:
+            _store(db, key, canonical, seed, *entry)
+    _remember(key, entry)
+    return entry
+
+
+def _atom_map(mol, mol_h, canon_h):
+    """
+    Индекс атома канонической молекулы с H -> индекс в mol_h вызывающего кода.
+    Тяжелые атомы - по порядку вывода канонического SMILES, добавленные водороды -
+    по родительскому атому в порядке появления. None, если графы не сошлись.
+    """
+    order = list(mol.GetPropsAsDict(True, True).get("_smilesAtomOutputOrder", ()))
+    n = mol.GetNumAtoms()
+    if len(order) != n or canon_h.GetNumAtoms() != mol_h.GetNumAtoms():
+        return None
+    mapping = np.empty(mol_h.GetNumAtoms(), dtype=np.int64)
+    mapping[:n] = order
+
+    def added_h(m):
+        groups = {}
+        for atom in m.GetAtoms():
+            if atom.GetIdx() >= n:
+                groups.setdefault(atom.GetNeighbors()[0].GetIdx(), []).append(atom.GetIdx())
+        return groups
+
+    caller_h = added_h(mol_h)
+    for parent, hs in added_h(canon_h).items():
+        mine = caller_h.get(order[parent], [])
+        if len(mine) != len(hs):
+            return None
+        mapping[hs] = mine
+    if any(canon_h.GetAtomWithIdx(i).GetAtomicNum() != mol_h.GetAtomWithIdx(int(j)).GetAtomicNum()
+           for i, j in enumerate(mapping)):
+        return None
+    return mapping
+
+
+def embedded_molecule(mol, seed=SEED, fallback_2d=False, cache_dir=None):
+    """
+    Chem.AddHs(mol) с оптимизированным MMFF конформером из кеша (mol - Mol или SMILES).
+    None, если SMILES невалиден или embed не сошелся и fallback_2d=False.
+    """
+    if isinstance(mol, str):
+        mol = Chem.MolFromSmiles(mol)
+    if mol is None:
+        return None
+    canonical = Chem.MolToSmiles(mol)
+    status, coords = canonical_conformer(canonical, seed, cache_dir)
+    if status != STATUS_3D and not fallback_2d:
+        return None
+
+    mol_h = Chem.AddHs(mol)
+    mapping = _atom_map(mol, mol_h, Chem.AddHs(Chem.MolFromSmiles(canonical)))
+    if mapping is None:
+        # Граф не сопоставился (экзотическая валентность) - embed напрямую, без кеша
+        if AllChem.EmbedMolecule(mol_h, randomSeed=int(seed)) != 0:
+            if not fallback_2d:
+                return None
+            AllChem.Compute2DCoords(mol_h)
+        try:
+            AllChem.MMFFOptimizeMolecule(mol_h)
+        except Exception:
+            pass
+        return mol_h
+
+    positions = np.empty_like(coords)
+    positions[mapping] = coords
+    conf = Chem.Conformer(mol_h.GetNumAtoms())
+    for i, (x, y, z) in enumerate(positions):
+        conf.SetAtomPosition(i, Geometry.Point3D(float(x), float(y), float(z)))
+    conf.Set3D(status == STATUS_3D)
+    mol_h.AddConformer(conf, assignId=True)
+    return mol_h
@@ -0,0 +1,159 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from nuclear_data import cached_array
+from topological_core import JITTER_POWER, topological_profit
+
+# ==========================================================================================
+# SIMUREALITY: FISSION YIELD ENGINE (PARALLEL FRAGMENT LATTICE SCANNER)
+# Разлом родителя (Z, N) -> (Z1, N1) + (Z2, N2) + free_n нейтронов, как в run_fission_scan:
+# Z1 = 30..Z/2, free_n = 0..7, N1 в [1.2*Z1, 1.6*Z1), N2 в [1.2*Z2, 1.6*Z2].
+# Профит фрагментов читается из таблицы (Z, N) на диске (mmap, общая для всех воркеров);
+# решетка фрагментов одного Z1 считается одним срезом, а Z1 с верхней границей Q ниже
+# текущего лидера не считаются вовсе.
+# ==========================================================================================
+
+FISSION_TABLE_VERSION = 1
+TABLE_BLOCK = 64        # размеры таблицы округляются вверх, чтобы сканы делили один файл
+Z1_MIN = 30
+FREE_NEUTRONS = 8       # free_n = 0..7
+N_RATIO = (1.2, 1.6)
+PARENT_BARRIER = 22.0   # BE_parent_theo = профит родителя - 22 МэВ
+
+
+def _round_up(k):
+    return max(TABLE_BLOCK, -(-int(k + 1) // TABLE_BLOCK) * TABLE_BLOCK)
+
+
+def energy_table(z_max, n_max, power=JITTER_POWER, cache_dir=None):
+    """Таблица calculate_topological_profit[Z, N] (Z <= z_max, N <= n_max) из дискового кеша."""
+    z_size, n_size = _round_up(z_max), _round_up(n_max)
+    key = f"topo-profit-v{FISSION_TABLE_VERSION}-p{power}-{z_size}x{n_size}"
+
+    def build():
+        Z, N = np.meshgrid(np.arange(z_size), np.arange(n_size), indexing="ij")
+        return topological_profit(Z, N, power)
+
+    return cached_array(key, build, cache_dir)
+
+
+def _n_window(Z):
+    """[lo, hi] допустимых N фрагмента: int(1.2 Z) <= N <= int(1.6 Z)."""
+    return int(Z * N_RATIO[0]), int(Z * N_RATIO[1])
+
+
+def _z1_block(table, Z_parent, N_parent, Z1):
+    """
+    Q для всех (free_n, N1) при данном Z1: матрица (FREE_NEUTRONS, len(N1)), -inf вне окна N2.
+    Возвращает (N1, Q) без вычета профита родителя.
+    """
+    Z2 = Z_parent - Z1
+    lo1, hi1 = _n_window(Z1)
+    lo2, hi2 = _n_window(Z2)
+    # Верхняя граница N1 исключена, как в range(); N1 > N_parent дали бы N2 < 0
+    N1 = np.arange(lo1, min(hi1, N_parent + 1))
+    N2 = N_parent - np.arange(FREE_NEUTRONS)[:, None] - N1[None, :]
+    valid = (N2 >= lo2) & (N2 <= hi2)
+    Q = table[Z1, N1][None, :] + table[Z2, np.clip(N2, 0, N_parent)]
+    return N1, np.where(valid, Q, -np.inf)
+
+
+def _z1_bound(table, Z_parent, N_parent, Z1):
+    """Верхняя граница Q для Z1: лучший N1 плюс лучший N2 независимо друг от друга."""
+    Z2 = Z_parent - Z1
+    lo1, hi1 = _n_window(Z1)
+    lo2, hi2 = _n_window(Z2)
+    hi1, hi2 = min(hi1, N_parent + 1), min(hi2, N_parent)
+    if hi1 <= lo1 or hi2 < lo2:
+        return -np.inf
+    return table[Z1, lo1:hi1].max() + table[Z2, lo2:hi2 + 1].max()
+
+
+def fragment_lattice(table, Z_parent, N_parent):
+    """
+    Лучший разлом для каждого Z1 (как строки run_fission_scan).
+    Список (Z1, N1, Z2, N2, free_n, Q); при пустой решетке Q = -inf и N1 = N2 = free_n = 0.
+    """
+    BE_parent = table[Z_parent, N_parent] - PARENT_BARRIER
+    rows = []
+    for Z1 in range(Z1_MIN, Z_parent // 2 + 1):
+        N1, Q = _z1_block(table, Z_parent, N_parent, Z1)
+        if Q.size == 0 or not np.isfinite(Q).any():
+            rows.append((Z1, 0, Z_parent - Z1, 0, 0, -np.inf))
+            continue
+        # argmax берет первый максимум в порядке (free_n, N1) - тот же, что у вложенных циклов
+        free_n, i = np.unravel_index(np.argmax(Q), Q.shape)
+        n1 = int(N1[i])
+        rows.append((Z1, n1, Z_parent - Z1, N_parent - int(free_n) - n1, int(free_n), float(Q[free_n, i] - BE_parent)))
+    return rows
+
+
+def best_fission(table, Z_parent, N_parent):
+    """
+    Победитель разлома (Z1, N1, Z2, N2, free_n, Q) или None. Z1 перебираются по убыванию
+    верхней границы Q; как только граница ниже лидера, остальные Z1 отбрасываются.
+    """
+    BE_parent = table[Z_parent, N_parent] - PARENT_BARRIER
+    z1_range = range(Z1_MIN, Z_parent // 2 + 1)
+    bounds = [(_z1_bound(table, Z_parent, N_parent, Z1), Z1) for Z1 in z1_range]
+    bounds.sort(key=lambda b: (-b[0], b[1]))
+
+    best, best_key = None, None
+    for bound, Z1 in bounds:
+        if best is not None and bound - BE_parent < best[5]:
+            break
+        if not np.isfinite(bound):
+            break
+        N1, Q = _z1_block(table, Z_parent, N_parent, Z1)
+        if Q.size == 0 or not np.isfinite(Q).any():
+            continue
+        free_n, i = np.unravel_index(np.argmax(Q), Q.shape)
+        q = float(Q[free_n, i] - BE_parent)
+        key = (Z1, int(free_n), int(N1[i]))  # порядок перебора оригинала: при равенстве ранний
+        if best is None or q > best[5] or (q == best[5] and key < best_key):
+            n1 = int(N1[i])
+            best = (Z1, n1, Z_parent - Z1, N_parent - int(free_n) - n1, int(free_n), q)
+            best_key = key
+    return best
+
+
+# --- ПУЛ ПРОЦЕССОВ: каждый воркер открывает ту же таблицу через mmap ---
+# Воркеры стартуют через spawn: fork из многопоточного сервера Streamlit копирует процесс
+# вместе с блокировками чужих потоков. Дашборды передают небольшое явное workers.
+_WORKER_TABLE = None
+
+
+def _init_worker(z_max, n_max, power, cache_dir):
+    global _WORKER_TABLE
+    _WORKER_TABLE = energy_table(z_max, n_max, power, cache_dir)
+
+
+def _scan_parent(parent):
+    return best_fission(_WORKER_TABLE, *parent)
+
+
+def scan_parents(parents, power=JITTER_POWER, workers=None, chunksize=8, cache_dir=None):
+    """
+    Победители разлома для списка родителей [(Z, N), ...] в исходном порядке.
+    Генератор: результаты приходят по мере готовности (для прогресс-баров).
+    workers=None - все ядра; 1 - без пула.
+    """
+    parents = [(int(Z), int(N)) for Z, N in parents]
+    if not parents:
+        return
+    z_max = max(Z for Z, _ in parents)
+    n_max = max(N for _, N in parents)
+    table = energy_table(z_max, n_max, power, cache_dir)  # строим до старта пула
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(parents) < 2 * chunksize:
+        for parent in parents:
+            yield best_fission(table, *parent)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(z_max, n_max, power, cache_dir)) as pool:
+        yield from pool.map(_scan_parent, parents, chunksize=chunksize)
@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+
+from chronos_pipeline import DEBT, GC_MODEL, gc_design, row_fingerprints, row_keys
+from chronos_store import read_benchmark, read_schema, write_benchmark
+
+# ==========================================================================================
+# SIMUREALITY: GC TIMER REFIT (INCREMENTAL NORMAL EQUATIONS)
+# log10(T) = T_base + Z_imp * Z + E_pow * sqrt(ΔK) + P_lock * Unpaired_Ports
+# Вместо LinearRegression на каждом запуске хранятся достаточные статистики XᵀX, Xᵀy, yᵀy
+# в ячейках (Z, число неспаренных портов 0..2). Любой регион (тяжелые/легкие при любом
+# пороге Z, четные/нечетные) - сумма ячеек через префиксные суммы по Z, решение -
+# система 3x3. Новые и измененные изотопы добавляются/вычитаются ранговыми обновлениями.
+# Опубликованная модель лежит в хранилище Chronos ("gc_model") и читается дашбордами.
+# ==========================================================================================
+
+FIT_SCHEMA = 1
+FEATURES = ("Z", "sqrt_dK", "Unpaired_Ports")
+COEFFICIENTS = ("T_base", "Z_imp", "E_pow", "P_lock")
+MIN_LOG_T = -25         # нижняя граница log10(T): отсекает резонансы
+PORTS = 3               # Unpaired_Ports = Z % 2 + N % 2
+Z_CELLS = 128
+MODEL_VERSION = "gc_model"
+
+PARITY = {"all": (0, 1, 2), "even": (0,), "odd": (1, 2)}
+
+
+def gc_features(df):
+    """Строки, на которых учится таймер (нестабильные, log10(T) > -25), и их признаки."""
+    rows = df[(df['Status'] == 'Unstable') & (df['Log10(T_1/2)'] > MIN_LOG_T) & df[DEBT].notna()]
+    X = gc_design(rows)
+    return pd.DataFrame({
+        "key": row_keys(rows), "hash": row_fingerprints(rows),
+        "Z": X["Z"].to_numpy(), "Unpaired_Ports": X["Unpaired_Ports"].to_numpy(),
+        "sqrt_dK": X["sqrt_dK"].to_numpy(),
+        "logT": rows['Log10(T_1/2)'].to_numpy(dtype=np.float64),
+    })
+
+
+class GCStats:
+    """XᵀX (с колонкой единиц), Xᵀy и yᵀy по ячейкам (Z, порты)."""
+
+    def __init__(self, z_cells=Z_CELLS):
+        k = len(FEATURES) + 1
+        self.xtx = np.zeros((z_cells, PORTS, k, k))
+        self.xty = np.zeros((z_cells, PORTS, k))
+        self.yty = np.zeros((z_cells, PORTS))
+        self._prefix = None
+
+    @property
+    def count(self):
+        return int(round(self.xtx[..., 0, 0].sum()))
+
+    def _grow(self, z_top):
+        if z_top < len(self.yty):
+            return
+        pad = max(z_top + 1, 2 * len(self.yty)) - len(self.yty)
+        self.xtx = np.concatenate([self.xtx, np.zeros((pad,) + self.xtx.shape[1:])])
+        self.xty = np.concatenate([self.xty, np.zeros((pad,) + self.xty.shape[1:])])
+        self.yty = np.concatenate([self.yty, np.zeros((pad,) + self.yty.shape[1:])])
+
+    def update(self, rows, sign=1.0):
+        """Ранговое обновление: sign=+1 добавляет строки gc_features, -1 вычитает."""
+        if len(rows) == 0:
+            return
+        Z = rows["Z"].to_numpy(dtype=np.intp)
+        ports = rows["Unpaired_Ports"].to_numpy(dtype=np.intp)
+        self._grow(int(Z.max()))
+        X = np.column_stack([np.ones(len(rows))] + [rows[f].to_numpy(dtype=np.float64) for f in FEATURES])
+        y = rows["logT"].to_numpy(dtype=np.float64)
+        np.add.at(self.xtx, (Z, ports), sign * X[:, :, None] * X[:, None, :])
+        np.add.at(self.xty, (Z, ports), sign * X * y[:, None])
+        np.add.at(self.yty, (Z, ports), sign * y * y)
+        self._prefix = None
+
+    def add(self, rows):
+        self.update(rows, +1.0)
+
+    def remove(self, rows):
+        self.update(rows, -1.0)
+
+    def region(self, z_min=0, z_max=None, parity="all"):
+        """Суммы (XᵀX, Xᵀy, yᵀy) региона z_min <= Z <= z_max с заданной четностью."""
+        if self._prefix is None:
+            self._prefix = [np.concatenate([np.zeros((1,) + a.shape[1:]), np.cumsum(a, axis=0)])
+                            for a in (self.xtx, self.xty, self.yty)]
+        top = len(self.yty) if z_max is None else min(int(z_max) + 1, len(self.yty))
+        lo = min(max(int(z_min), 0), top)
+        ports = list(PARITY[parity])
+        return tuple((p[top] - p[lo])[ports].sum(axis=0) for p in self._prefix)
+
+    def fit(self, z_min=0, z_max=None, parity="all"):
+        """
+        МНК региона по нормальным уравнениям (центрированным, как LinearRegression).
+        Признак-константа в регионе (например, порты при parity="even") получает 0.
+        """
+        xtx, xty, yty = self.region(z_min, z_max, parity)
+        n = xtx[0, 0]
+        if n < 1:
+            return None
+        mean_x, mean_y = xtx[0, 1:] / n, xty[0] / n
+        sxx = xtx[1:, 1:] - n * np.outer(mean_x, mean_x)
+        sxy = xty[1:] - n * mean_x * mean_y
+        beta = np.linalg.lstsq(sxx, sxy, rcond=None)[0]
+        sst = yty - n * mean_y ** 2
+        coefs = [mean_y - mean_x @ beta] + list(beta)
+        model = {name: float(c) for name, c in zip(COEFFICIENTS, coefs)}
+        model.update({"n": int(round(n)), "r2": float(beta @ sxy / sst) if sst > 0 else float("nan")})
+        return model
+
+    def to_frame(self):
+        k = self.xtx.shape[-1]
+        Z, ports = np.indices(self.yty.shape)
+        data = {"Z": Z.ravel(), "Unpaired_Ports": ports.ravel(), "yty": self.yty.ravel()}
+        data.update({f"xty{i}": self.xty[..., i].ravel() for i in range(k)})
+        data.update({f"xtx{i}{j}": self.xtx[..., i, j].ravel() for i in range(k) for j in range(k)})
+        return pd.DataFrame(data)
+
+    @classmethod
+    def from_frame(cls, df):
+        stats = cls(int(df["Z"].max()) + 1)
+        k = stats.xtx.shape[-1]
+        idx = (df["Z"].to_numpy(dtype=np.intp), df["Unpaired_Ports"].to_numpy(dtype=np.intp))
+        stats.yty[idx] = df["yty"].to_numpy()
+        for i in range(k):
+            stats.xty[idx + (i,)] = df[f"xty{i}"].to_numpy()
+            for j in range(k):
+                stats.xtx[idx + (i, j)] = df[f"xtx{i}{j}"].to_numpy()
+        return stats
+
+
+def sync_stats(df, name, store_dir=None):
+    """
+    Статистики датасета name, приведенные к таблице df. Строки, чьи входы не менялись с
+    прошлого вызова, не трогаются; ушедшие вычитаются, новые добавляются.
+    Возвращает (GCStats, {"added", "removed", "rows"}).
+    """
+    rows_version, cells_version = f"gc_fit.{name}.rows", f"gc_fit.{name}.cells"
+    rows = gc_features(df)
+    rows_schema = read_schema(rows_version, store_dir)
+    cells_schema = read_schema(cells_version, store_dir)
+    if (rows_schema is not None and cells_schema is not None
+            and cells_schema["meta"].get("fit_schema") == FIT_SCHEMA
+            and cells_schema["meta"].get("rows_digest") == rows_schema["digest"]):
+        stats = GCStats.from_frame(read_benchmark(cells_version, store_dir=store_dir))
+        prev = read_benchmark(rows_version, store_dir=store_dir)
+    else:
+        stats, prev = GCStats(), rows.iloc[:0]
+
+    prev_hash = pd.Series(prev["hash"].to_numpy(), index=prev["key"].to_numpy())
+    matched = rows["key"].map(prev_hash)
+    unchanged = matched.notna().to_numpy() & (matched.to_numpy() == rows["hash"].to_numpy())
+    retired = ~prev["key"].isin(rows.loc[unchanged, "key"])
+
+    stats.remove(prev[retired])
+    stats.add(rows[~unchanged])
+
+    if retired.any() or (~unchanged).any():
+        digest = write_benchmark(rows, rows_version, source="gc_fitter", store_dir=store_dir)
+        if digest is not None:
+            write_benchmark(stats.to_frame(), cells_version, source="gc_fitter",
+                            meta={"fit_schema": FIT_SCHEMA, "rows_digest": digest}, store_dir=store_dir)
+    return stats, {"added": int((~unchanged).sum()), "removed": int(retired.sum()), "rows": len(rows)}
+
+
+def publish_model(fit, region, source=None, store_dir=None):
+    """Коэффициенты fit становятся живой моделью GC для всех дашбордов."""
+    model = {name: round(fit[name], 4) for name in COEFFICIENTS}
+    frame = pd.DataFrame([{**model, "n": fit["n"], "r2": fit["r2"]}])
+    write_benchmark(frame, MODEL_VERSION, source=source,
+                    meta={"model": model, "region": region, "n": fit["n"], "r2": fit["r2"]}, store_dir=store_dir)
+    return model
+
+
+def live_model(store_dir=None):
+    """Опубликованная модель GC или литералы Chronos V10, если публикаций не было."""
+    schema = read_schema(MODEL_VERSION, store_dir)
+    if schema is None or "model" not in schema.get("meta", {}):
+        return dict(GC_MODEL)
+    return dict(schema["meta"]["model"])
@@ -0,0 +1,179 @@
+import math
+
+import numpy as np
+
+# ==========================================================================================
+# SIMUREALITY: CHRONOS ENGINE V8.0 (CORE+HALO TOPOLOGY)
+# Скалярный calculate_energy + пакетный calculate_energy_batch для всей карты нуклидов.
+# ==========================================================================================
+
+SHELLS = (2, 8, 20, 28, 50, 82, 126, 184)
+
+# Таблица расстояний до ближайшей оболочки для 0..184. Ниже 0 и выше 184 расстояние
+# растет линейно, поэтому таблицу достаточно дополнить хвостом (см. shell_distance).
+_SHELL_LUT = np.min(np.abs(np.arange(SHELLS[-1] + 1)[:, None] - np.array(SHELLS)[None, :]), axis=1)
+
+
+def shell_distance(k):
+    """min(|k - m| for m in SHELLS) для целочисленного массива k."""
+    k = np.asarray(k, dtype=np.int64)
+    top = SHELLS[-1]
+    return _SHELL_LUT[np.clip(k, 0, top)] + np.maximum(0, -k) + np.maximum(0, k - top)
+
+
+class GridPhysicsEngine:
+    def __init__(self):
+        self.m_e = 0.511
+        self.PI = math.pi
+        self.gamma_1D = 2.0 / math.sqrt(3.0)
+        self.gamma_vol = self.gamma_1D ** (1.0/3.0)
+        self.gamma_sys = 1.0418
+        self.eta_fcc = self.PI / (3 * math.sqrt(2))
+        self.E_link = 4 * self.m_e * self.gamma_1D
+        self.E_alpha = 12 * self.E_link
+        self.a_V = 6 * self.E_link * self.gamma_sys
+        self.a_S = 14.5
+        self.a_C = self.eta_fcc / self.gamma_vol
+        self.a_Sym = 6 * self.E_link
+        self.delta = 12.0
+
+    def geometric_shell_penalty(self, Z, N):
+        shells = [2, 8, 20, 28, 50, 82, 126, 184]
+        dist_Z = min([abs(Z - m) for m in shells])
+        dist_N = min([abs(N - m) for m in shells])
+        K_DEFORM = (4 * (1/137.036)) / (self.PI**2 * self.gamma_sys)
+        if Z < 40: return 0
+        return K_DEFORM * (dist_Z * dist_N) * (dist_Z + dist_N)**0.8
+
+    def calculate_energy(self, Z, A):
+        N = A - Z
+
+        # --- ЛЕГКИЕ И СРЕДНИЕ ЯДРА: 3D-РЕНДЕР СЛОИСТОГО ГАЛО (CORE + HALO) ---
+        if Z <= 20:
+            core_Z = min(Z, N)
+            core_N = min(Z, N)
+            core_A = core_Z + core_N
+
+            # 1. Замораживаем идеальный Core (Якорь)
+            n_alpha = core_A // 4
+            rem = core_A % 4
+            links = 0 if n_alpha < 2 else 3 * n_alpha - 6
+            E_core = (n_alpha * self.E_alpha) + (links * self.E_link)
+            if rem == 2: E_core += self.E_link
+            if rem == 3:
+                E_core += 3.5 * self.E_link
+                if core_Z == 2: E_core -= self.a_C
+
+            # 2. Послойная сборка Нейтронного Гало
+            halo_n = abs(N - Z)
+            pairs = halo_n // 2
+            rem_odd = halo_n % 2
+
+            # Эмпирическая вместимость первого геометрического слоя (L1)
+            if Z <= 2: L1_cap = 0
+            elif Z <= 6: L1_cap = 1
+            elif Z <= 10: L1_cap = 3
+            else: L1_cap = 4
+
+            base_profit = 4.8 * self.E_link # Базовый профит линка гало (~11.3 МэВ)
+            E_halo = 0
+
+            for pair in range(1, pairs + 1):
+                if L1_cap == 0:
+                    profit = -1.5 # Водород/Гелий: мгновенный Drip Line
+                else:
+                    layer = ((pair - 1) // L1_cap) + 1
+                    if layer <= 3:
+                        profit = base_profit / layer # Гармонический спад 1/L
+                    else:
+                        profit = 0.0 # Обрыв связей (Kernel Panic)
+                E_halo += profit
+
+            if rem_odd:
+                if L1_cap == 0:
+                    E_halo -= 0.5
+                else:
+                    layer = (pairs // L1_cap) + 1
+                    E_halo += (base_profit / layer) * 0.45
+
+            return E_core + E_halo
+
+        # --- ТЯЖЕЛЫЕ ЯДРА: МАКРО-КРИСТАЛЛ (LIQUID DROP PROXY) ---
+        else:
+            E_vol = self.a_V * A
+            E_surf = self.a_S * (A**(2.0/3.0))
+            E_coul = self.a_C * (Z*(Z-1)) / (A**(1.0/3.0))
+            E_sym = self.a_Sym * ((N-Z)**2) / A
+
+            if Z % 2 == 0 and N % 2 == 0: E_pair = self.delta / (A**(0.5))
+            elif Z % 2 != 0 and N % 2 != 0: E_pair = -self.delta / (A**(0.5))
+            else: E_pair = 0
+
+            E_macro = E_vol - E_surf - E_coul - E_sym + E_pair
+            return E_macro - self.geometric_shell_penalty(Z, N)
+
+    # ======================================================================================
+    # ПАКЕТНЫЙ РЕЖИМ: ВСЯ КАРТА ЗА ОДИН ВЕКТОРНЫЙ ПРОХОД
+    # ======================================================================================
+
+    def _light_energy_batch(self, Z, N):
+        """Core + Halo для Z <= 20. Цикл по парам гало заменен замкнутой суммой по слоям."""
+        core = np.minimum(Z, N)
+        core_A = 2 * core
+        n_alpha = core_A // 4
+        rem = core_A % 4
+        links = np.where(n_alpha < 2, 0, 3 * n_alpha - 6)
+        E_core = n_alpha * self.E_alpha + links * self.E_link
+        E_core = E_core + np.where(rem == 2, self.E_link, 0.0)
+        E_core = E_core + np.where(rem == 3, 3.5 * self.E_link - np.where(core == 2, self.a_C, 0.0), 0.0)
+
+        halo_n = np.abs(N - Z)
+        pairs = halo_n // 2
+        rem_odd = halo_n % 2
+        L1_cap = np.select([Z <= 2, Z <= 6, Z <= 10], [0, 1, 3], default=4)
+        base_profit = 4.8 * self.E_link
+
+        # Пары в слое L: clip(pairs - (L-1)*cap, 0, cap); профит слоя base/L, слои > 3 пустые
+        E_halo = np.zeros(Z.shape, dtype=np.float64)
+        for layer in (1, 2, 3):
+            filled = np.clip(pairs - (layer - 1) * L1_cap, 0, L1_cap)
+            E_halo += filled * (base_profit / layer)
+
+        safe_cap = np.maximum(L1_cap, 1)
+        odd_profit = np.where(L1_cap == 0, -0.5, (base_profit / (pairs // safe_cap + 1)) * 0.45)
+        E_halo = np.where(L1_cap == 0, -1.5 * pairs, E_halo) + np.where(rem_odd == 1, odd_profit, 0.0)
+        return E_core + E_halo
+
+    def _heavy_energy_batch(self, Z, N):
+        A = (Z + N).astype(np.float64)
+        E_vol = self.a_V * A
+        E_surf = self.a_S * A ** (2.0 / 3.0)
+        E_coul = self.a_C * (Z * (Z - 1)) / A ** (1.0 / 3.0)
+        E_sym = self.a_Sym * ((N - Z) ** 2) / A
+
+        even_even = (Z % 2 == 0) & (N % 2 == 0)
+        odd_odd = (Z % 2 != 0) & (N % 2 != 0)
+        E_pair = np.select([even_even, odd_odd], [self.delta / A ** 0.5, -self.delta / A ** 0.5], default=0.0)
+
+        K_DEFORM = (4 * (1/137.036)) / (self.PI**2 * self.gamma_sys)
+        dist_Z = shell_distance(Z)
+        dist_N = shell_distance(N)
+        penalty = np.where(Z < 40, 0.0, K_DEFORM * (dist_Z * dist_N) * (dist_Z + dist_N) ** 0.8)
+        return E_vol - E_surf - E_coul - E_sym + E_pair - penalty
+
+    def calculate_energy_batch(self, Z, A):
+        """calculate_energy для массивов Z, A (любой формы). Возвращает float64 того же размера."""
+        Z, A = np.broadcast_arrays(np.asarray(Z, dtype=np.int64), np.asarray(A, dtype=np.int64))
+        N = A - Z
+        light = Z <= 20
+        out = np.empty(Z.shape, dtype=np.float64)
+        out[light] = self._light_energy_batch(Z[light], N[light])
+        heavy = ~light
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[heavy] = self._heavy_energy_batch(Z[heavy], N[heavy])
+        return out
+
+    def chart_energy(self, z_max=120, n_max=200):
+        """Энергия связи на полной решетке (z_max+1, n_max+1); индекс [Z, N]."""
+        Z, N = np.meshgrid(np.arange(z_max + 1), np.arange(n_max + 1), indexing="ij")
+        return self.calculate_energy_batch(Z, Z + N)
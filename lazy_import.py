@@ -0,0 +1,58 @@
+import importlib
+import sys
+import time
+import types
+
+# ==========================================================================================
+# SIMUREALITY: LAZY IMPORT LAYER (COLD-START DEFERRAL)
+# Тяжелые модули (plotly, scipy, sklearn, rdkit) подгружаются при первом обращении к
+# атрибуту, а не в шапке дашборда:
+#
+#   px = lazy_module("plotly.express")      # вместо import plotly.express as px
+#   Chem = lazy_module("rdkit.Chem")        # вместо from rdkit import Chem
+#
+# Streamlit выводит элементы по ходу выполнения скрипта, поэтому заголовок, метрики и
+# таблицы появляются до того, как дойдет очередь до графика; ветки за кнопками и
+# загрузчиками файлов не платят за импорт вовсе, пока их не откроют.
+# Фактические загрузки пишутся в IMPORT_LOG (модуль, секунды) для startup_benchmark.
+# ==========================================================================================
+
+IMPORT_LOG = []
+
+
+class LazyModule(types.ModuleType):
+    """Заглушка модуля: первый getattr импортирует настоящий модуль и копирует его словарь."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_target"]
+        if module is None:
+            t0 = time.perf_counter()
+            module = importlib.import_module(self.__name__)
+            IMPORT_LOG.append((self.__name__, time.perf_counter() - t0))
+            # дальше атрибуты читаются напрямую, без __getattr__
+            self.__dict__.update(module.__dict__)
+            self.__dict__["_lazy_target"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_target"] is not None else "deferred"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_module(name):
+    """Модуль name без импорта; уже загруженный модуль возвращается как есть."""
+    return sys.modules.get(name) or LazyModule(name)
+
+
+def is_loaded(module):
+    return not isinstance(module, LazyModule) or module.__dict__["_lazy_target"] is not None
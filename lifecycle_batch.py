@@ -0,0 +1,245 @@
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+try:
+    import fcntl
+except ImportError:  # Windows: без блокировки, прогоны разводит только ключ checkpoint
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+
+from bde_store import FILE_NAME, bde_molecules
+from lazy_import import lazy_module
+from lifecycle_engine import TEMPERATURE_GRID, compile_lifecycle
+from nuclear_data import CACHE_DIR
+
+nuclear_batch = lazy_module("nuclear_batch")   # write_output нужен только CLI, дашборду - нет
+
+# ==========================================================================================
+# SIMUREALITY: LIFECYCLE BATCH COMPILER (WHOLE bde-db2 STRESS TEST)
+# Стресс-тест V30.1 не по выборке в 200 молекул, а по всей базе уникальных графов:
+#   - молекулы режутся на чанки по CHUNK_SIZE и раздаются пулу процессов;
+#   - воркер один раз поднимает RDKit (модули, таблица элементов, тишина в логе);
+#   - готовые чанки сразу уходят вызывающему коду (прогресс и таблица в дашборде);
+#   - каждый чанк дописывается в checkpoint (JSON Lines), прерванный прогон продолжается
+#     с того места, где встал: уже скомпилированные SMILES не пересчитываются.
+#   - checkpoint свой у каждого набора SMILES и сетки (ключ - SHA-256), пишет в него только
+#     держатель блокировки (fcntl.flock на .lock рядом); второй такой же прогон получает
+#     CheckpointBusy, а не перемешанные строки.
+#
+#   python lifecycle_batch.py --workers 0 --out batch.lifecycle
+#   python lifecycle_batch.py --complexity 12 --out lifecycle_12.csv
+# ==========================================================================================
+
+CHUNK_SIZE = 64
+IN_FLIGHT = 4                   # чанков в очереди на воркер
+CHECKPOINT_SCHEMA = 1
+CHECKPOINT_DIR = CACHE_DIR
+
+
+class CheckpointBusy(RuntimeError):
+    """Этот checkpoint уже пишет другой прогон (другая сессия дашборда или CLI)."""
+
+
+def chunked(items, size=CHUNK_SIZE):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+# --- ПУЛ ПРОЦЕССОВ: RDKit и сетка температур поднимаются воркером один раз ---
+_WORKER_GRID = TEMPERATURE_GRID
+
+
+def _init_worker(grid=None):
+    global _WORKER_GRID
+    _WORKER_GRID = TEMPERATURE_GRID if grid is None else np.asarray(grid, dtype=np.float64)
+    from rdkit import Chem, RDLogger
+    from rdkit.Chem import AllChem  # noqa: F401 - embed/MMFF грузятся здесь, а не в первом чанке
+    RDLogger.DisableLog("rdApp.*")  # 10^5 молекул: предупреждения парсера не пишем в stderr
+    Chem.GetPeriodicTable()
+
+
+def _compile_chunk(chunk):
+    rows = []
+    for smiles in chunk:
+        try:
+            rows.append(compile_lifecycle(smiles, _WORKER_GRID))
+        except Exception as e:
+            rows.append({"SMILES": smiles, "ΣK (0 K) кДж": "ERROR", "T_deg (Пиролиз)": "ERROR",
+                         "T_deg (±1 K)": "ERROR", "Статус": f"Сбой компиляции: {type(e).__name__}"})
+    return rows
+
+
+# --- CHECKPOINT: первая строка - параметры прогона, дальше одна строка на молекулу ---
+
+def _checkpoint_meta(grid):
+    return {"checkpoint": CHECKPOINT_SCHEMA, "grid": [float(t) for t in grid]}
+
+
+def checkpoint_path(smiles, grid=TEMPERATURE_GRID, directory=None):
+    """Файл checkpoint для этого набора SMILES (порядок не важен) и сетки температур."""
+    key = json.dumps([_checkpoint_meta(np.asarray(grid, dtype=np.float64)), sorted(set(map(str, smiles)))])
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(directory or CHECKPOINT_DIR, f"lifecycle-{digest}.jsonl")
+
+
+def _lock_checkpoint(path):
+    """Эксклюзивная блокировка checkpoint на время прогона; CheckpointBusy, если занят."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    lock = open(path + ".lock", "a")
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock.close()
+            raise CheckpointBusy(path) from None
+    return lock  # блокировка снимается при close (и при гибели процесса)
+
+
+def read_checkpoint(path, grid=TEMPERATURE_GRID):
+    """Уже скомпилированные строки {SMILES: row}; пусто, если файла нет или он от другой сетки."""
+    done = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            if json.loads(f.readline() or "null") != _checkpoint_meta(grid):
+                return {}
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    break  # хвост, оборванный при аварийной остановке
+                done[row["SMILES"]] = row
+    except (OSError, ValueError):
+        return {}
+    return done
+
+
+def _open_checkpoint(path, grid, resume):
+    if resume and os.path.exists(path):
+        with open(path, "rb+") as f:  # отрезаем оборванную последнюю строку
+            data = f.read()
+            f.truncate(data.rfind(b"\n") + 1)
+        return open(path, "a", encoding="utf-8")
+    f = open(path, "w", encoding="utf-8")
+    f.write(json.dumps(_checkpoint_meta(grid)) + "\n")
+    return f
+
+
+def _append(f, rows):
+    for row in rows:
+        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def iter_lifecycle(smiles, workers=1, chunk_size=CHUNK_SIZE, checkpoint=None, grid=TEMPERATURE_GRID, resume=True):
+    """
+    Генератор (готовые строки, сделано, всего) по мере завершения чанков.
+    Строки из checkpoint отдаются первой порцией; порядок чанков - по готовности.
+    checkpoint=True - файл checkpoint_path(smiles, grid); resume=False - начать его заново
+    (перезапись под блокировкой, без удаления файла, который может держать другой прогон).
+    CheckpointBusy - если этот checkpoint уже пишет другой прогон.
+    """
+    grid = np.asarray(grid, dtype=np.float64)
+    smiles = list(dict.fromkeys(map(str, smiles)))
+    if checkpoint is True:
+        checkpoint = checkpoint_path(smiles, grid)
+    lock = _lock_checkpoint(checkpoint) if checkpoint else None
+    log = None
+    try:
+        done = read_checkpoint(checkpoint, grid) if checkpoint and resume else {}
+        resumed = [done[s] for s in smiles if s in done]
+        pending = chunked([s for s in smiles if s not in done], chunk_size)
+        total, count = len(smiles), len(resumed)
+        if resumed:
+            yield resumed, count, total
+        if not pending:
+            return
+
+        log = _open_checkpoint(checkpoint, grid, resume=bool(done)) if checkpoint else None
+        workers = min(workers or os.cpu_count() or 1, len(pending))
+        if workers <= 1:
+            _init_worker(grid)
+            for chunk in pending:
+                rows = _compile_chunk(chunk)
+                if log: _append(log, rows)
+                count += len(rows)
+                yield rows, count, total
+            return
+
+        # spawn, а не fork: генератор крутится в потоке сервера Streamlit
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_worker, initargs=(grid,)) as pool:
+            queue = iter(pending)
+            running = {pool.submit(_compile_chunk, c) for c in (next(queue, None) for _ in range(workers * IN_FLIGHT)) if c}
+            while running:
+                finished, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    rows = future.result()
+                    if log: _append(log, rows)
+                    count += len(rows)
+                    nxt = next(queue, None)
+                    if nxt:
+                        running.add(pool.submit(_compile_chunk, nxt))
+                    yield rows, count, total
+    finally:
+        if log: log.close()
+        if lock: lock.close()
+
+
+def run_lifecycle_batch(smiles, workers=1, chunk_size=CHUNK_SIZE, checkpoint=None, grid=TEMPERATURE_GRID, resume=True):
+    """Все строки отчета одной таблицей, в порядке входных SMILES."""
+    smiles = list(dict.fromkeys(map(str, smiles)))
+    by_smiles = {}
+    for rows, _, _ in iter_lifecycle(smiles, workers, chunk_size, checkpoint, grid, resume):
+        by_smiles.update((r["SMILES"], r) for r in rows)
+    return pd.DataFrame([by_smiles[s] for s in smiles])
+
+
+# ==========================================================================================
+# CLI
+# ==========================================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evolution Reactor lifecycle stress test over the whole bde-db2 set.")
+    parser.add_argument("--db", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), FILE_NAME))
+    parser.add_argument("--complexity", type=int, help="only molecules with this many bonds")
+    parser.add_argument("--limit", type=int, help="first N unique molecules")
+    parser.add_argument("--workers", type=int, default=0, help="process pool size (0 = all cores)")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="molecules per work unit")
+    parser.add_argument("--checkpoint", help="resumable JSON Lines log (default: one per molecule set and grid)")
+    parser.add_argument("--fresh", action="store_true", help="start the checkpoint over instead of resuming")
+    parser.add_argument("--out", type=nuclear_batch.output_target, default="batch.lifecycle", help=nuclear_batch.OUT_HELP)
+    parser.add_argument("--store-dir", help="Chronos store directory (default: $SIMUREALITY_CHRONOS or chronos_store)")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    smiles = bde_molecules(args.db, args.complexity)["molecule"].tolist()
+    smiles = smiles[:args.limit] if args.limit else smiles
+
+    by_smiles = {}
+    try:
+        runs = iter_lifecycle(smiles, args.workers, args.chunk, args.checkpoint or True, resume=not args.fresh)
+        for rows, done, total in runs:
+            by_smiles.update((r["SMILES"], r) for r in rows)
+            print(f"\r{done}/{total} molecules ({time.perf_counter() - t0:.1f} s)", end="", file=sys.stderr, flush=True)
+    except CheckpointBusy as e:
+        print(f"lifecycle: checkpoint {e} is in use by another run", file=sys.stderr)
+        return 1
+    print(file=sys.stderr)
+
+    df = pd.DataFrame([by_smiles[s] for s in dict.fromkeys(smiles)])
+    where = nuclear_batch.write_output(df, args.out, args.store_dir, source="lifecycle_batch")
+    counts = df["Статус"].value_counts().to_dict() if len(df) else {}
+    print(f"lifecycle: {len(df)} rows -> {where} ({counts}; {time.perf_counter() - t0:.2f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+import numpy as np
+
+from bond_geometry import (bond_lengths, covalent_radii, lone_pairs, max_angle_deviation, molecule_arrays,
+                           net_buffer_volume, per_element)
+from conformer_cache import embedded_molecule
+from lazy_import import lazy_module
+
+Chem = lazy_module("rdkit.Chem")
+
+# ==========================================================================================
+# SIMUREALITY: LIFECYCLE ENGINE (ΣK(T) SWEEP, ONE EMBED PER MOLECULE)
+# Ядро Evolution Reactor без интерфейса. Геометрия молекулы от температуры не зависит:
+# длины связей, приведенные массы, радиусы, порты и угловой перекос снимаются один раз
+# (lifecycle_geometry), а ΣK(T) считается сразу для целого вектора температур матрицей
+# (T, связи). Температура деградации - первая точка сетки, где граф распался или ΣK <= 0,
+# и уточнение тем же векторным поиском внутри последнего шага сетки.
+# ==========================================================================================
+
+GAMMA_SYS = 1.0418
+STATIC_BASE_LOCK = 286.5
+VOLUME_BONUS = 12.75
+VACUUM_GATE = 3.325
+BUFFER_RADIUS = VACUUM_GATE / 2
+C_LP_CLASH = 30.0
+Z0 = 377.0
+K_THETA = 2.0
+
+TEMPERATURE_GRID = np.arange(100, 6100, 200)    # шаг 200 K, как в стресс-тесте V30.1
+REFINE_STEP = 1.0                               # K, разрешение уточненной T_deg
+
+STABLE, DECAY, PANIC = 0, 1, 2
+STATUS_LABELS = {STABLE: "✅ СТАБИЛЬНО", DECAY: "🔥 РАСПАД", PANIC: "💥 KERNEL PANIC"}
+IMMORTAL = "Бессмертна (>6000K)"
+
+
+def get_ideal_angle(hyb):
+    if hyb == Chem.rdchem.HybridizationType.SP: return 180.0
+    if hyb == Chem.rdchem.HybridizationType.SP2: return 120.0
+    return 109.47
+
+
+def lifecycle_geometry(smiles):
+    """Не зависящие от T массивы по связям и постоянные слагаемые ΣK; None, если embed не удался."""
+    mol = Chem.MolFromSmiles(smiles)
+    if not mol: return None
+    mol_h = embedded_molecule(mol)
+    if mol_h is None: return None
+    arrays = molecule_arrays(mol_h)
+    z, (i, j) = arrays["z"], arrays["bonds"].T
+    pt = Chem.GetPeriodicTable()
+    mass = np.where(z == 1, 1.008, per_element(z, pt.GetAtomicWeight))
+    r_cov, lp = covalent_radii(z), lone_pairs(z)
+
+    # угловой перекос: максимум |угол - идеал| по парам соседей, для каждого узла с 2+ соседями
+    ideal = np.array([get_ideal_angle(atom.GetHybridization()) for atom in mol_h.GetAtoms()])
+
+    is_aromatic = any(atom.GetIsAromatic() for atom in mol_h.GetAtoms())
+    global_bonus = 0.0
+    if is_aromatic: global_bonus += 210.0
+    if "O=C=O" in smiles.upper(): global_bonus += 250.0
+    if "N#N" in smiles.upper(): global_bonus += 150.0
+    if mol_h.GetNumHeavyAtoms() > 0: global_bonus += (Z0 / 2.0)
+
+    return {
+        "smiles": smiles, "d_base": bond_lengths(arrays["pos"], arrays["bonds"]), "bo": arrays["bond_order"],
+        "inv_sqrt_mu": 1.0 / np.sqrt((mass[i] * mass[j]) / (mass[i] + mass[j])),
+        "mass_asym": np.abs(mass[i] - mass[j]) / (mass[i] + mass[j]),
+        "r_cov1": r_cov[i], "r_cov2": r_cov[j], "heavy1": z[i] != 1, "heavy2": z[j] != 1,
+        "lp_product": (lp[i] * lp[j]).astype(np.float64),
+        "is_aromatic": is_aromatic, "max_dev_sum": max_angle_deviation(arrays, ideal), "global_bonus": global_bonus,
+    }
+
+
+def sigma_k_curve(geom, temps):
+    """(ΣK, статус) для каждой температуры temps за один проход; при распаде ΣK = 0."""
+    T = np.atleast_1d(np.asarray(temps, dtype=np.float64))[:, None]
+    g = geom
+    d = g["d_base"] * (1.0 + (T / 3500.0) * g["inv_sqrt_mu"])       # (T, связи)
+    active = d < VACUUM_GATE
+
+    v_net = net_buffer_volume(d, g["r_cov1"], g["r_cov2"], g["heavy1"], g["heavy2"], BUFFER_RADIUS)
+    total_hw = np.where(active, ((g["bo"] * STATIC_BASE_LOCK) + (VOLUME_BONUS * v_net)) * GAMMA_SYS, 0.0).sum(axis=1)
+
+    clash = (C_LP_CLASH * g["lp_product"]) / d * (1.0 + (T / 1200.0) ** 1.2)
+    total_repulsion = np.where(active & (g["lp_product"] > 0), clash, 0.0).sum(axis=1)
+
+    desync = np.where(g["mass_asym"] > 0.5,
+                      g["bo"] * (g["mass_asym"] * 120.0) * (T / 1000.0) ** 1.5,
+                      g["bo"] * 15.0 * (T / 1000.0) ** 1.2)
+    total_desync = np.where(active, desync, 0.0).sum(axis=1)
+
+    total_pi_strain = np.zeros(len(T))
+    if not g["is_aromatic"]:
+        pi = np.where(g["bo"] == 2.0, 78.1, np.where(g["bo"] == 3.0, 199.5, 0.0))
+        total_pi_strain = np.where(active, pi * (1.0 + (T / 1500.0)), 0.0).sum(axis=1)
+
+    total_tension = K_THETA * g["max_dev_sum"] * (1.0 + (T[:, 0] / 2000.0))
+    sigma = total_hw + g["global_bonus"] - total_repulsion - total_tension - total_pi_strain - total_desync
+
+    status = np.where(sigma <= 0, DECAY, STABLE)
+    status[~active.any(axis=1)] = PANIC
+    return np.where(status == STABLE, sigma, 0.0), status
+
+
+def lifecycle_tick(smiles, T_sys):
+    """ΣK и статус при одной температуре (интерфейс прежнего evaluate_lifecycle_tick)."""
+    geom = lifecycle_geometry(smiles)
+    if geom is None: return 0.0, "Error"
+    sigma, status = sigma_k_curve(geom, [T_sys])
+    return sigma[0], STATUS_LABELS[int(status[0])]
+
+
+def degradation_temperature(geom, grid=TEMPERATURE_GRID, refine=REFINE_STEP):
+    """
+    (первая точка grid с распадом или паникой, уточненная T_deg) или (None, None).
+    Уточнение - тот же векторный поиск внутри шага сетки с шагом refine
+    (первое пересечение, а не любое, как дала бы бисекция при немонотонной ΣK).
+    """
+    grid = np.asarray(grid, dtype=np.float64)
+    failed = np.flatnonzero(sigma_k_curve(geom, grid)[1] != STABLE)
+    if not len(failed):
+        return None, None
+    k = failed[0]
+    lo = grid[k - 1] + refine if k > 0 else 0.0    # grid[k - 1] уже проверена, 0 K - нет
+    fine = np.append(np.arange(lo, grid[k], refine), grid[k])
+    return grid[k], fine[np.flatnonzero(sigma_k_curve(geom, fine)[1] != STABLE)[0]]
+
+
+def lifecycle_class(t_deg):
+    if t_deg is None: return "Архив (Железный Пик)"
+    if t_deg < 1500: return "Хрупкая (DDoS / Drift)"
+    if t_deg < 3500: return "Органика (Сгорает)"
+    return "Термостойкий каркас"
+
+
+def compile_lifecycle(smiles, grid=TEMPERATURE_GRID):
+    """Строка отчета стресс-теста V30.1 для одной молекулы."""
+    geom = lifecycle_geometry(smiles)
+    if geom is None:
+        return {"SMILES": smiles, "ΣK (0 K) кДж": "ERROR", "T_deg (Пиролиз)": "ERROR",
+                "T_deg (±1 K)": "ERROR", "Статус": "Сбой 3D-матрицы"}
+    e_0k = sigma_k_curve(geom, [0.0])[0][0]
+    t_deg, t_fine = degradation_temperature(geom, grid)
+    return {
+        "SMILES": smiles, "ΣK (0 K) кДж": f"{e_0k:.1f}",
+        "T_deg (Пиролиз)": IMMORTAL if t_deg is None else f"{t_deg:.0f} K",
+        "T_deg (±1 K)": IMMORTAL if t_fine is None else f"{t_fine:.0f} K",
+        "Статус": lifecycle_class(t_deg),
+    }
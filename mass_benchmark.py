@@ -0,0 +1,269 @@
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from mass_engines import MASS_N, MASS_P
+from nuclear_data import file_digest, load_ame_table
+
+# ==========================================================================================
+# SIMUREALITY: HEADLESS MASS BENCHMARK (MODEL VS EXPERIMENT)
+# Все движки масс за одним пакетным интерфейсом: f(Z, N) -> энергия связи, МэВ.
+# Таблица AME2020 (mmap из кеша nuclear_data) прогоняется блоками через каждый движок;
+# по каждому движку копятся скорость (ядер/с), перцентили задержки блока и метрики
+# точности. Отчет - JSON, чтобы сравнивать версии движков между коммитами.
+#
+#   python mass_benchmark.py --out report.json
+#   python mass_benchmark.py --engines macro-core-v6,liquid-drop --baseline report.json
+# ==========================================================================================
+
+REPORT_SCHEMA = 1
+CHUNK_SIZE = 256
+PERCENTILES = (50, 90, 99)
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+ENGINES = {}
+
+
+def register_engine(name, kind="binding", description=""):
+    """
+    Декоратор фабрики движка. Фабрика вызывается только при запуске и возвращает пакетную
+    функцию f(Z, N). kind="mass": функция отдает массу ядра, стенд переводит ее в энергию связи.
+    """
+    def wrap(factory):
+        ENGINES[name] = {"factory": factory, "kind": kind, "description": description}
+        return factory
+    return wrap
+
+
+def _load_script(relpath, name):
+    """Модуль из скрипта с пробелами в имени (Script/EN 249 mega test.py и т.п.)."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, relpath))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@register_engine("macro-core-v6", kind="mass", description="Masses_ultimate: V6 Task Dispatcher")
+def _macro_core_v6():
+    from mass_engines import SimurealityMacroCore
+    return SimurealityMacroCore().compile_mass_batch
+
+
+@register_engine("baseline-core", kind="mass", description="Masses_Woyz: голый 3D-движок")
+def _baseline_core():
+    from mass_engines import SimurealityBaselineCore
+    return SimurealityBaselineCore().compile_mass_batch
+
+
+@register_engine("liquid-drop", kind="mass", description="Masses_Woyz: формула Вейцзеккера")
+def _liquid_drop():
+    from mass_engines import LiquidDropCore
+    return LiquidDropCore().compile_mass_batch
+
+
+@register_engine("grid-physics-v8", description="Nuclear Energy Calculator 2: GridPhysicsEngine")
+def _grid_physics():
+    from grid_engine import GridPhysicsEngine
+    engine = GridPhysicsEngine()
+    return lambda Z, N: engine.calculate_energy_batch(Z, Z + N)
+
+
+@register_engine("en249-v1.3", description="Script/EN 249 mega test: скалярный calculate_energy")
+def _en249():
+    script = _load_script(os.path.join("Script", "EN 249 mega test.py"), "en249_mega_test")
+    consts = script.get_constants()
+
+    def batch(Z, N):
+        return np.array([script.calculate_energy(int(z), int(z + n), consts) for z, n in zip(Z, N)],
+                        dtype=np.float64)
+    return batch
+
+
+@register_engine("topological-profit", description="Fussion_app / Bulk Fission Test: профит топологии")
+def _topological_profit():
+    from topological_core import topological_profit
+    return topological_profit
+
+
+@register_engine("forge-matrix", description="The Forge: профит минус налог маршрутизации")
+def _forge_matrix():
+    from topological_core import matrix_energy
+    return lambda Z, N: matrix_energy(Z, N, power=1.6)  # FORGE_JITTER_POWER
+
+
+def stream_ame(path="mass.txt", chunk_size=CHUNK_SIZE, drop_extrapolated=True, cache_dir=None):
+    """Блоки (Z, N, BE_exp в МэВ) из mmap-таблицы AME2020 без сборки DataFrame."""
+    table = load_ame_table(path, cache_dir)
+    for start in range(0, len(table), chunk_size):
+        rows = table[start:start + chunk_size]
+        keep = rows["Z"] > 0
+        if drop_extrapolated:
+            keep &= ~rows["extrapolated"]
+        rows = rows[keep]
+        if len(rows):
+            Z = rows["Z"].astype(np.int64)
+            N = rows["N"].astype(np.int64)
+            yield Z, N, rows["be_per_a"] * (Z + N) / 1000.0
+
+
+class EngineScore:
+    """Потоковые агрегаты одного движка: время блоков и ошибки без хранения прогнозов."""
+
+    def __init__(self, name, kind):
+        self.name, self.kind = name, kind
+        self.latencies = []
+        self.nuclei = self.invalid = 0
+        self.sum_abs = self.sum_sq = self.sum_err = self.sum_acc = 0.0
+        self.max_abs = 0.0
+        self.warmup_s = 0.0
+
+    def add(self, predicted, expected, elapsed_ns):
+        self.latencies.append(elapsed_ns)
+        ok = np.isfinite(predicted)
+        self.invalid += int((~ok).sum())
+        err = predicted[ok] - expected[ok]
+        self.nuclei += len(err)
+        self.sum_err += float(err.sum())
+        self.sum_abs += float(np.abs(err).sum())
+        self.sum_sq += float((err ** 2).sum())
+        self.max_abs = max(self.max_abs, float(np.abs(err).max(initial=0.0)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            acc = 100.0 * (1.0 - np.abs(err) / expected[ok])
+        self.sum_acc += float(acc[np.isfinite(acc)].sum())
+
+    def report(self):
+        lat = np.asarray(self.latencies, dtype=np.float64)
+        total_s = lat.sum() / 1e9
+        evaluated = self.nuclei + self.invalid
+        n = max(self.nuclei, 1)
+        return {
+            "kind": self.kind,
+            "nuclei": self.nuclei, "invalid": self.invalid, "chunks": len(lat),
+            "seconds": total_s, "warmup_s": self.warmup_s,
+            "throughput": evaluated / total_s if total_s > 0 else None,
+            "latency_us": {f"p{q}": float(np.percentile(lat, q)) / 1e3 for q in PERCENTILES} if len(lat) else {},
+            "mae_mev": self.sum_abs / n, "rmse_mev": float(np.sqrt(self.sum_sq / n)),
+            "bias_mev": self.sum_err / n, "max_abs_mev": self.max_abs,
+            "accuracy_pct": self.sum_acc / n,
+        }
+
+
+def _binding(fn, kind, Z, N):
+    out = np.asarray(fn(Z, N), dtype=np.float64)
+    if kind == "mass":
+        out = (Z * MASS_P) + (N * MASS_N) - out
+    return out
+
+
+def run_benchmark(engines=None, path="mass.txt", chunk_size=CHUNK_SIZE, drop_extrapolated=True, cache_dir=None):
+    """
+    Один проход по AME: каждый блок по очереди идет через все движки.
+    Первый вызов движка (сборка таблиц ГЦК, импорт скрипта) замеряется отдельно как warmup.
+    """
+    names = list(ENGINES) if engines is None else list(engines)
+    unknown = [n for n in names if n not in ENGINES]
+    if unknown:
+        raise KeyError(f"Unknown mass engine(s): {', '.join(unknown)}. Known: {', '.join(ENGINES)}")
+
+    fns, scores = {}, {}
+    for name in names:
+        t0 = time.perf_counter()
+        fns[name] = ENGINES[name]["factory"]()
+        scores[name] = EngineScore(name, ENGINES[name]["kind"])
+        scores[name].warmup_s = time.perf_counter() - t0
+
+    rows = chunks = 0
+    for Z, N, be_exp in stream_ame(path, chunk_size, drop_extrapolated, cache_dir):
+        for name in names:
+            score = scores[name]
+            if chunks == 0:
+                t0 = time.perf_counter()
+                _binding(fns[name], score.kind, Z[:1], N[:1])
+                score.warmup_s += time.perf_counter() - t0
+            t0 = time.perf_counter_ns()
+            predicted = _binding(fns[name], score.kind, Z, N)
+            score.add(predicted, be_exp, time.perf_counter_ns() - t0)
+        rows += len(Z)
+        chunks += 1
+
+    return {
+        "schema": REPORT_SCHEMA,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "source": {"path": os.path.basename(path), "sha256": file_digest(path)[:16],
+                   "nuclei": rows, "chunks": chunks, "experimental_only": bool(drop_extrapolated)},
+        "chunk_size": chunk_size,
+        "engines": {name: scores[name].report() for name in names},
+    }
+
+
+def regressions(report, baseline, speed_tol=0.25, fidelity_tol=1e-6):
+    """
+    Отличия report от baseline: падение скорости больше speed_tol (доля) или рост MAE
+    больше fidelity_tol МэВ. Сравниваются только движки, есть в обоих отчетах.
+    """
+    found = []
+    for name, cur in report["engines"].items():
+        old = baseline.get("engines", {}).get(name)
+        if old is None:
+            continue
+        if old.get("throughput") and cur.get("throughput") and cur["throughput"] < old["throughput"] * (1 - speed_tol):
+            found.append(f"{name}: throughput {old['throughput']:.0f} -> {cur['throughput']:.0f} nuclei/s")
+        if cur["mae_mev"] > old["mae_mev"] + fidelity_tol:
+            found.append(f"{name}: MAE {old['mae_mev']:.6f} -> {cur['mae_mev']:.6f} MeV")
+        if cur["nuclei"] != old["nuclei"]:
+            found.append(f"{name}: scored nuclei {old['nuclei']} -> {cur['nuclei']}")
+    return found
+
+
+def format_report(report):
+    lines = [f"{'ENGINE':<20} {'NUCLEI':>6} {'NUCLEI/S':>12} {'P50 us':>9} {'P99 us':>9} {'MAE MeV':>9} {'ACC %':>8}"]
+    for name, r in report["engines"].items():
+        lat = r["latency_us"]
+        lines.append(f"{name:<20} {r['nuclei']:>6} {r['throughput'] or 0:>12.0f} {lat.get('p50', 0):>9.1f} "
+                     f"{lat.get('p99', 0):>9.1f} {r['mae_mev']:>9.3f} {r['accuracy_pct']:>8.3f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless model-vs-AME2020 benchmark for all mass engines.")
+    parser.add_argument("--ame", default=os.path.join(ROOT, "mass.txt"), help="AME2020 mass.mas20 file")
+    parser.add_argument("--engines", help="comma-separated engine names (default: all)")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="nuclei per streamed chunk")
+    parser.add_argument("--all-masses", action="store_true", help="include AME extrapolated (#) masses")
+    parser.add_argument("--out", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="earlier JSON report; exit 1 on speed/fidelity regressions")
+    parser.add_argument("--list", action="store_true", help="list registered engines and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, spec in ENGINES.items():
+            print(f"{name:<20} {spec['kind']:<8} {spec['description']}")
+        return 0
+
+    engines = args.engines.split(",") if args.engines else None
+    report = run_benchmark(engines, args.ame, args.chunk, drop_extrapolated=not args.all_masses)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(format_report(report))
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=1)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            found = regressions(report, json.load(f))
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+import numpy as np
+
+from fcc_lattice import crystal_links, link_table
+
+# ==========================================================================================
+# SIMUREALITY: MASS ENGINES (HEADLESS)
+# Движки масс дашбордов без Streamlit: V6 Task Dispatcher (Masses_ultimate), голый
+# 3D-движок и капельная модель Вейцзеккера (Masses_Woyz). Дашборды и стенд
+# mass_benchmark импортируют одни и те же классы.
+# ==========================================================================================
+
+# --- SIMUREALITY ONTOLOGICAL CONSTANTS ---
+MASS_P = 938.272
+MASS_N = 939.565
+E_ELECTRON = 0.511
+E_ALPHA = 28.32
+E_MACRO_LINK = 2.425
+E_LINK = 2.36
+E_PAIR = 1.18
+JITTER_COST = 0.0131
+BASELINE_JITTER_COST = 0.01311  # Masses_Woyz (версия 1.0 без эмпирики)
+
+# --- V6 NEW HARDWARE CONSTANTS (SKIN, TENSION & SHELLS) ---
+E_SKIN_LINK = 1.35       # Профит за подключение нейтрона гало к поверхности 3D-ядра
+TENSION_PENALTY = 0.95   # Вычислительный штраф за макро-линк (распирание базы данных)
+E_MAGIC = 2.15           # Топологический профит за идеальную симметрию (закрытую оболочку ГЦК)
+MAGIC_NUMBERS = {2, 8, 20, 28, 50, 82, 126} # Идеальные геометрические префабы Матрицы
+
+# --- ПОДГОНОЧНЫЕ КОЭФФИЦИЕНТЫ ВЕЙЦЗЕККЕРА (КЛАССИЧЕСКИЙ ХАРДКОД) ---
+A_V = 15.75
+A_S = 17.8
+A_C = 0.711
+A_A = 23.7
+A_P = 11.18
+
+
+class SimurealityMacroCore:
+    def compile_3d_crystal(self, n_clusters):
+        """Жадная 3D-компиляция Альфа-кластеров: O(1) чтение общей ГЦК-таблицы"""
+        return crystal_links(n_clusters)
+
+    def compile_mass(self, Z, N):
+        # --- HARDWARE FIREWALL ---
+        if Z < 0 or N < 0:
+            return float('inf') # Матрица блокирует антиматерию в этом слое вычислений
+            
+        n_alphas = min(Z // 2, N // 2)
+        binding_alphas = n_alphas * E_ALPHA
+        
+        macro_links = self.compile_3d_crystal(n_alphas)
+        binding_macro = macro_links * E_MACRO_LINK
+
+        # --- V6 LOGIC: CORE TENSION & DEFORMATION ---
+        tension_penalty = 0
+        surface_ports = 0
+        
+        if macro_links > 10:
+            tension_penalty = (macro_links - 10) * TENSION_PENALTY
+            
+        if n_alphas > 0:
+            surface_ports = (n_alphas ** (2/3)) * 6.5
+            
+            # Топологическая Деформация (Эллипсоид) для снятия напряжения тяжелых ядер
+            if n_alphas > 25: 
+                tension_penalty *= 0.65       # Ядро вытягивается, сбрасывая 35% распирания
+                surface_ports *= 1.15         # Площадь поверхности вытянутого ядра больше на 15%
+                
+            surface_ports = int(surface_ports)
+
+        # --- V6 LOGIC: MAGIC NUMBERS (Идеальные Оболочки) ---
+        magic_profit = 0
+        if Z in MAGIC_NUMBERS: magic_profit += E_MAGIC
+        if N in MAGIC_NUMBERS: magic_profit += E_MAGIC
+
+        rem_Z = Z - (n_alphas * 2)
+        rem_N = N - (n_alphas * 2)
+        halo_total = rem_Z + rem_N
+        
+        binding_halo = 0
+        jitter = 0
+        
+        if n_alphas == 0:
+            if Z == 1:
+                if N == 1: binding_halo = 2.225         
+                elif N >= 2: binding_halo = 8.482       
+            elif Z == 2 and N == 1:
+                binding_halo = 7.718                    
+        else:
+            # --- V5/V6 LOGIC: NEUTRON SKIN WEAVING (Скин-слой) ---
+            pairs = halo_total // 2
+            unpaired = halo_total % 2
+            binding_halo += pairs * E_PAIR
+            
+            connected_halo = min(halo_total, surface_ports)
+            binding_halo += connected_halo * E_SKIN_LINK
+            
+            if connected_halo > 0 and tension_penalty > 0:
+                coverage_ratio = connected_halo / surface_ports
+                corset_relief = tension_penalty * (coverage_ratio * 0.85) 
+                tension_penalty -= corset_relief
+            
+            if unpaired > 0:
+                jitter += JITTER_COST * 10
+                
+            overflow = halo_total - surface_ports
+            if overflow > 0:
+                jitter += overflow * E_ELECTRON 
+
+        total_binding = binding_alphas + binding_macro + binding_halo + magic_profit - tension_penalty - jitter
+        raw_mass = (Z * MASS_P) + (N * MASS_N)
+        return raw_mass - total_binding
+
+    def compile_mass_batch(self, Z, N):
+        """compile_mass для массивов Z, N за один векторный проход"""
+        Z, N = np.broadcast_arrays(np.asarray(Z, dtype=np.int64), np.asarray(N, dtype=np.int64))
+        firewall = (Z < 0) | (N < 0)
+        Z, N = np.where(firewall, 0, Z), np.where(firewall, 0, N)
+
+        n_alphas = np.minimum(Z // 2, N // 2)
+        binding_alphas = n_alphas * E_ALPHA
+        macro_links = link_table(int(n_alphas.max(initial=0)))[n_alphas]
+        binding_macro = macro_links * E_MACRO_LINK
+
+        # --- V6 LOGIC: CORE TENSION & DEFORMATION ---
+        tension_penalty = np.where(macro_links > 10, (macro_links - 10) * TENSION_PENALTY, 0.0)
+        surface_ports = (n_alphas ** (2/3)) * 6.5
+        deformed = n_alphas > 25
+        tension_penalty = np.where(deformed, tension_penalty * 0.65, tension_penalty)
+        surface_ports = np.trunc(np.where(deformed, surface_ports * 1.15, surface_ports))
+
+        # --- V6 LOGIC: MAGIC NUMBERS ---
+        magic = np.array(sorted(MAGIC_NUMBERS))
+        magic_profit = (np.isin(Z, magic) * E_MAGIC) + (np.isin(N, magic) * E_MAGIC)
+
+        halo_total = (Z - n_alphas * 2) + (N - n_alphas * 2)
+        core = n_alphas > 0
+
+        # n_alphas == 0: легкие примитивы
+        light_halo = np.select([(Z == 1) & (N == 1), (Z == 1) & (N >= 2), (Z == 2) & (N == 1)],
+                               [2.225, 8.482, 7.718], default=0.0)
+
+        # --- V5/V6 LOGIC: NEUTRON SKIN WEAVING ---
+        connected_halo = np.minimum(halo_total, surface_ports)
+        skin_halo = (halo_total // 2) * E_PAIR + connected_halo * E_SKIN_LINK
+        relief = (connected_halo > 0) & (tension_penalty > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coverage_ratio = np.where(relief, connected_halo / surface_ports, 0.0)
+        tension_penalty = np.where(core & relief, tension_penalty - tension_penalty * (coverage_ratio * 0.85), tension_penalty)
+        overflow = halo_total - surface_ports
+        jitter = np.where(halo_total % 2 > 0, JITTER_COST * 10, 0.0) + np.where(overflow > 0, overflow * E_ELECTRON, 0.0)
+
+        binding_halo = np.where(core, skin_halo, light_halo)
+        jitter = np.where(core, jitter, 0.0)
+
+        total_binding = binding_alphas + binding_macro + binding_halo + magic_profit - tension_penalty - jitter
+        raw_mass = (Z * MASS_P) + (N * MASS_N)
+        return np.where(firewall, np.inf, raw_mass - total_binding)
+
+
+class LiquidDropCore:
+    """Легаси-движок классической физики (Формула Вейцзеккера)"""
+    def compile_mass(self, Z, N):
+        if Z < 0 or N < 0: return float('inf')
+        A = Z + N
+        
+        # КОСТЫЛЬ ДЛЯ ЛЕГАСИ-ФИЗИКИ: Капельная модель бессмысленна для A < 2
+        # Это предотвращает краш с бесконечностями (inf)
+        if A < 2:
+            return (Z * MASS_P) + (N * MASS_N)
+            
+        vol = A_V * A
+        surf = A_S * (A ** (2/3))
+        coul = A_C * (Z * (Z - 1)) / (A ** (1/3))
+        asym = A_A * ((A - 2*Z)**2) / A
+        
+        if Z % 2 == 0 and N % 2 == 0: pair = A_P / (A ** 0.5)
+        elif Z % 2 != 0 and N % 2 != 0: pair = -A_P / (A ** 0.5)
+        else: pair = 0
+            
+        binding_energy = vol - surf - coul - asym + pair
+        return (Z * MASS_P) + (N * MASS_N) - binding_energy
+
+    def compile_mass_batch(self, Z, N):
+        """compile_mass для массивов Z, N за один векторный проход"""
+        Z, N = np.broadcast_arrays(np.asarray(Z, dtype=np.int64), np.asarray(N, dtype=np.int64))
+        A = Z + N
+        raw_mass = (Z * MASS_P) + (N * MASS_N)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Af = A.astype(np.float64)
+            vol = A_V * Af
+            surf = A_S * (Af ** (2/3))
+            coul = A_C * (Z * (Z - 1)) / (Af ** (1/3))
+            asym = A_A * ((A - 2*Z)**2) / Af
+            pair = np.select([(Z % 2 == 0) & (N % 2 == 0), (Z % 2 != 0) & (N % 2 != 0)],
+                             [A_P / (Af ** 0.5), -A_P / (Af ** 0.5)], default=0.0)
+            binding_energy = vol - surf - coul - asym + pair
+        mass = np.where(A < 2, raw_mass, raw_mass - binding_energy)
+        return np.where((Z < 0) | (N < 0), np.inf, mass)
+
+class SimurealityBaselineCore:
+    """Наш голый 3D-движок без единого подгоночного коэффициента"""
+    def compile_3d_crystal(self, n_clusters):
+        """Жадная 3D-компиляция Альфа-кластеров: O(1) чтение общей ГЦК-таблицы"""
+        return crystal_links(n_clusters)
+
+    def compile_mass(self, Z, N):
+        if Z < 0 or N < 0: return float('inf')
+        n_alphas = min(Z // 2, N // 2)
+        binding_alphas = n_alphas * E_ALPHA
+        macro_links = self.compile_3d_crystal(n_alphas)
+        binding_macro = macro_links * E_MACRO_LINK
+
+        rem_Z = Z - (n_alphas * 2)
+        rem_N = N - (n_alphas * 2)
+        halo_total = rem_Z + rem_N
+        
+        binding_halo = 0
+        jitter = 0
+        
+        if n_alphas == 0:
+            if Z == 1:
+                if N == 1: binding_halo = 2.225         
+                elif N >= 2: binding_halo = 8.482       
+            elif Z == 2 and N == 1: binding_halo = 7.718                    
+        else:
+            binding_halo += halo_total * E_LINK
+            pairs = halo_total // 2
+            binding_halo += pairs * E_PAIR
+            if halo_total % 2 != 0: jitter += BASELINE_JITTER_COST
+
+        total_binding = binding_alphas + binding_macro + binding_halo - jitter
+        return (Z * MASS_P) + (N * MASS_N) - total_binding
+
+    def compile_mass_batch(self, Z, N):
+        """compile_mass для массивов Z, N за один векторный проход"""
+        Z, N = np.broadcast_arrays(np.asarray(Z, dtype=np.int64), np.asarray(N, dtype=np.int64))
+        firewall = (Z < 0) | (N < 0)
+        Z, N = np.where(firewall, 0, Z), np.where(firewall, 0, N)
+        n_alphas = np.minimum(Z // 2, N // 2)
+        binding_alphas = n_alphas * E_ALPHA
+        macro_links = link_table(int(n_alphas.max(initial=0)))[n_alphas]
+        binding_macro = macro_links * E_MACRO_LINK
+
+        halo_total = (Z - n_alphas * 2) + (N - n_alphas * 2)
+        no_core = n_alphas == 0
+        primitive = np.select([(Z == 1) & (N == 1), (Z == 1) & (N >= 2), (Z == 2) & (N == 1)],
+                              [2.225, 8.482, 7.718], default=0.0)
+        binding_halo = np.where(no_core, primitive, halo_total * E_LINK + (halo_total // 2) * E_PAIR)
+        jitter = np.where(~no_core & (halo_total % 2 != 0), BASELINE_JITTER_COST, 0.0)
+
+        total_binding = binding_alphas + binding_macro + binding_halo - jitter
+        return np.where(firewall, np.inf, (Z * MASS_P) + (N * MASS_N) - total_binding)
@@ -0,0 +1,231 @@
+import numpy as np
+
+# ==========================================================================================
+# SIMUREALITY: CHART-WIDE MASS SURFACE
+# Массы модели считаются один раз на всей решетке (Z, N) с полями по краям. Соседи по
+# бета-распаду и прочим переходам - это сдвинутые срезы того же массива, а не новые вызовы.
+# ==========================================================================================
+
+E_ELECTRON = 0.511
+
+BETA_MINUS = (+1, -1)
+BETA_PLUS = (-1, +1)
+
+# Переходы (dZ, dN) от родителя к дочернему ядру. Для эмиссии вылетевший кластер = (-dZ, -dN).
+MOVES = {
+    "beta-": BETA_MINUS, "beta+": BETA_PLUS,
+    "2beta-": (+2, -2), "2beta+": (-2, +2),
+    "n": (0, -1), "2n": (0, -2), "p": (-1, 0), "2p": (-2, 0),
+    "alpha": (-2, -2),
+}
+
+
+class MassSurface:
+    """
+    Массив масс mass_fn(Z, N) на решетке Z = -pad..z_max+pad, N = -pad..n_max+pad.
+    mass_fn - векторная функция движка (например engine.compile_mass_batch).
+    """
+
+    def __init__(self, mass_fn, z_max, n_max, pad=2):
+        self.z_max, self.n_max, self.pad = int(z_max), int(n_max), int(pad)
+        z = np.arange(-self.pad, self.z_max + self.pad + 1)
+        n = np.arange(-self.pad, self.n_max + self.pad + 1)
+        Z, N = np.meshgrid(z, n, indexing="ij")
+        self.grid = np.asarray(mass_fn(Z, N), dtype=np.float64)
+
+    @classmethod
+    def for_nuclei(cls, mass_fn, Z, N, pad=2):
+        """Поверхность, покрывающая все переданные ядра."""
+        return cls(mass_fn, int(np.max(Z)), int(np.max(N)), pad)
+
+    def at(self, Z, N, dZ=0, dN=0):
+        """Масса в (Z + dZ, N + dN) для массивов Z, N (|dZ|, |dN| <= pad)."""
+        Z = np.asarray(Z, dtype=np.intp) + dZ + self.pad
+        N = np.asarray(N, dtype=np.intp) + dN + self.pad
+        return self.grid[Z, N]
+
+    def shifted(self, dZ, dN):
+        """Вид grid[Z + dZ, N + dN], выровненный с ядром решетки Z = 0..z_max, N = 0..n_max."""
+        p = self.pad
+        return self.grid[p + dZ:p + dZ + self.z_max + 1, p + dN:p + dN + self.n_max + 1]
+
+    @property
+    def core(self):
+        return self.shifted(0, 0)
+
+    def covers(self, z_max, n_max):
+        return z_max <= self.z_max and n_max <= self.n_max
+
+    def neighbour(self, Z, N, move):
+        """Значение в дочернем ядре перехода move (ключ MOVES или пара (dZ, dN))."""
+        dZ, dN = MOVES[move] if isinstance(move, str) else move
+        return self.at(Z, N, dZ, dN)
+
+
+class BindingSurface(MassSurface):
+    """
+    Та же решетка, но в знаке энергии связи (больше = прочнее): профит топологии,
+    get_total_matrix_energy и т.п. Q-значения и энергии отделения - разности срезов.
+    """
+
+    def gain(self, Z, N, move):
+        """B(дочернее) - B(родитель): выигрыш перехода без учета вылетевшего кластера."""
+        return self.neighbour(Z, N, move) - self.at(Z, N)
+
+    def q_value(self, Z, N, move):
+        """
+        Q перехода: B(дочернее) + B(кластер) - B(родитель). Связанный кластер (alpha)
+        берется с той же поверхности; нуклоны и бета-переходы своей связи не несут.
+        """
+        dZ, dN = MOVES[move] if isinstance(move, str) else move
+        q = self.gain(Z, N, (dZ, dN))
+        if dZ < 0 and dN < 0:
+            q = q + self.grid[self.pad - dZ, self.pad - dN]
+        return q
+
+    def separation_energy(self, Z, N, particle):
+        """S_x = -Q эмиссии x ("n", "2n", "p", "2p", "alpha")."""
+        return -self.q_value(Z, N, particle)
+
+    def beta_cascade(self):
+        """Таблица бета-каскадов по всей карте (строится один раз на поверхность)."""
+        if getattr(self, "_cascade", None) is None:
+            self._cascade = BetaCascade(self)
+        return self._cascade
+
+
+class BetaCascade:
+    """
+    Каскад бета-распадов для всех ядер сразу.
+
+    Правило шага (get_stable_endpoint / run_beta_cascade): сначала одиночный бета-минус,
+    затем бета-плюс, если профит растет; иначе двойной переход через виртуальное состояние.
+    Для каждой клетки ядра решетки хранится указатель на следующую клетку (стабильные
+    указывают сами на себя). Профит строго растет вдоль указателя, циклов нет, поэтому
+    конечные точки находятся удвоением указателей: next^(2^k) за log2(длина) проходов.
+    """
+
+    _ORDER = (BETA_MINUS, BETA_PLUS)
+    _DOUBLE = ((+2, -2), (-2, +2))
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.shape = (surface.z_max + 1, surface.n_max + 1)
+        width = self.shape[1]
+        Z, N = np.indices(self.shape)
+        cur = surface.core
+
+        def candidate(dZ, dN):
+            # Уход за ядро решетки запрещен (вне изобар A <= min(z_max, n_max) не бывает)
+            inside = (Z + dZ >= 0) & (Z + dZ < self.shape[0]) & (N + dN >= 0) & (N + dN < width)
+            return np.where(inside, surface.shifted(dZ, dN), -np.inf)
+
+        dZ = np.zeros(self.shape, dtype=np.int8)
+        dN = np.zeros(self.shape, dtype=np.int8)
+        moved = np.zeros(self.shape, dtype=bool)
+        for moves in (self._ORDER, self._DOUBLE):
+            for mZ, mN in moves:
+                take = ~moved & (candidate(mZ, mN) > cur)
+                dZ[take], dN[take] = mZ, mN
+                moved |= take
+
+        self.dZ, self.dN = dZ, dN
+        flat = np.arange(Z.size).reshape(self.shape)
+        self.next = (flat + dZ.astype(np.intp) * width + dN).ravel()
+        self.stable = ~moved
+        self._endpoints = {}
+
+    def _index(self, Z, N):
+        return np.asarray(Z, dtype=np.intp) * self.shape[1] + np.asarray(N, dtype=np.intp)
+
+    def jump(self, steps=None):
+        """Клетка после steps шагов каскада для всех клеток (None = до стабильности)."""
+        if steps in self._endpoints:
+            return self._endpoints[steps]
+        if steps is None:
+            target = self.next
+            while True:
+                doubled = target[target]
+                if np.array_equal(doubled, target): break
+                target = doubled
+        else:
+            # Binary lifting: next^steps как произведение next^(2^k) по битам steps
+            target, power, k = np.arange(self.next.size), self.next, int(steps)
+            while k:
+                if k & 1: target = power[target]
+                power = power[power]
+                k >>= 1
+        self._endpoints[steps] = target
+        return target
+
+    def endpoints(self, steps=None):
+        """(Z_end, N_end) - массивы формы ядра решетки: долина стабильности для всей карты."""
+        return np.divmod(self.jump(steps).reshape(self.shape), self.shape[1])
+
+    def endpoint(self, Z, N, steps=None):
+        end = self.jump(steps)[self._index(Z, N)]
+        Z_end, N_end = np.divmod(end, self.shape[1])
+        if np.ndim(Z_end) == 0:
+            return int(Z_end), int(N_end)
+        return Z_end, N_end
+
+    def depth(self):
+        """Число шагов до стабильности для каждой клетки (удвоение со счетчиком)."""
+        target, steps = self.next, (~self.stable.ravel()).astype(np.int64)
+        while True:
+            doubled = target[target]
+            if np.array_equal(doubled, target): break
+            steps, target = steps + steps[target], doubled
+        return steps.reshape(self.shape)
+
+    def step(self, Z, N):
+        """(dZ, dN) следующего шага из (Z, N); (0, 0) - стабильно."""
+        return int(self.dZ[Z, N]), int(self.dN[Z, N])
+
+    def path(self, Z, N, max_steps=None):
+        """Цепочка клеток [(Z, N), ...] от старта до стабильности (или max_steps шагов)."""
+        chain = [(int(Z), int(N))]
+        while max_steps is None or len(chain) <= max_steps:
+            dZ, dN = self.step(*chain[-1])
+            if dZ == 0 and dN == 0: break
+            chain.append((chain[-1][0] + dZ, chain[-1][1] + dN))
+        return chain
+
+
+_SURFACES = {}
+
+
+def shared_surface(key, mass_fn, z_max, n_max, cls=BindingSurface):
+    """
+    Поверхность, общая для всего процесса. Один key = одна модель; если запрос выходит
+    за построенную решетку, она пересобирается с запасом (как таблицы ГЦК-линков).
+    """
+    surface = _SURFACES.get(key)
+    if surface is None or not surface.covers(z_max, n_max):
+        z_top, n_top = max(int(z_max), 32), max(int(n_max), 32)
+        if surface is not None:
+            if z_max > surface.z_max: z_top = max(z_top, 2 * surface.z_max)
+            if n_max > surface.n_max: n_top = max(n_top, 2 * surface.n_max)
+            z_top, n_top = max(z_top, surface.z_max), max(n_top, surface.n_max)
+        surface = _SURFACES[key] = cls(mass_fn, z_top, n_top)
+    return surface
+
+
+def beta_decisions(surface, Z, N, labels=("BETA MINUS", "BETA PLUS", "STABLE"), e_lepton=E_ELECTRON):
+    """
+    Векторная классификация диспетчера: бета-минус, если (Z+1, N-1) + e дешевле,
+    иначе бета-плюс, если (Z-1, N+1) + e дешевле, иначе стабильно.
+    Возвращает (calc_mass, m_beta_minus, m_beta_plus, status).
+    """
+    calc = surface.at(Z, N)
+    m_minus = surface.at(Z, N, *BETA_MINUS) + e_lepton
+    m_plus = surface.at(Z, N, *BETA_PLUS) + e_lepton
+    status = np.select([m_minus < calc, m_plus < calc], labels[:2], default=labels[2])
+    return calc, m_minus, m_plus, status
+
+
+def element_labels(elements, Z, A):
+    """'Sym-A' для массивов Z, A по словарю ELEMENTS дашборда."""
+    Z = np.asarray(Z)
+    symbols = np.array([elements.get(z, "?") for z in range(int(Z.max()) + 1)], dtype=object)
+    return symbols[Z] + "-" + np.asarray(A).astype(str).astype(object)
@@ -2,6 +2,10 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 
+from fcc_lattice import crystal_links, link_table
+from mass_surface import MassSurface, beta_decisions, element_labels
+from nuclear_data import ame_mass_frame
+
 # --- SIMUREALITY ONTOLOGICAL CONSTANTS ---
 MASS_P = 938.272
 MASS_N = 939.565
@@ -33,82 +37,16 @@ st.set_page_config(page_title="Simureality OS | Task Dispatcher", layout="wide")
 
 @st.cache_data
 def load_ame_masses(filename="mass.txt"):
-    """Strict fixed-width parser for AME format."""
-    data = []
+    """Fixed-width AME view from the shared store."""
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            for line in f:
-                if len(line) < 65 or 'N-Z' in line or 'keV' in line: continue
-                try:
-                    n_str, z_str, a_str = line[5:10].strip(), line[10:15].strip(), line[15:19].strip()
-                    be_str = line[54:65].strip().replace('#', '').replace('*', '')
-                    if not n_str or not z_str or not be_str: continue
-                    N, Z, A = int(n_str), int(z_str), int(a_str)
-                    be_per_A_keV = float(be_str)
-                    total_be_MeV = (be_per_A_keV * A) / 1000.0
-                    exp_nucleus_mass = (Z * MASS_P) + (N * MASS_N) - total_be_MeV
-                    data.append({'Z': Z, 'N': N, 'Mass_MeV': exp_nucleus_mass})
-                except ValueError:
-                    continue
-        df = pd.DataFrame(data)
-        if not df.empty:
-            df.set_index(['Z', 'N'], inplace=True)
-            df = df[~df.index.duplicated(keep='first')]
-        return df
-    except Exception:
+        return ame_mass_frame(filename, MASS_P, MASS_N)
+    except OSError:
         return pd.DataFrame()
 
 class SimurealityMacroCore:
-    def __init__(self):
-        # Аппаратный кэш ГЦК-решетки. Гарантирует безопасность легких ядер 
-        # и ускоряет рендер матрицы в сотни раз.
-        self._macro_link_cache = {0: 0, 1: 0, 2: 1, 3: 3, 4: 6}
-
-    def get_fcc_neighbors(self, node):
-        """12 интерфейсных портов ГЦК-узла (дистанция в квадрате = 2)"""
-        x, y, z = node
-        deltas = [(1,1,0), (1,-1,0), (-1,1,0), (-1,-1,0),
-                  (1,0,1), (1,0,-1), (-1,0,1), (-1,0,-1),
-                  (0,1,1), (0,1,-1), (0,-1,1), (0,-1,-1)]
-        return [(x+dx, y+dy, z+dz) for dx, dy, dz in deltas]
-
     def compile_3d_crystal(self, n_clusters):
-        """Алгоритм Диспетчера Задач: жадная 3D-компиляция Альфа-кластеров"""
-        if n_clusters in self._macro_link_cache:
-            return self._macro_link_cache[n_clusters]
-            
-        occupied = set([(0, 0, 0)])
-        for _ in range(1, n_clusters):
-            candidates = set()
-            for node in occupied:
-                for neighbor in self.get_fcc_neighbors(node):
-                    if neighbor not in occupied:
-                        candidates.add(neighbor)
-            
-            # Вычисляем центр масс для идеальной сферической упаковки
-            cm_x = sum(n[0] for n in occupied) / len(occupied)
-            cm_y = sum(n[1] for n in occupied) / len(occupied)
-            cm_z = sum(n[2] for n in occupied) / len(occupied)
-            
-            best_pos = None
-            max_bonds = -1
-            min_dist = float('inf')
-            
-            for cand in candidates:
-                bonds = sum(1 for n in self.get_fcc_neighbors(cand) if n in occupied)
-                dist_sq = (cand[0]-cm_x)**2 + (cand[1]-cm_y)**2 + (cand[2]-cm_z)**2
-                
-                # Минимизация вычислительного долга: максимум общих граней, минимум Jitter'а
-                if bonds > max_bonds or (bonds == max_bonds and dist_sq < min_dist):
-                    max_bonds = bonds
-                    min_dist = dist_sq
-                    best_pos = cand
-            
-            occupied.add(best_pos)
-            
-        total_macro_links = sum(sum(1 for n in self.get_fcc_neighbors(node) if n in occupied) for node in occupied) // 2
-        self._macro_link_cache[n_clusters] = total_macro_links
-        return total_macro_links
+        """Жадная 3D-компиляция Альфа-кластеров: O(1) чтение общей ГЦК-таблицы"""
+        return crystal_links(n_clusters)
 
     def compile_mass(self, Z, N):
         n_alphas = min(Z // 2, N // 2)
@@ -146,31 +84,51 @@ class SimurealityMacroCore:
         raw_mass = (Z * MASS_P) + (N * MASS_N)
         return raw_mass - total_binding
 
+    def compile_mass_batch(self, Z, N):
+        """compile_mass для массивов Z, N за один векторный проход"""
+        Z, N = np.broadcast_arrays(np.asarray(Z, dtype=np.int64), np.asarray(N, dtype=np.int64))
+        n_alphas = np.minimum(Z // 2, N // 2)
+        binding_alphas = n_alphas * E_ALPHA
+
+        # --- ДИНАМИЧЕСКИЙ РЕНДЕР МАКРО-ЛИНКОВ ---
+        macro_links = link_table(int(n_alphas.max(initial=0)))[np.maximum(n_alphas, 0)]
+        binding_macro = macro_links * E_MACRO_LINK
+
+        rem_Z = Z - (n_alphas * 2)
+        rem_N = N - (n_alphas * 2)
+
+        # --- SUB-ALPHA PRIMITIVES & HARDWARE FALLBACK ---
+        primitive = np.select([(Z == 1) & (N == 1), (Z == 1) & (N >= 2), (Z == 2) & (N == 1)],
+                              [2.225, 8.482, 7.718], default=0.0)
+        is_drip_line = ((Z == 2) & (N >= 4)) | ((Z == 3) & (N >= 7)) | ((Z > 1) & (N == 0))
+        halo_pair = ~is_drip_line & (rem_N == 2) & (rem_Z == 0)
+
+        no_core = n_alphas == 0
+        binding_halo = np.where(no_core, primitive, np.where(halo_pair, (5 * E_LINK) + E_PAIR, 0.0))
+        jitter = np.where(~no_core & halo_pair, 10 * JITTER_COST, 0.0)
+
+        total_binding = binding_alphas + binding_macro + binding_halo - jitter
+        raw_mass = (Z * MASS_P) + (N * MASS_N)
+        return raw_mass - total_binding
+
 @st.cache_data
 def generate_global_matrix(_engine, df_ame):
-    results = []
-    for (Z, N), row in df_ame.iterrows():
-        exp_mass = row['Mass_MeV']
-        calc_mass = _engine.compile_mass(Z, N)
-        delta = calc_mass - exp_mass
-        
-        m_b_minus = _engine.compile_mass(Z + 1, N - 1) + E_ELECTRON
-        m_b_plus = _engine.compile_mass(Z - 1, N + 1) + E_ELECTRON
-        
-        if m_b_minus < calc_mass: status = "BETA MINUS"
-        elif m_b_plus < calc_mass: status = "BETA PLUS"
-        else: status = "STABLE"
-            
-        sym = ELEMENTS.get(Z, "?")
-        results.append({
-            "Element": f"{sym}-{Z+N}",
-            "Z": Z, "N": N, "A": Z+N,
-            "AME (MeV)": round(exp_mass, 3),
-            "Simureality (MeV)": round(calc_mass, 3),
-            "Delta (MeV)": round(delta, 3),
-            "Dispatcher Decision": status
-        })
-    return pd.DataFrame(results).sort_values(by=["Z", "N"])
+    Z = df_ame.index.get_level_values('Z').to_numpy()
+    N = df_ame.index.get_level_values('N').to_numpy()
+    exp_mass = df_ame['Mass_MeV'].to_numpy()
+
+    # Одна поверхность масс на всю карту; бета-соседи - сдвинутые срезы того же массива
+    surface = MassSurface.for_nuclei(_engine.compile_mass_batch, Z, N)
+    calc_mass, _, _, status = beta_decisions(surface, Z, N)
+
+    return pd.DataFrame({
+        "Element": element_labels(ELEMENTS, Z, Z + N),
+        "Z": Z, "N": N, "A": Z + N,
+        "AME (MeV)": exp_mass.round(3),
+        "Simureality (MeV)": calc_mass.round(3),
+        "Delta (MeV)": (calc_mass - exp_mass).round(3),
+        "Dispatcher Decision": status
+    }).sort_values(by=["Z", "N"])
 
 # --- UI RENDERING ---
 st.title("Simureality OS: Nuclear Task Dispatcher")
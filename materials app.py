@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
+from lazy_import import lazy_module
+from nuclear_data import cached_csv
+px = lazy_module("plotly.express")
 
 # --- PAGE CONFIG ---
 st.set_page_config(
@@ -35,7 +37,7 @@ with st.expander("ℹ️ How to interpret the Simureality Score (Read First!)"):
 def load_data():
     try:
         # Пытаемся загрузить из той же папки
-        df = pd.read_csv('materials_db.csv')
+        df = cached_csv('materials_db.csv')
         return df
     except FileNotFoundError:
         st.error("Файл 'materials_db.csv' не найден! Пожалуйста, создайте его в папке со скриптом.")
@@ -0,0 +1,482 @@
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from chronos_store import write_benchmark
+from fission_scanner import energy_table, fragment_lattice
+from grid_engine import GridPhysicsEngine
+from mass_engines import MASS_N, MASS_P, SimurealityMacroCore
+from mass_surface import MassSurface, beta_decisions, element_labels
+from nuclear_data import (ame_binding_dict, ame_frame, ame_mass_frame, frdm_join, grid_lookup,
+                          load_ame_table, load_charge_radii, load_nubase_grid)
+from topological_core import beta_surface
+
+# ==========================================================================================
+# SIMUREALITY: HEADLESS BATCH ENGINES (NO STREAMLIT, NO PLOTLY)
+# Вычислительные ядра дашбордов без интерфейса. Дашборды импортируют эти функции и только
+# рисуют результат; пакетные задания гоняют те же функции из командной строки по файлам на
+# диске и пишут таблицы колонками в хранилище Chronos (или в CSV, если --out *.csv).
+#
+#   python nuclear_batch.py masses                       # Masses_ultimate -> batch.masses_v6
+#   python nuclear_batch.py chronos-v8                   # Nuclear Energy Calculator 2 -> chronos_v8
+#   python nuclear_batch.py scanner --out scan.csv       # Global Scanner
+#   python nuclear_batch.py api-fusion                   # Api_Fusion
+#   python nuclear_batch.py fission 92:144 98:154 --workers 4
+#   python nuclear_batch.py cascade 54:78
+# ==========================================================================================
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# --- ELEMENT DICTIONARY (Z to Symbol) ---
+ELEMENTS = {
+    0: 'n', 1: 'H', 2: 'He', 3: 'Li', 4: 'Be', 5: 'B', 6: 'C', 7: 'N', 8: 'O', 9: 'F', 10: 'Ne',
+    11: 'Na', 12: 'Mg', 13: 'Al', 14: 'Si', 15: 'P', 16: 'S', 17: 'Cl', 18: 'Ar', 19: 'K', 20: 'Ca',
+    21: 'Sc', 22: 'Ti', 23: 'V', 24: 'Cr', 25: 'Mn', 26: 'Fe', 27: 'Co', 28: 'Ni', 29: 'Cu', 30: 'Zn',
+    31: 'Ga', 32: 'Ge', 33: 'As', 34: 'Se', 35: 'Br', 36: 'Kr', 37: 'Rb', 38: 'Sr', 39: 'Y', 40: 'Zr',
+    41: 'Nb', 42: 'Mo', 43: 'Tc', 44: 'Ru', 45: 'Rh', 46: 'Pd', 47: 'Ag', 48: 'Cd', 49: 'In', 50: 'Sn',
+    51: 'Sb', 52: 'Te', 53: 'I', 54: 'Xe', 55: 'Cs', 56: 'Ba', 57: 'La', 58: 'Ce', 59: 'Pr', 60: 'Nd',
+    61: 'Pm', 62: 'Sm', 63: 'Eu', 64: 'Gd', 65: 'Tb', 66: 'Dy', 67: 'Ho', 68: 'Er', 69: 'Tm', 70: 'Yb',
+    71: 'Lu', 72: 'Hf', 73: 'Ta', 74: 'W', 75: 'Re', 76: 'Os', 77: 'Ir', 78: 'Pt', 79: 'Au', 80: 'Hg',
+    81: 'Tl', 82: 'Pb', 83: 'Bi', 84: 'Po', 85: 'At', 86: 'Rn', 87: 'Fr', 88: 'Ra', 89: 'Ac', 90: 'Th',
+    91: 'Pa', 92: 'U', 93: 'Np', 94: 'Pu', 95: 'Am', 96: 'Cm', 97: 'Bk', 98: 'Cf', 99: 'Es', 100: 'Fm',
+    101: 'Md', 102: 'No', 103: 'Lr', 104: 'Rf', 105: 'Db', 106: 'Sg', 107: 'Bh', 108: 'Hs', 109: 'Mt',
+    110: 'Ds', 111: 'Rg', 112: 'Cn', 113: 'Nh', 114: 'Fl', 115: 'Mc', 116: 'Lv', 117: 'Ts', 118: 'Og',
+    119: 'Uue', 120: 'Ubn'
+}
+
+
+# ==========================================================================================
+# MASSES_ULTIMATE: V6 TASK DISPATCHER (ГЛОБАЛЬНАЯ МАТРИЦА)
+# ==========================================================================================
+
+def global_matrix(engine, df_ame):
+    """ΣK движка, долг и решение диспетчера для каждого ядра AME (индекс (Z, N), Mass_MeV)."""
+    Z = df_ame.index.get_level_values('Z').to_numpy()
+    N = df_ame.index.get_level_values('N').to_numpy()
+    exp_mass = df_ame['Mass_MeV'].to_numpy()
+
+    # Одна поверхность масс на всю карту; бета-соседи - сдвинутые срезы того же массива
+    surface = MassSurface.for_nuclei(engine.compile_mass_batch, Z, N)
+    calc_mass, _, _, status = beta_decisions(
+        surface, Z, N, labels=("BETA MINUS (Garbage Collect)", "BETA PLUS (Garbage Collect)", "STABLE"))
+
+    return pd.DataFrame({
+        "Element": element_labels(ELEMENTS, Z, Z + N),
+        "Z": Z, "N": N, "A": Z + N,
+        "Pure Hardware Log (MeV)": exp_mass.round(3),
+        "Calculated ΣK (MeV)": calc_mass.round(3),
+        "Unresolved Debt (MeV)": (calc_mass - exp_mass).round(3),
+        "Dispatcher Decision": status
+    }).sort_values(by=["Z", "N"])
+
+
+def with_debt_load(global_df):
+    """Глобальная матрица + |долг| и загрузка кеша джиттера (как в CSV-выгрузке дашборда)."""
+    debt = global_df['Unresolved Debt (MeV)'].abs()
+    return global_df.assign(**{'Absolute Debt (MeV)': debt,
+                               'Jitter Cache Load (%)': (debt / global_df['Pure Hardware Log (MeV)']) * 100})
+
+
+def matrix_statistics(global_df):
+    """Эффективность системы, средний и максимальный |долг| (таблица после with_debt_load)."""
+    return {"efficiency": 100.0 - global_df['Jitter Cache Load (%)'].mean(),
+            "mean_debt": global_df['Absolute Debt (MeV)'].mean(),
+            "max_debt": global_df['Absolute Debt (MeV)'].max()}
+
+
+def run_masses(ame_path="mass.txt"):
+    df_ame = ame_mass_frame(ame_path, MASS_P, MASS_N, strict=True)
+    return with_debt_load(global_matrix(SimurealityMacroCore(), df_ame))
+
+
+# ==========================================================================================
+# NUCLEAR ENERGY CALCULATOR 2: CHRONOS ENGINE V8.0 (ΔK VS T_1/2)
+# ==========================================================================================
+
+def ame_records(table):
+    df = ame_frame(table)
+    df = df[df["Total_BE_MeV"] > -100]
+    names = df["A"].astype(str) + df["El"]
+    return list(zip(names, df["Z"].astype(int), df["A"].astype(int), df["Total_BE_MeV"].astype(float)))
+
+
+def chronos_v8_frame(dataset_ame, dataset_nubase, engine=None):
+    """Бенчмарк Chronos V8: записи ame_records x решетка NUBASE -> долг, точность, таймер."""
+    engine = engine or GridPhysicsEngine()
+    names, Z_arr, A_arr, real_be = (np.array(col) for col in zip(*dataset_ame))
+
+    # Векторный джойн по решетке (Z, N, i=0) вместо поиска по строковым именам
+    hl_sec = grid_lookup(dataset_nubase, "half_life_s", Z_arr, A_arr - Z_arr)
+    known = ~np.isnan(hl_sec)
+    names, Z_arr, A_arr, real_be, hl_sec = names[known], Z_arr[known], A_arr[known], real_be[known], hl_sec[known]
+
+    sim_val = engine.calculate_energy_batch(Z_arr, A_arr)
+    delta_k = np.abs(sim_val - real_be)
+    stable = np.isinf(hl_sec)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_hl = np.where(stable, 30, np.where(hl_sec > 0, np.log10(hl_sec), -30))
+        # Безопасный расчет точности для избежания деления на ноль
+        acc = np.where(real_be > 0, 100 * (1 - delta_k / real_be), 0).clip(min=0)
+
+    return pd.DataFrame({
+        "Isotope": names,
+        "Z": Z_arr, "A": A_arr,
+        "ΔK Debt (MeV)": delta_k.round(3),
+        "Accuracy (%)": acc.round(3),
+        "Log10(T_1/2)": log_hl.round(3),
+        "Status": np.where(stable, "Stable", "Unstable"),
+        "AME Exp (MeV)": real_be.round(3),
+        "Simureality (MeV)": sim_val.round(3)
+    })
+
+
+def run_chronos_v8(ame_path="mass.txt", nubase_path="Nubase2020.txt"):
+    return chronos_v8_frame(ame_records(load_ame_table(ame_path)), load_nubase_grid(nubase_path))
+
+
+# ==========================================================================================
+# GLOBAL SCANNER: EMPIRICAL RESONANCE (CR2013 x FRDM-95 / λ_p)
+# ==========================================================================================
+
+LAMBDA_P = 1.3214  # Base L1-Cache lattice step (femtometers)
+
+
+def scanner_merge(radii_path="charge_radii.csv", frdm_path="mass-frdm95.txt"):
+    """Радиусы CR2013 + деформации FRDM-95 (Beta2..Beta6), только A > 20."""
+    df_radii = load_charge_radii(radii_path)
+    df_merged = frdm_join(df_radii, frdm_path, columns=("beta2", "beta3", "beta4", "beta6"))
+    df_merged = df_merged.rename(columns={'beta2': 'Beta2', 'beta3': 'Beta3', 'beta4': 'Beta4', 'beta6': 'Beta6'})
+
+    # Filter out ultralight nuclei (Liquid drop physics applies mainly to A > 20)
+    return df_merged[df_merged['A'] > 20]
+
+
+def scanner_layers(df, lam=LAMBDA_P):
+    """Длина ядра от полюса до полюса, число слоев решетки λ, джиттер и статус."""
+    if df.empty:
+        return df
+    df = df.copy()
+
+    # R_polar = Rc * (1 + sqrt(5 / 4pi) * beta2). Note: sqrt(5 / 4pi) ≈ 0.63078
+    df['Length_fm'] = df['Rc_fm'] * (1 + 0.63078 * df['Beta2']) * 2.0
+    df['Grid_Layers_Float'] = df['Length_fm'] / lam
+    df['Grid_Layers_Int'] = df['Grid_Layers_Float'].round()
+    df['Jitter'] = abs(df['Grid_Layers_Float'] - df['Grid_Layers_Int'])
+    df['Status'] = np.where(df['Jitter'] < 0.15, "Resonance Attractor", "Jitter (Decay Zone)")
+    return df
+
+
+def run_scanner(radii_path="charge_radii.csv", frdm_path="mass-frdm95.txt", lam=LAMBDA_P):
+    return scanner_layers(scanner_merge(radii_path, frdm_path), lam)
+
+
+# ==========================================================================================
+# API_FUSION: HEAVY INTERFACE PRICE LIST (ПРЕФАБЫ + GEOMETRY OVERFLOW)
+# ==========================================================================================
+
+CORE_BLOCKS = [
+    (1, 1, 'H-2'), (2, 2, 'He-4'), (3, 4, 'Li-7'),
+    (6, 6, 'C-12'), (8, 8, 'O-16'), (10, 10, 'Ne-20'),
+    (12, 12, 'Mg-24'), (14, 14, 'Si-28'), (16, 16, 'S-32'), (20, 20, 'Ca-40'),
+    (28, 28, 'Ni-56'), (50, 82, 'Sn-132'), (82, 126, 'Pb-208')  # Добавлены тяжелые модули
+]
+
+
+def block_masses(df_masses, blocks=CORE_BLOCKS):
+    """{имя префаба: масса} для префабов, найденных в таблице масс."""
+    return {name: df_masses.loc[(z, n), 'Mass_MeV'] for z, n, name in blocks if (z, n) in df_masses.index}
+
+
+def build_pair_index(blocks, masses):
+    """
+    Инвертированный индекс (Z1+Z2, N1+N2) -> пары префабов. Все пары с повторением
+    строятся один раз через triu_indices, а не перебором блоков на каждом изотопе.
+    """
+    z = np.array([b[0] for b in blocks])
+    n = np.array([b[1] for b in blocks])
+    names = np.array([b[2] for b in blocks], dtype=object)
+    masses = np.array(masses, dtype=np.float64)
+    i, j = np.triu_indices(len(blocks))
+    swap = names[i] > names[j]  # ключ пары - имена по алфавиту, как sorted() в экстракторе
+    return pd.DataFrame({
+        "Z": z[i] + z[j], "N": n[i] + n[j],
+        "Block 1": np.where(swap, names[j], names[i]), "Block 2": np.where(swap, names[i], names[j]),
+        "Block Mass": masses[i] + masses[j],
+    }).set_index(["Z", "N"])
+
+
+def interface_prices(df_masses, blocks=CORE_BLOCKS):
+    """
+    Медианная цена стыковки каждой пары префабов по всем изотопам AME.
+    Возвращает (таблица цен, {пара: цена}, число проанализированных связей).
+    """
+    masses = block_masses(df_masses, blocks)
+    available_blocks = [(bx, by, bname) for bx, by, bname in blocks if bname in masses]
+    pair_index = build_pair_index(tuple(available_blocks), tuple(masses[b[2]] for b in available_blocks))
+
+    # Один hash join индекса пар с таблицей масс по (Z, N) вместо цикла по всем изотопам
+    links = df_masses[['Mass_MeV']].join(pair_index, how="inner")
+    z_idx, n_idx = links.index.get_level_values(0), links.index.get_level_values(1)
+    links = links[(z_idx >= 2) & (n_idx >= 2)]
+    links = links.assign(Fusion=links["Block Mass"] - links["Mass_MeV"])
+
+    interface_database = defaultdict(list)
+    for b1, b2, fusion_energy in zip(links["Block 1"], links["Block 2"], links["Fusion"]):
+        interface_database[(b1, b2)].append(fusion_energy)
+
+    results_list = []
+    final_api_dict = {}
+    for pair, energies in interface_database.items():
+        if len(energies) > 0:
+            avg_energy = float(np.median(energies))
+            spread = float(np.max(energies) - np.min(energies))
+            # Помечаем красным флажком штрафные интерфейсы
+            status = "🚨 GEOMETRY OVERFLOW" if avg_energy < 0 else "✅ Норма"
+            results_list.append({
+                "Interface Pair": f"('{pair[0]}', '{pair[1]}')",
+                "Median Price (MeV)": round(avg_energy, 3),
+                "Spread (MeV)": round(spread, 3),
+                "Occurrences": len(energies),
+                "Status": status
+            })
+            final_api_dict[pair] = round(avg_energy, 3)
+
+    # Сверху выгодные интерфейсы, снизу - жесткие штрафы
+    df_results = pd.DataFrame(results_list).sort_values(by="Median Price (MeV)", ascending=False)
+    return df_results, final_api_dict, len(links)
+
+
+def api_fusion_code(final_api_dict):
+    """Словарь API_FUSION для Ab Initio компилятора (по убыванию цены)."""
+    code_snippet = "API_FUSION = {\n"
+    for k, v in sorted(final_api_dict.items(), key=lambda x: x[1], reverse=True):
+        code_snippet += f"    ('{k[0]}', '{k[1]}'): {v},\n"
+    return code_snippet + "}"
+
+
+def run_api_fusion(ame_path="mass.txt"):
+    return interface_prices(ame_mass_frame(ame_path, MASS_P, MASS_N))
+
+
+# ==========================================================================================
+# FUSSION_APP: FISSION CLEAVAGE + BETA CASCADE
+# ==========================================================================================
+
+def run_fission_scan(Z_parent, N_parent, ame_db):
+    results = []
+    BE_parent_exp = ame_db.get((Z_parent, N_parent), None)
+    # Решетка фрагментов каждого Z1 - один срез таблицы профита (fission_scanner)
+    table = energy_table(Z_parent, N_parent)
+
+    for Z1, N1, Z2, N2, free_n, theo_Q in fragment_lattice(table, Z_parent, N_parent):
+        exp_Q = None
+        if np.isfinite(theo_Q):
+            exp_Q = ame_db[(Z1, N1)] + ame_db[(Z2, N2)] - BE_parent_exp if (BE_parent_exp and (Z1, N1) in ame_db and (Z2, N2) in ame_db) else np.nan
+        results.append({
+            "Light Fragment Z": Z1, "Light Fragment N": N1,
+            "Heavy Fragment Z": Z2, "Heavy Fragment N": N2,
+            "Dropped Neutrons": free_n,
+            "Topological Profit (MeV)": theo_Q,
+            "Experimental Profit (AME2020)": exp_Q
+        })
+    return pd.DataFrame(results)
+
+
+DECAY_NAMES = {1: "β- Decay", -1: "β+ / EC", 2: "Double β- Decay", -2: "Double β+ / EC"}
+
+
+def run_beta_cascade(Z_start, N_start):
+    chain = []
+    current_Z, current_N = Z_start, N_start
+    # Ходы берутся из общей таблицы указателей каскада, профит - из карты изобары
+    surface = beta_surface(Z_start + N_start)
+    cascade = surface.beta_cascade()
+
+    while True:
+        profit_current = surface.at(current_Z, current_N)
+        dZ, dN = cascade.step(current_Z, current_N)
+        next_step = (current_Z + dZ, current_N + dN) if dZ else None
+        decay_type = DECAY_NAMES.get(dZ, "Stable (Optimal)")
+        best_profit = surface.at(*next_step) if next_step else profit_current
+
+        if abs(dZ) == 2:
+            # Двойной переход идет через виртуальное промежуточное состояние
+            transit = (current_Z + dZ // 2, current_N + dN // 2)
+            profit_transit = surface.at(*transit)
+            chain.append({
+                "Protons (Z)": transit[0], "Neutrons (N)": transit[1],
+                "Mass (A)": current_Z + current_N, "Decay Triggered": "Virtual State (Transit)",
+                "Topological Profit (MeV)": profit_transit, "Step Gain (ΔQ)": profit_transit - profit_current
+            })
+            profit_current = profit_transit
+
+        chain.append({
+            "Protons (Z)": next_step[0] if next_step else current_Z,
+            "Neutrons (N)": next_step[1] if next_step else current_N,
+            "Mass (A)": (next_step[0]+next_step[1]) if next_step else (current_Z+current_N),
+            "Decay Triggered": decay_type,
+            "Topological Profit (MeV)": best_profit,
+            "Step Gain (ΔQ)": best_profit - profit_current if next_step else 0.0
+        })
+
+        if not next_step or len(chain) > 20: break
+        current_Z, current_N = next_step
+
+    return pd.DataFrame(chain)
+
+
+# --- ПУЛ ПРОЦЕССОВ: словарь AME загружается воркером один раз в initializer ---
+_WORKER_AME = None
+
+
+def _init_worker(ame_path):
+    global _WORKER_AME
+    _WORKER_AME = ame_binding_dict(ame_path) if os.path.exists(ame_path) else {}
+
+
+def _fission_job(parent):
+    Z, N = parent
+    return run_fission_scan(Z, N, _WORKER_AME).assign(**{"Parent Z": Z, "Parent N": N})
+
+
+def _cascade_job(parent):
+    return run_beta_cascade(*parent).assign(**{"Start Z": parent[0], "Start N": parent[1]})
+
+
+def map_parents(job, parents, ame_path="mass.txt", workers=1):
+    """job по списку ядер (Z, N): последовательно или пулом процессов; одна общая таблица."""
+    parents = [tuple(map(int, p)) for p in parents]
+    workers = min(workers or os.cpu_count() or 1, len(parents))
+    if workers <= 1:
+        _init_worker(ame_path)
+        frames = [job(p) for p in parents]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ame_path,)) as pool:
+            frames = list(pool.map(job, parents))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+# ==========================================================================================
+# CLI
+# ==========================================================================================
+
+OUT_HELP = ("*.csv: write a CSV file at that path; anything else: Chronos store version name "
+            "(no path separators, no file extension other than .csv)")
+# Суффиксы файлов, которые нельзя молча превратить в имя версии ("batch.masses_v6" - можно)
+FILE_SUFFIXES = {"parquet", "pq", "feather", "arrow", "json", "jsonl", "txt", "tsv", "dat", "xlsx", "xls",
+                 "npy", "npz", "pkl", "pickle", "h5", "hdf5", "gz", "bz2", "xz", "zip", "zst"}
+
+
+def output_target(text):
+    """
+    Тип argparse для --out: путь *.csv или имя версии хранилища Chronos. Значения, похожие
+    на путь к файлу другого формата, отклоняются, а не переименовываются в версию.
+    """
+    out = str(text)
+    if out.lower().endswith(".csv"):
+        return out
+    if not out or "/" in out or os.sep in out or (os.altsep and os.altsep in out):
+        raise argparse.ArgumentTypeError(f"{out!r}: store version names cannot contain a path separator; "
+                                         f"use a .csv path to write a file")
+    if "." in out and out.rsplit(".", 1)[1].lower() in FILE_SUFFIXES:
+        raise argparse.ArgumentTypeError(f"{out!r}: only .csv files are written; other names are "
+                                         f"Chronos store versions and cannot end in a file extension")
+    return out
+
+
+def write_output(df, out, store_dir=None, source="nuclear_batch"):
+    """*.csv -> CSV, иначе версия хранилища Chronos (колонки .npy). Возвращает куда записано."""
+    try:
+        out = output_target(out)
+    except argparse.ArgumentTypeError as e:
+        raise ValueError(str(e)) from None
+    if out.lower().endswith(".csv"):
+        df.to_csv(out, index=False)
+        return out
+    if write_benchmark(df.reset_index(drop=True), out, source=source, store_dir=store_dir) is None:
+        raise OSError(f"Chronos store is not writable: cannot save version {out}")
+    return f"chronos:{out}"
+
+
+def _parent(text):
+    try:
+        z, n = text.split(":")
+        return int(z), int(n)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected Z:N, got {text!r}")
+
+
+def _path(name):
+    return os.path.join(ROOT, name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless batch runs of the Simureality nuclear dashboards.")
+    parser.add_argument("--store-dir", help="Chronos store directory (default: $SIMUREALITY_CHRONOS or chronos_store)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("masses", help="Masses_ultimate: V6 global matrix vs AME2020")
+    p.add_argument("--ame", default=_path("mass.txt"))
+    p.add_argument("--out", type=output_target, default="batch.masses_v6", help=OUT_HELP)
+
+    p = sub.add_parser("chronos-v8", help="Nuclear Energy Calculator 2: ΔK debt vs NUBASE timers")
+    p.add_argument("--ame", default=_path("mass.txt"))
+    p.add_argument("--nubase", default=_path("Nubase2020.txt"))
+    p.add_argument("--out", type=output_target, default="chronos_v8", help=OUT_HELP)
+
+    p = sub.add_parser("scanner", help="Global Scanner: lattice layers and jitter of CR2013 x FRDM-95")
+    p.add_argument("--radii", default=_path("charge_radii.csv"))
+    p.add_argument("--frdm", default=_path("mass-frdm95.txt"))
+    p.add_argument("--lam", type=float, default=LAMBDA_P, help="lattice step, fm")
+    p.add_argument("--out", type=output_target, default="batch.global_scanner", help=OUT_HELP)
+
+    p = sub.add_parser("api-fusion", help="Api_Fusion: interface price list of the core prefabs")
+    p.add_argument("--ame", default=_path("mass.txt"))
+    p.add_argument("--out", type=output_target, default="batch.api_fusion", help=OUT_HELP)
+    p.add_argument("--code", help="also write the API_FUSION dict here")
+
+    for name, desc in (("fission", "Fussion_app: fission cleavage scan"), ("cascade", "Fussion_app: beta cascade")):
+        p = sub.add_parser(name, help=desc)
+        p.add_argument("parents", nargs="+", type=_parent, help="nuclei as Z:N")
+        p.add_argument("--ame", default=_path("mass.txt"))
+        p.add_argument("--workers", type=int, default=1, help="process pool size (0 = all cores)")
+        p.add_argument("--out", type=output_target, default=f"batch.{name}", help=OUT_HELP)
+
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+
+    if args.command == "masses":
+        df = run_masses(args.ame)
+        s = matrix_statistics(df)
+        summary = f"efficiency {s['efficiency']:.4f} %, mean debt {s['mean_debt']:.3f} MeV, max debt {s['max_debt']:.3f} MeV"
+    elif args.command == "chronos-v8":
+        df = run_chronos_v8(args.ame, args.nubase)
+        summary = (f"mean accuracy {df[df['AME Exp (MeV)'] > 10]['Accuracy (%)'].mean():.3f} %, "
+                   f"mean debt {df['ΔK Debt (MeV)'].mean():.3f} MeV")
+    elif args.command == "scanner":
+        df = run_scanner(args.radii, args.frdm, args.lam)
+        summary = f"λ = {args.lam} fm, mean jitter {df['Jitter'].mean():.4f}, attractors {(df['Jitter'] < 0.15).mean():.1%}"
+    elif args.command == "api-fusion":
+        df, api, links = run_api_fusion(args.ame)
+        summary = f"{links} links, {int((df['Median Price (MeV)'] < 0).sum())} geometry overflows"
+        if args.code:
+            with open(args.code, "w", encoding="utf-8") as f:
+                f.write(api_fusion_code(api) + "\n")
+    else:
+        job = _fission_job if args.command == "fission" else _cascade_job
+        df = map_parents(job, args.parents, args.ame, args.workers)
+        summary = f"{len(args.parents)} nuclei"
+
+    where = write_output(df, args.out, args.store_dir)
+    print(f"{args.command}: {len(df)} rows -> {where} ({summary}; {time.perf_counter() - t0:.2f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,517 @@
+import hashlib
+import json
+import os
+import re
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# ==========================================================================================
+# SIMUREALITY: SHARED NUCLEAR DATA STORE
+# Один парсер AME2020 для всех дашбордов. Таблица разбирается один раз в колоночный
+# NumPy-массив и кешируется на диск (.npy, memory-mappable) по SHA-256 исходного файла.
+# Кеш общий для всех процессов сервера: любой дашборд подключает уже разобранную таблицу
+# через mmap (страницы файла делит ОС, массив cached_table в кучу процесса не копируется) и
+# переживает рестарты. DataFrame (cached_frame, cached_csv) собирается из этого массива
+# заново в каждом процессе: общим остается только разбор, сама таблица - копия. Размер кеша ограничен SIMUREALITY_CACHE_MB: при записи вытесняются файлы,
+# к которым дольше всех не обращались (LRU по mtime, обращение = touch).
+# ==========================================================================================
+
+CACHE_DIR = os.environ.get("SIMUREALITY_CACHE", ".simureality_cache")
+CACHE_SCHEMA = 1
+CACHE_LIMIT_MB = float(os.environ.get("SIMUREALITY_CACHE_MB", 1024))
+
+# --- AME2020 (mass.mas20) FIXED-WIDTH LAYOUT ---
+# format: a1,i3,i5,i5,i5,1x,a3,a4,1x,f14.6,f12.6,f13.5,1x,f10.5,1x,a2,f13.5,f11.5,1x,i3,1x,f13.6,f12.6
+AME_LINE_WIDTH = 135
+AME_FIELDS = {
+    "N": (4, 9), "Z": (9, 14), "A": (14, 19), "El": (20, 23), "Origin": (23, 27),
+    "mass_excess": (28, 42), "mass_excess_unc": (42, 54),
+    "be_per_a": (54, 67), "be_per_a_unc": (68, 78),
+    "beta_energy": (81, 94), "beta_energy_unc": (94, 105),
+    "atomic_mass_int": (106, 109), "atomic_mass": (110, 123), "atomic_mass_unc": (123, 135),
+}
+
+AME_DTYPE = np.dtype([
+    ("Z", "<i2"), ("N", "<i2"), ("A", "<i2"), ("El", "U3"),
+    ("mass_excess", "<f8"), ("mass_excess_unc", "<f8"),      # keV
+    ("be_per_a", "<f8"), ("be_per_a_unc", "<f8"),            # keV
+    ("beta_energy", "<f8"), ("beta_energy_unc", "<f8"),      # keV, NaN = '*'
+    ("atomic_mass", "<f8"), ("atomic_mass_unc", "<f8"),      # micro-u
+    ("extrapolated", "?"),        # '#' в массе: оценка AME, а не эксперимент
+    ("beta_extrapolated", "?"),   # '#' в энергии бета-распада (сосед - оценка)
+])
+
+# Строка данных: cc + i3 (N-Z) + i5 (N) + i5 (Z) + i5 (A)
+_AME_ROW = re.compile(rb"^[ 01][ \-\d]{3}[ \d]{4}\d[ \d]{4}\d[ \d]{4}\d ")
+
+
+_DIGESTS = {}
+
+
+def file_digest(path):
+    """SHA-256 исходного файла - ключ бинарного кеша (пересчет только при смене размера/mtime)."""
+    st = os.stat(path)
+    stamp = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+    digest = _DIGESTS.get(stamp)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = _DIGESTS[stamp] = h.hexdigest()
+    return digest
+
+
+def _touch(path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass  # read-only FS: LRU просто не обновляется
+
+
+def cached_array(key, builder, cache_dir=None):
+    """Memory-mapped массив из кеша по ключу или builder() с атомарной записью на диск."""
+    cache_dir = cache_dir or CACHE_DIR
+    cache_path = os.path.join(cache_dir, f"{key}.npy")
+    if os.path.exists(cache_path):
+        try:
+            table = np.load(cache_path, mmap_mode="r")
+            _touch(cache_path)
+            return table
+        except (OSError, ValueError):
+            pass  # битый кеш - пересобираем
+
+    table = builder()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f, warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)  # формат .npy 3.0 для Unicode-имен колонок
+            np.save(f, table)
+        os.replace(tmp_path, cache_path)  # атомарно: параллельные процессы не видят полузаписанный файл
+        evict_cache(cache_dir, keep=(cache_path,))
+        return np.load(cache_path, mmap_mode="r")
+    except OSError:
+        return table  # read-only FS: работаем без кеша
+
+
+def cache_entries(cache_dir=None):
+    """Содержимое кеша от самого свежего к самому старому: ключ, байты, последнее обращение."""
+    cache_dir = cache_dir or CACHE_DIR
+    rows = []
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return rows
+    for name in names:
+        if not name.endswith(".npy"):
+            continue
+        try:
+            st = os.stat(os.path.join(cache_dir, name))
+        except OSError:
+            continue  # вытеснен другим процессом
+        rows.append({"key": name[:-4], "bytes": st.st_size,
+                     "last_used": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(st.st_mtime)),
+                     "_mtime": st.st_mtime_ns})
+    rows.sort(key=lambda r: -r["_mtime"])
+    for r in rows:
+        del r["_mtime"]
+    return rows
+
+
+def evict_cache(cache_dir=None, limit_mb=None, keep=()):
+    """
+    Удаляет самые давно использованные файлы, пока кеш не уложится в limit_mb.
+    Процессы, уже подключившие файл через mmap, продолжают работать: на POSIX
+    отображение живет до закрытия. Возвращает список вытесненных ключей.
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    limit = (CACHE_LIMIT_MB if limit_mb is None else limit_mb) * (1 << 20)
+    keep = {os.path.abspath(k) for k in keep}
+    entries = cache_entries(cache_dir)
+    total = sum(e["bytes"] for e in entries)
+    evicted = []
+    for entry in reversed(entries):
+        if total <= limit:
+            break
+        path = os.path.join(cache_dir, entry["key"] + ".npy")
+        if os.path.abspath(path) in keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= entry["bytes"]
+        evicted.append(entry["key"])
+    return evicted
+
+
+def cached_table(kind, source_path, builder, cache_dir=None):
+    """Таблица, разобранная из source_path; ключ кеша - SHA-256 исходного файла."""
+    key = f"{kind}-v{CACHE_SCHEMA}-{file_digest(source_path)[:16]}"
+    return cached_array(key, lambda: builder(source_path), cache_dir)
+
+
+# --- ТАБЛИЦЫ DataFrame: одна структурированная запись на строку, строки - фиксированный Unicode ---
+# На диске и в mmap - записи; DataFrame для вызывающего кода - копия в памяти процесса.
+
+def frame_records(df):
+    """DataFrame -> структурированный массив (без object-колонок, поэтому mmap без pickle)."""
+    columns = []
+    for name in df.columns:
+        s = df[name]
+        if pd.api.types.is_bool_dtype(s) or (pd.api.types.is_integer_dtype(s) and not s.isna().any()):
+            values = s.to_numpy()
+        elif pd.api.types.is_numeric_dtype(s):
+            values = s.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = s.astype(object).where(s.notna(), "").astype(str).to_numpy(dtype=str)
+        columns.append((str(name), values))
+    out = np.empty(len(df), dtype=[(name, v.dtype) for name, v in columns])
+    for name, values in columns:
+        out[name] = values
+    return out
+
+
+def records_frame(table):
+    """
+    Обратно в DataFrame; пустые строки снова становятся пропусками (как у read_csv).
+    Колонки копируются из table (строки - в объекты Python): mmap здесь заканчивается.
+    """
+    data = {}
+    for name in table.dtype.names:
+        values = table[name]
+        if values.dtype.kind == "U":
+            data[name] = pd.Series(values).where(values != "")
+        else:
+            data[name] = values
+    return pd.DataFrame(data)
+
+
+def cached_frame(kind, source_path, reader, cache_dir=None):
+    """
+    reader(source_path) -> DataFrame: разбор один раз на содержимое файла, дальше - чтение записей
+    из общего кеша. Каждый вызов собирает новый DataFrame в памяти процесса (records_frame).
+    """
+    return records_frame(cached_table(kind, source_path, lambda p: frame_records(reader(p)), cache_dir))
+
+
+def cached_csv(path, cache_dir=None, **read_csv_kwargs):
+    """
+    pd.read_csv(path, **kwargs) через общий кеш: ключ - содержимое файла и параметры чтения.
+    Общий между процессами только разобранный .npy; DataFrame - своя копия у каждого вызова.
+    """
+    options = hashlib.sha256(json.dumps(read_csv_kwargs, sort_keys=True, default=str).encode()).hexdigest()[:8]
+    kind = "csv-" + re.sub(r"[^A-Za-z0-9_.-]", "_", os.path.basename(path)) + "-" + options
+    return cached_frame(kind, path, lambda p: pd.read_csv(p, **read_csv_kwargs), cache_dir)
+
+
+def fixed_width_matrix(lines, width):
+    """Упаковывает строки в (n, width) байтовую матрицу для векторной нарезки колонок."""
+    buf = b"".join(line[:width].ljust(width) for line in lines)
+    return np.frombuffer(buf, dtype="S1").reshape(len(lines), width)
+
+
+def column_bytes(matrix, start, stop):
+    """Колонка фиксированной ширины как массив S-строк."""
+    return np.ascontiguousarray(matrix[:, start:stop]).view(f"S{stop - start}").ravel()
+
+
+def column_float(raw):
+    """'#' на месте десятичной точки -> '.', '*', пустые и текстовые поля -> NaN."""
+    raw = np.char.strip(np.char.replace(raw, b"#", b"."))
+    digits = np.char.replace(np.char.lstrip(raw, b"-+"), b".", b"", 1)
+    numeric = np.char.isdigit(digits)
+    return np.where(numeric, raw, b"nan").astype(np.float64)
+
+
+def parse_ame2020_text(text):
+    """Векторный разбор mass.mas20 в структурированный массив AME_DTYPE."""
+    if isinstance(text, str):
+        text = text.encode("utf-8", errors="ignore")
+    lines = [line for line in text.splitlines() if _AME_ROW.match(line)]
+    table = np.zeros(len(lines), dtype=AME_DTYPE)
+    if not lines:
+        return table
+
+    m = fixed_width_matrix(lines, AME_LINE_WIDTH)
+    col = {name: column_bytes(m, a, b) for name, (a, b) in AME_FIELDS.items()}
+
+    for name in ("Z", "N", "A"):
+        table[name] = col[name].astype(np.int16)
+    table["El"] = np.char.strip(col["El"]).astype("U3")
+    for name in ("mass_excess", "mass_excess_unc", "be_per_a", "be_per_a_unc",
+                 "beta_energy", "beta_energy_unc", "atomic_mass_unc"):
+        table[name] = column_float(col[name])
+    table["atomic_mass"] = (col["atomic_mass_int"].astype(np.float64) * 1e6
+                            + column_float(col["atomic_mass"]))
+    table["extrapolated"] = np.char.find(col["mass_excess"], b"#") >= 0
+    table["beta_extrapolated"] = np.char.find(col["beta_energy"], b"#") >= 0
+    return table
+
+
+def parse_ame2020_file(path):
+    with open(path, "rb") as f:
+        return parse_ame2020_text(f.read())
+
+
+def load_ame_table(path="mass.txt", cache_dir=None):
+    """AME2020 как колоночная таблица. Холодный старт - чтение .npy через mmap."""
+    return cached_table("ame2020", path, parse_ame2020_file, cache_dir)
+
+
+def ame_frame(table, drop_extrapolated=False, strict=False):
+    """
+    DataFrame-вид таблицы с колонкой Total_BE_MeV.
+    drop_extrapolated: только экспериментальные массы.
+    strict: как старый фильтр "ни одного # или * в строке" (включая колонку бета-распада).
+    """
+    mask = np.ones(len(table), dtype=bool)
+    if drop_extrapolated or strict:
+        mask &= ~table["extrapolated"]
+    if strict:
+        mask &= ~table["beta_extrapolated"] & ~np.isnan(table["beta_energy"])
+    df = pd.DataFrame({name: np.asarray(table[name])[mask] for name in AME_DTYPE.names})
+    df["Total_BE_MeV"] = df["be_per_a"] * df["A"] / 1000.0
+    return df
+
+
+def ame_mass_frame(path="mass.txt", mass_p=938.272, mass_n=939.565, strict=False):
+    """Ядерные массы в формате дашбордов Masses_*: индекс (Z, N), колонка Mass_MeV."""
+    df = ame_frame(load_ame_table(path), strict=strict)
+    out = pd.DataFrame({
+        "Z": df["Z"].astype(int), "N": df["N"].astype(int),
+        "Mass_MeV": df["Z"] * mass_p + df["N"] * mass_n - df["Total_BE_MeV"],
+    }).set_index(["Z", "N"])
+    return out[~out.index.duplicated(keep="first")]
+
+
+def ame_binding_dict(path="mass.txt"):
+    """{(Z, N): полная энергия связи, МэВ} - формат Fussion_app / Bulk Fission Test."""
+    df = ame_frame(load_ame_table(path))
+    return dict(zip(zip(df["Z"].astype(int), df["N"].astype(int)), df["Total_BE_MeV"].astype(float)))
+
+
+# ==========================================================================================
+# NUBASE2020: ТАЙМЕРЫ РАСПАДА (ВКЛЮЧАЯ ИЗОМЕРЫ)
+# ==========================================================================================
+
+NUBASE_LINE_WIDTH = 209
+NUBASE_FIELDS = {
+    "A": (0, 3), "Z": (4, 7), "isomer": (7, 8), "name": (11, 17),
+    "mass_excess": (18, 31), "mass_excess_unc": (31, 42),
+    "excitation": (42, 54), "excitation_unc": (54, 65),
+    "half_life": (69, 78), "half_life_unit": (78, 80), "decay": (119, 209),
+}
+
+HALF_LIFE_UNITS = {
+    "ys": 1e-24, "zs": 1e-21, "as": 1e-18, "fs": 1e-15, "ps": 1e-12,
+    "ns": 1e-9, "us": 1e-6, "ms": 1e-3, "s": 1, "m": 60, "h": 3600, "d": 86400,
+    "y": 3.1536e7, "ky": 3.1536e10, "My": 3.1536e13, "Gy": 3.1536e16,
+    "Ty": 3.1536e19, "Py": 3.1536e22, "Ey": 3.1536e25, "Zy": 3.1536e28, "Yy": 3.1536e31,
+}
+
+# Первый канал из колонки BR. Индекс в кортеже - код decay_mode в таблицах.
+DECAY_MODES = ("", "IS", "B-", "B+", "EC", "A", "IT", "SF", "p", "n", "2p", "2n", "3p", "B")
+NUBASE_ISOMERS = 10  # i = 0 (gs), 1-2 (изомеры), 3-6 (уровни), 8-9 (IAS)
+
+NUBASE_DTYPE = np.dtype([
+    ("Z", "<i2"), ("N", "<i2"), ("A", "<i2"), ("isomer", "i1"), ("name", "U6"),
+    ("mass_excess", "<f8"), ("excitation", "<f8"),   # keV
+    ("half_life_s", "<f8"),     # inf = stbl, NaN = нет данных / p-unst
+    ("half_life_limit", "U1"),  # '>', '<', '~' или ''
+    ("half_life_extrapolated", "?"),
+    ("decay_mode", "i1"),       # индекс в DECAY_MODES
+    ("decay", "U90"),
+])
+
+NUBASE_GRID_DTYPE = np.dtype([
+    ("present", "?"), ("half_life_s", "<f8"), ("excitation", "<f8"),
+    ("mass_excess", "<f8"), ("decay_mode", "i1"),
+])
+
+_NUBASE_ROW = re.compile(rb"^\d{3} \d{4}")
+_DECAY_TOKEN = re.compile(r"[A-Za-z0-9+\-]*")
+
+
+def parse_nubase_text(text):
+    """Векторный разбор Nubase2020.txt: все состояния, включая изомеры (zzzi != 0)."""
+    if isinstance(text, str):
+        text = text.encode("utf-8", errors="ignore")
+    lines = [line for line in text.splitlines() if _NUBASE_ROW.match(line)]
+    table = np.zeros(len(lines), dtype=NUBASE_DTYPE)
+    if not lines:
+        return table
+
+    m = fixed_width_matrix(lines, NUBASE_LINE_WIDTH)
+    col = {name: column_bytes(m, a, b) for name, (a, b) in NUBASE_FIELDS.items()}
+
+    table["A"] = col["A"].astype(np.int16)
+    table["Z"] = col["Z"].astype(np.int16)
+    table["N"] = table["A"] - table["Z"]
+    table["isomer"] = col["isomer"].astype(np.int8)
+    table["name"] = np.char.strip(col["name"]).astype("U6")
+    table["mass_excess"] = column_float(col["mass_excess"])
+    table["excitation"] = np.nan_to_num(column_float(col["excitation"]), nan=0.0)
+
+    raw_hl = np.char.strip(col["half_life"])
+    first = np.array([v[:1] for v in raw_hl], dtype="S1")
+    limited = np.isin(first, [b">", b"<", b"~"])
+    table["half_life_limit"] = np.where(limited, first, b"").astype("U1")
+    table["half_life_extrapolated"] = np.char.find(raw_hl, b"#") >= 0
+
+    values = column_float(np.char.lstrip(raw_hl, b"><~"))
+    units = np.char.strip(col["half_life_unit"]).astype("U2")
+    scale = np.array([HALF_LIFE_UNITS.get(u, np.nan) for u in units])
+    half_life = values * scale
+    half_life[np.char.find(raw_hl, b"stbl") >= 0] = np.inf
+    table["half_life_s"] = half_life
+
+    decay = np.char.strip(col["decay"]).astype("U90")
+    table["decay"] = decay
+    codes = {mode: i for i, mode in enumerate(DECAY_MODES)}
+    table["decay_mode"] = [codes.get(_DECAY_TOKEN.match(d).group(0), 0) for d in decay]
+    return table
+
+
+def parse_nubase_file(path):
+    with open(path, "rb") as f:
+        return parse_nubase_text(f.read())
+
+
+def nubase_grid(table):
+    """Плотный индекс (Z, N, isomer) -> NUBASE_GRID_DTYPE для векторных джойнов."""
+    shape = (int(table["Z"].max()) + 1, int(table["N"].max()) + 1, NUBASE_ISOMERS)
+    grid = np.zeros(shape, dtype=NUBASE_GRID_DTYPE)
+    grid["half_life_s"] = np.nan
+    grid["excitation"] = np.nan
+    grid["mass_excess"] = np.nan
+    idx = (table["Z"], table["N"], table["isomer"])
+    for name in ("half_life_s", "excitation", "mass_excess", "decay_mode"):
+        grid[name][idx] = table[name]
+    grid["present"][idx] = True
+    return grid
+
+
+def load_nubase_table(path="Nubase2020.txt", cache_dir=None):
+    return cached_table("nubase2020", path, parse_nubase_file, cache_dir)
+
+
+def load_nubase_grid(path="Nubase2020.txt", cache_dir=None):
+    """Плотная решетка таймеров NUBASE (mmap из кеша)."""
+    return cached_table("nubase2020-grid", path,
+                        lambda p: nubase_grid(load_nubase_table(p, cache_dir)), cache_dir)
+
+
+def grid_lookup(grid, field, Z, N, isomer=0, fill=np.nan):
+    """grid[field][Z, N, isomer] для массивов Z, N; вне решетки и пустые ячейки -> fill."""
+    Z = np.asarray(Z, dtype=np.intp)
+    N = np.asarray(N, dtype=np.intp)
+    inside = (Z >= 0) & (N >= 0) & (Z < grid.shape[0]) & (N < grid.shape[1])
+    zi, ni = np.where(inside, Z, 0), np.where(inside, N, 0)
+    cell = grid[zi, ni, isomer]
+    found = inside & cell["present"]
+    return np.where(found, cell[field], fill)
+
+
+# ==========================================================================================
+# FRDM-95: ТЕОРЕТИЧЕСКИЕ МАССЫ И ДЕФОРМАЦИИ (beta2, beta3, beta4, beta6)
+# ==========================================================================================
+
+# format: i4,i4,1x,a2,i2,f10.3,f10.3,f10.3,f10.3,f8.3,f8.3,f8.3,f8.3
+FRDM_LINE_WIDTH = 85
+FRDM_FIELDS = {
+    "Z": (0, 4), "A": (4, 8), "El": (8, 11), "fl": (11, 13),
+    "Mexp": (13, 23), "Err": (23, 33), "Mth": (33, 43), "Emic": (43, 53),
+    "beta2": (53, 61), "beta3": (61, 69), "beta4": (69, 77), "beta6": (77, 85),
+}
+FRDM_FLOATS = ("Mexp", "Err", "Mth", "Emic", "beta2", "beta3", "beta4", "beta6")
+
+FRDM_DTYPE = np.dtype([
+    ("Z", "<i2"), ("N", "<i2"), ("A", "<i2"), ("El", "U3"), ("fl", "i1"),
+    ("Mexp", "<f8"), ("Err", "<f8"),      # МэВ, эксперимент (NaN - нет измерения)
+    ("Mth", "<f8"), ("Emic", "<f8"),      # МэВ, FRDM и его микроскопическая поправка
+    ("beta2", "<f8"), ("beta3", "<f8"), ("beta4", "<f8"), ("beta6", "<f8"),  # NaN = пусто
+])
+
+_FRDM_ROW = re.compile(rb"^[ \d]{3}\d[ \d]{3}\d ")
+
+
+def parse_frdm95_text(text):
+    """Векторный разбор mass-frdm95.txt: все колонки, пустые поля -> NaN."""
+    if isinstance(text, str):
+        text = text.encode("utf-8", errors="ignore")
+    lines = [line for line in text.splitlines() if _FRDM_ROW.match(line)]
+    table = np.zeros(len(lines), dtype=FRDM_DTYPE)
+    if not lines:
+        return table
+
+    m = fixed_width_matrix(lines, FRDM_LINE_WIDTH)
+    col = {name: column_bytes(m, a, b) for name, (a, b) in FRDM_FIELDS.items()}
+
+    table["Z"] = col["Z"].astype(np.int16)
+    table["A"] = col["A"].astype(np.int16)
+    table["N"] = table["A"] - table["Z"]
+    table["El"] = np.char.strip(col["El"]).astype("U3")
+    table["fl"] = np.nan_to_num(column_float(col["fl"]), nan=-1).astype(np.int8)
+    for name in FRDM_FLOATS:
+        table[name] = column_float(col[name])
+    return table
+
+
+def parse_frdm95_file(path):
+    with open(path, "rb") as f:
+        return parse_frdm95_text(f.read())
+
+
+def frdm_index(table):
+    """Плотный индекс (Z, A) -> номер строки FRDM (-1 - нет ядра); при дублях первая строка."""
+    index = np.full((int(table["Z"].max()) + 1, int(table["A"].max()) + 1), -1, dtype=np.int32)
+    rows = np.arange(len(table), dtype=np.int32)[::-1]
+    index[table["Z"][::-1], table["A"][::-1]] = rows
+    return index
+
+
+def load_frdm_table(path="mass-frdm95.txt", cache_dir=None):
+    return cached_table("frdm95", path, parse_frdm95_file, cache_dir)
+
+
+def load_frdm_index(path="mass-frdm95.txt", cache_dir=None):
+    return cached_table("frdm95-index", path, lambda p: frdm_index(load_frdm_table(p, cache_dir)), cache_dir)
+
+
+def frdm_rows(index, Z, A):
+    """Номера строк FRDM для массивов Z, A; вне индекса и пустые ячейки -> -1."""
+    Z = np.asarray(Z, dtype=np.intp)
+    A = np.asarray(A, dtype=np.intp)
+    inside = (Z >= 0) & (A >= 0) & (Z < index.shape[0]) & (A < index.shape[1])
+    return np.where(inside, index[np.where(inside, Z, 0), np.where(inside, A, 0)], -1)
+
+
+def frdm_join(df, path="mass-frdm95.txt", columns=("beta2",), require=("beta2",), cache_dir=None):
+    """
+    Inner join df (колонки Z, A) с FRDM-95 по индексу (Z, A) без pd.merge.
+    Порядок строк df сохраняется; строки без ядра в FRDM или с пустым полем из require
+    отбрасываются.
+    """
+    table = load_frdm_table(path, cache_dir)
+    rows = frdm_rows(load_frdm_index(path, cache_dir), df["Z"].to_numpy(), df["A"].to_numpy())
+    keep = rows >= 0
+    for name in require:
+        keep &= ~np.isnan(table[name][np.where(keep, rows, 0)])
+    out = df[keep].copy()
+    for name in columns:
+        out[name] = table[name][rows[keep]]
+    return out
+
+
+def load_charge_radii(path="charge_radii.csv"):
+    """CR2013 (charge_radii.csv): Z, A, Isotope, Rc_fm; строки без радиуса отброшены."""
+    df = cached_csv(path)
+    df = df.rename(columns={'z': 'Z', 'a': 'A', 'radius_val': 'Rc_fm', 'symbol': 'Isotope_Sym'})
+    df = df.dropna(subset=['Rc_fm'])
+    df['Isotope'] = df['Isotope_Sym'] + "-" + df['A'].astype(str)
+    return df[['Z', 'A', 'Isotope', 'Rc_fm']]
@@ -0,0 +1,114 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# ==========================================================================================
+# SIMUREALITY: RESAMPLING SIGNIFICANCE ENGINE (BOOTSTRAP + PERMUTATION NULL)
+# Корреляция Пирсона ΔK vs log10(T) для 10^5+ пересэмплов без цикла по пересэмплам:
+#   бутстрап - матрица индексов (блок, n) -> кратности W -> суммы W @ [x, y, x², y², xy];
+#   перестановки - матрица перестановленных y (блок, n), r = Y_perm @ x_z / n.
+# Блоки фиксированного размера с собственными потоками SeedSequence, поэтому результат
+# не зависит от числа воркеров. Блоки раздаются по ядрам (ProcessPoolExecutor).
+# ==========================================================================================
+
+N_RESAMPLES = 100_000
+BLOCK_ELEMENTS = 1 << 22    # ~32 МБ float64 на матрицу блока
+CONFIDENCE = 0.95
+
+
+def _block_rows(n):
+    return max(1, BLOCK_ELEMENTS // max(int(n), 1))
+
+
+def _standardize(v):
+    v = np.asarray(v, dtype=np.float64)
+    sd = v.std()
+    return (v - v.mean()) / sd if sd > 0 else np.full_like(v, np.nan)
+
+
+def pearson(x, y):
+    """r Пирсона двух векторов (nan, если один из них константа)."""
+    return float(np.mean(_standardize(x) * _standardize(y)))
+
+
+def bootstrap_block(x, y, count, seed):
+    """
+    r для count бутстрап-пересэмплов. Индексы блока сворачиваются в матрицу кратностей
+    W (count, n), и все суммы Σx, Σy, Σx², Σy², Σxy получаются одним W @ F.
+    x, y заранее стандартизованы: разности сумм не теряют точность.
+    """
+    n = len(x)
+    idx = np.random.default_rng(seed).integers(0, n, (count, n), dtype=np.int32)
+    offsets = (np.arange(count, dtype=np.int64) * n)[:, None]
+    W = np.bincount((idx + offsets).ravel(), minlength=count * n).reshape(count, n)
+    sx, sy, sxx, syy, sxy = (W @ np.column_stack([x, y, x * x, y * y, x * y])).T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (n * sxy - sx * sy) / np.sqrt((n * sxx - sx * sx) * (n * syy - sy * sy))
+
+
+def permutation_block(x, y, count, seed):
+    """r для count случайных перестановок y при фиксированном x (x, y стандартизованы)."""
+    Y = np.broadcast_to(y, (count, len(y))).copy()
+    np.random.default_rng(seed).permuted(Y, axis=1, out=Y)
+    return Y @ x / len(x)
+
+
+_KERNELS = {"bootstrap": bootstrap_block, "permutation": permutation_block}
+
+# --- ПУЛ ПРОЦЕССОВ: данные передаются воркеру один раз в initializer ---
+# Воркеры стартуют через spawn, а не fork: вызов идет из многопоточного сервера Streamlit.
+_WORKER_DATA = None
+
+
+def _init_worker(x, y):
+    global _WORKER_DATA
+    _WORKER_DATA = (x, y)
+
+
+def _run_block(task):
+    kind, count, seed = task
+    return _KERNELS[kind](*_WORKER_DATA, count, seed)
+
+
+def resample(kind, x, y, n_resamples=N_RESAMPLES, seed=0, workers=None):
+    """Массив r по n_resamples пересэмплам kind ("bootstrap" или "permutation"); workers=None - все ядра."""
+    x, y = _standardize(x), _standardize(y)
+    rows = _block_rows(len(x))
+    counts = [rows] * (n_resamples // rows) + ([n_resamples % rows] if n_resamples % rows else [])
+    seeds = np.random.SeedSequence([seed, list(_KERNELS).index(kind)]).spawn(len(counts))
+    tasks = [(kind, count, s) for count, s in zip(counts, seeds)]
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        return np.concatenate([_KERNELS[kind](x, y, count, s) for _, count, s in tasks]) if tasks else np.empty(0)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(x, y)) as pool:
+        return np.concatenate(list(pool.map(_run_block, tasks)))
+
+
+def correlation_significance(x, y, n_resamples=N_RESAMPLES, confidence=CONFIDENCE, seed=0, workers=None):
+    """
+    r, перцентильный бутстрап-интервал и двусторонний перестановочный p-value
+    ((#|r_null| >= |r| + 1) / (B + 1), поэтому p не бывает меньше 1 / (B + 1)).
+    None, если точек меньше трех или r не определен (x или y - константа): иначе все
+    сравнения с nan ложны и p выходит на пол 1 / (B + 1), т.е. "максимальная значимость".
+    """
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    if len(x) < 3:
+        return None
+    r = pearson(x, y)
+    if not np.isfinite(r):
+        return None
+    boot = resample("bootstrap", x, y, n_resamples, seed, workers)
+    null = resample("permutation", x, y, n_resamples, seed, workers)
+    alpha = (1.0 - confidence) / 2.0
+    lo, hi = np.nanquantile(boot, [alpha, 1.0 - alpha])
+    exceed = int(np.count_nonzero(np.abs(null) >= abs(r) - 1e-12))
+    return {
+        "r": r, "n": len(x), "resamples": int(n_resamples), "confidence": confidence,
+        "ci_low": float(lo), "ci_high": float(hi),
+        "p_perm": (exceed + 1) / (n_resamples + 1), "p_floor": 1.0 / (n_resamples + 1),
+        "bootstrap": boot, "null": null,
+    }
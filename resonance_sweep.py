@@ -0,0 +1,115 @@
+import hashlib
+
+import numpy as np
+
+from nuclear_data import cached_array
+
+# ==========================================================================================
+# SIMUREALITY: RESONANCE-CONSTANT SWEEP (JITTER PERIODOGRAM)
+# Global Scanner делит длину ядра на один шаг решетки λ_p = 1.3214 fm. Здесь тот же джиттер
+# |L/λ - round(L/λ)| считается для всей сетки кандидатов λ (10^4-10^5 значений) сразу:
+# матрица (блок λ, изотопы) транслируется NumPy-ом, блоки фиксированного размера, поэтому
+# память ограничена одним буфером независимо от длины сетки. По каждому λ - средний и
+# медианный джиттер и доля аттракторов. Результат кешируется на диске по хешу длин + сетки.
+# Нулевая гипотеза (нет квантования): джиттер ~ U[0, 0.5], среднее 0.25, дисперсия 1/48.
+# ==========================================================================================
+
+SWEEP_SCHEMA = 1
+SWEEP_RANGE = (0.8, 2.0)        # fm
+SWEEP_POINTS = 50_000
+BLOCK_ELEMENTS = 1 << 21        # ~8 МБ float32 на буфер блока
+ATTRACTOR_JITTER = 0.15         # порог "Resonance Attractor" из Global Scanner
+NULL_MEAN = 0.25
+NULL_VAR = 1.0 / 48.0
+
+SWEEP_DTYPE = np.dtype([
+    ("lambda", np.float64), ("mean", np.float32), ("median", np.float32),
+    ("attractor", np.float32), ("z", np.float32),
+])
+
+
+def lambda_grid(lo=SWEEP_RANGE[0], hi=SWEEP_RANGE[1], points=SWEEP_POINTS):
+    return np.linspace(float(lo), float(hi), int(points))
+
+
+def jitter(lengths, lam):
+    """Джиттер каждого изотопа при шаге lam (float64, как в process_empirical_data)."""
+    layers = np.asarray(lengths, dtype=np.float64) / lam
+    return np.abs(layers - np.round(layers))
+
+
+def jitter_stats(lengths, lam, threshold=ATTRACTOR_JITTER):
+    j = jitter(lengths, lam)
+    return {"lambda": float(lam), "mean": float(j.mean()), "median": float(np.median(j)),
+            "attractor": float((j < threshold).mean()), "z": _z_score(j.mean(), len(j))}
+
+
+def _z_score(mean, n):
+    """На сколько сигм средний джиттер ниже равномерного шума."""
+    return (NULL_MEAN - mean) / np.sqrt(NULL_VAR / max(n, 1))
+
+
+def _block_rows(n):
+    return max(1, BLOCK_ELEMENTS // max(int(n), 1))
+
+
+def sweep(lengths, lambdas, threshold=ATTRACTOR_JITTER, median=True):
+    """
+    Периодограмма джиттера: структурированный массив SWEEP_DTYPE, одна строка на λ.
+    Два буфера (блок, n) float32 переиспользуются для всех блоков, медиана - partition на месте.
+    """
+    lengths = np.asarray(lengths, dtype=np.float32)
+    lambdas = np.asarray(lambdas, dtype=np.float64)
+    n = len(lengths)
+    out = np.zeros(len(lambdas), dtype=SWEEP_DTYPE)
+    out["lambda"] = lambdas
+    if n == 0:
+        out["mean"] = out["median"] = out["z"] = np.nan
+        return out
+
+    rows = _block_rows(n)
+    buf = np.empty((min(rows, len(lambdas)), n), dtype=np.float32)
+    near = np.empty_like(buf)
+    inv = (1.0 / lambdas).astype(np.float32)
+    for start in range(0, len(lambdas), rows):
+        stop = min(start + rows, len(lambdas))
+        b, r = buf[:stop - start], near[:stop - start]
+        np.multiply(inv[start:stop, None], lengths[None, :], out=b)
+        np.rint(b, out=r)
+        np.subtract(b, r, out=b)
+        np.abs(b, out=b)
+        out["mean"][start:stop] = b.mean(axis=1)
+        out["attractor"][start:stop] = np.count_nonzero(b < threshold, axis=1) / n
+        if median:
+            out["median"][start:stop] = np.median(b, axis=1, overwrite_input=True)
+    if not median:
+        out["median"] = np.nan
+    out["z"] = _z_score(out["mean"].astype(np.float64), n)
+    return out
+
+
+def sweep_key(lengths, lambdas, threshold=ATTRACTOR_JITTER, median=True):
+    h = hashlib.sha256()
+    h.update(f"sweep{SWEEP_SCHEMA}\0{threshold!r}\0{bool(median)}\0".encode("utf-8"))
+    h.update(np.ascontiguousarray(lengths, dtype=np.float64).tobytes())
+    h.update(np.ascontiguousarray(lambdas, dtype=np.float64).tobytes())
+    return f"resonance-sweep-{h.hexdigest()[:24]}"
+
+
+def cached_sweep(lengths, lambdas, threshold=ATTRACTOR_JITTER, median=True, cache_dir=None):
+    """sweep() с дисковым кешем: тот же датасет и та же сетка не пересчитываются."""
+    lengths = np.asarray(lengths, dtype=np.float64)
+    lambdas = np.asarray(lambdas, dtype=np.float64)
+    return cached_array(sweep_key(lengths, lambdas, threshold, median),
+                        lambda: sweep(lengths, lambdas, threshold, median), cache_dir)
+
+
+def rank_of(periodogram, lam, field="mean"):
+    """
+    Место шага lam на периодограмме: доля кандидатов сетки, у которых field не лучше,
+    чем у lam (1.0 - lam лучше всех). Для "attractor" лучше - больше, для остальных - меньше.
+    """
+    values = np.asarray(periodogram[field], dtype=np.float64)
+    ref = np.interp(lam, periodogram["lambda"], values)
+    better = values > ref if field == "attractor" else values < ref
+    return 1.0 - np.count_nonzero(better) / max(len(values), 1)
@@ -0,0 +1,199 @@
+import argparse
+import ast
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# ==========================================================================================
+# SIMUREALITY: COLD-START BENCHMARK (IMPORT COST PER MODULE, PER APP)
+# Для каждого Streamlit-дашборда берутся импорты верхнего уровня (то, что платится до
+# первого кадра) и прогоняются в чистом процессе по одному, с замером каждого оператора.
+# Модули за lazy_module(...) в старт не входят и перечисляются отдельно как отложенные.
+# Отсутствующий пакет не валит прогон: оператор помечается "missing".
+# Отчет - JSON, чтобы ловить регрессии холодного старта между коммитами.
+#
+#   python startup_benchmark.py --out startup.json
+#   python startup_benchmark.py --apps "Molecular*" --baseline startup.json
+# ==========================================================================================
+
+REPORT_SCHEMA = 1
+REPEAT = 3
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MARKER = "@@startup"
+
+# Выполняется в дочернем процессе: каждый импорт отдельно, время и статус - в stdout
+_PROBE = """
+import sys, time, json
+for i, stmt in enumerate(json.loads(sys.argv[1])):
+    t0 = time.perf_counter()
+    try:
+        exec(stmt, {})
+        status = "ok"
+    except ImportError as e:
+        status = "missing: " + (getattr(e, "name", None) or str(e))
+    except Exception as e:
+        status = "error: " + type(e).__name__
+    print("%s\\t%d\\t%.9f\\t%s" % (MARKER, i, time.perf_counter() - t0, status), flush=True)
+""".replace("MARKER", repr(MARKER))
+
+
+def _is_streamlit_import(node):
+    if isinstance(node, ast.Import):
+        return any(alias.name.split(".")[0] == "streamlit" for alias in node.names)
+    return isinstance(node, ast.ImportFrom) and (node.module or "").split(".")[0] == "streamlit"
+
+
+def _top_level(tree):
+    """Операторы модуля, выполняемые при запуске (включая тела try/if на верхнем уровне)."""
+    for node in tree.body:
+        yield node
+        if isinstance(node, (ast.Try, ast.If)):
+            for block in (node.body, getattr(node, "orelse", []), getattr(node, "finalbody", [])):
+                yield from block
+            for handler in getattr(node, "handlers", []):
+                yield from handler.body
+
+
+def startup_profile(path):
+    """
+    (импорты верхнего уровня в порядке исполнения, отложенные модули) скрипта path.
+    None, если скрипт не дашборд (нет импорта streamlit) или не парсится.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+    nodes = list(_top_level(tree))
+    imports = [n for n in nodes if isinstance(n, (ast.Import, ast.ImportFrom))]
+    if not any(_is_streamlit_import(n) for n in imports):
+        return None
+    deferred = [
+        call.args[0].value
+        for node in nodes for call in ast.walk(node)
+        if isinstance(call, ast.Call) and getattr(call.func, "id", None) == "lazy_module"
+        and call.args and isinstance(call.args[0], ast.Constant)
+    ]
+    return [ast.unparse(n) for n in imports], deferred
+
+
+def discover_apps(root=ROOT, pattern="*.py"):
+    """Все дашборды репозитория (корень и подкаталоги вроде Script/, DNA/), по имени файла."""
+    paths = sorted(glob.glob(os.path.join(root, "**", pattern), recursive=True))
+    return [p for p in paths if startup_profile(p) is not None]
+
+
+def measure_app(path, repeat=REPEAT, python=sys.executable):
+    """Медиана по repeat холодным процессам: секунды каждого импорта и итог."""
+    statements, deferred = startup_profile(path)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.dirname(path), ROOT, env.get("PYTHONPATH")]))
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+
+    timings = np.full((repeat, len(statements)), np.nan)
+    status = ["not run"] * len(statements)
+    for r in range(repeat):
+        proc = subprocess.run([python, "-c", _PROBE, json.dumps(statements)], cwd=ROOT, env=env,
+                              capture_output=True, text=True)
+        for line in proc.stdout.splitlines():
+            if line.startswith(MARKER):
+                _, i, seconds, state = line.split("\t", 3)
+                timings[r, int(i)] = float(seconds)
+                status[int(i)] = state
+
+    med = np.nanmedian(timings, axis=0) if len(statements) else np.empty(0)
+    imports = {stmt: {"seconds": float(s), "status": st} for stmt, s, st in zip(statements, med, status)}
+    return {
+        "total_s": float(np.nansum(med)),
+        "missing": [stmt for stmt, st in zip(statements, status) if st != "ok"],
+        "imports": imports,
+        "deferred": deferred,
+    }
+
+
+def run_benchmark(apps=None, repeat=REPEAT):
+    apps = discover_apps() if apps is None else apps
+    return {
+        "schema": REPORT_SCHEMA,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(), "platform": platform.platform(),
+        "repeat": repeat,
+        "apps": {os.path.relpath(p, ROOT): measure_app(p, repeat) for p in apps},
+    }
+
+
+def regressions(report, baseline, slowdown=0.25, floor_s=0.05):
+    """
+    Приложения, чей холодный старт вырос больше чем на slowdown (доля) и больше floor_s
+    секунд, и импорты, переставшие быть отложенными. Сравниваются только общие приложения.
+    """
+    found = []
+    for app, cur in report["apps"].items():
+        old = baseline.get("apps", {}).get(app)
+        if old is None:
+            continue
+        if cur["total_s"] > old["total_s"] * (1 + slowdown) and cur["total_s"] - old["total_s"] > floor_s:
+            found.append(f"{app}: cold start {old['total_s']:.3f} -> {cur['total_s']:.3f} s")
+        for name in set(old.get("deferred", [])) - set(cur.get("deferred", [])):
+            found.append(f"{app}: {name} is no longer deferred")
+    return found
+
+
+def _label(stmt):
+    """"import plotly.express as px" -> "plotly.express", "from a.b import c" -> "a.b"."""
+    if stmt.startswith("from "):
+        return stmt[5:].split(" import ")[0]
+    return stmt[7:].split(" as ")[0]
+
+
+def format_report(report, top=3):
+    lines = [f"{'APP':<44} {'START s':>8} {'MISSING':>7}  HEAVIEST IMPORTS"]
+    for app, r in sorted(report["apps"].items(), key=lambda kv: -kv[1]["total_s"]):
+        heavy = sorted(r["imports"].items(), key=lambda kv: -kv[1]["seconds"])[:top]
+        heavy = ", ".join(f"{_label(stmt)} {v['seconds']:.3f}" for stmt, v in heavy)
+        lines.append(f"{app[:44]:<44} {r['total_s']:>8.3f} {len(r['missing']):>7}  {heavy}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start import cost of every Streamlit dashboard.")
+    parser.add_argument("--apps", default="*.py", help="glob of dashboard files (default: all)")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="cold processes per app (median)")
+    parser.add_argument("--out", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="earlier JSON report; exit 1 on cold-start regressions")
+    parser.add_argument("--list", action="store_true", help="list discovered dashboards and exit")
+    args = parser.parse_args(argv)
+
+    apps = discover_apps(pattern=args.apps)
+    if args.list:
+        for path in apps:
+            statements, deferred = startup_profile(path)
+            print(f"{os.path.relpath(path, ROOT):<50} {len(statements):>3} imports, {len(deferred)} deferred")
+        return 0
+
+    report = run_benchmark(apps, args.repeat)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(format_report(report))
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=1)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            found = regressions(report, json.load(f))
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
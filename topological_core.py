@@ -0,0 +1,104 @@
+import numpy as np
+
+from mass_surface import shared_surface
+
+# ==========================================================================================
+# SIMUREALITY: TOPOLOGICAL PROFIT CORE (ALPHA-CLUSTERS + HALO + ROUTING TAX)
+# Векторная версия calculate_topological_profit / get_total_matrix_energy из дашбордов
+# деления и синтеза. Карта считается одним проходом и раздается всем каскадам через
+# общую BindingSurface, вместо тысяч скалярных вызовов модели на одних и тех же (Z, N).
+# ==========================================================================================
+
+def generate_fcc_magic():
+    base_shells = [int((n+1)*(n+2)*(n+3)/3) for n in range(6)]
+    twist_shifts = [28, 50, 82, 126]
+    return sorted(list(set(base_shells + twist_shifts)))
+
+MAGIC_NODES = generate_fcc_magic()
+_MAGIC = np.array(MAGIC_NODES, dtype=np.int64)
+
+E_ALPHA = 28.320
+E_MACRO = 2.425
+E_LINK = 2.360
+E_PAIR = 1.180
+J_TAX = 0.0131
+C_TAX = E_LINK * np.sqrt(2)
+
+JITTER_POWER = 1.2  # Fission dashboards; The Forge держит 1.6
+
+
+def magic_distance(k):
+    """min(|k - m| for m in MAGIC_NODES) для целочисленного массива k."""
+    k = np.asarray(k, dtype=np.int64)
+    return np.min(np.abs(k[..., None] - _MAGIC), axis=-1)
+
+
+def jitter_tax(Z, N, power=JITTER_POWER):
+    Z, N = np.asarray(Z, dtype=np.int64), np.asarray(N, dtype=np.int64)
+    valid = (Z > 0) & (N > 0)
+    A = np.where(valid, Z + N, 1).astype(np.float64)
+    base_ports = 10.0 * A ** (2/3)
+    dist = (magic_distance(Z) + magic_distance(N)).astype(np.float64)
+    return np.where(valid, (base_ports + 15.0 * dist ** power) * J_TAX, 0.0)
+
+
+def dangling_port_tax(Z, N):
+    return (E_LINK / 2.0) * ((np.asarray(Z) % 2) + (np.asarray(N) % 2))
+
+
+def topological_profit(Z, N, power=JITTER_POWER):
+    """calculate_topological_profit для массивов Z, N; 0 вне Z > 0, N > 0."""
+    Z, N = np.broadcast_arrays(np.asarray(Z, dtype=np.int64), np.asarray(N, dtype=np.int64))
+    valid = (Z > 0) & (N > 0)
+    N_alpha = np.minimum(Z // 2, N // 2)
+    l_ideal = np.maximum(0, 3 * N_alpha - 6)
+    l_lost = (magic_distance(Z) + magic_distance(N)) * 0.4
+    BE = N_alpha * E_ALPHA + np.maximum(0, l_ideal - l_lost) * E_MACRO
+
+    # Гало: сильные 1p-1n линки до 40% от Z, остаток - слабая нейтронная шуба
+    halo_n = np.maximum(N - Z, 0)
+    strong_halo = np.minimum(halo_n, np.floor(np.maximum(Z, 0) * 0.4).astype(np.int64))
+    weak_halo = halo_n - strong_halo
+    BE = BE + strong_halo * E_LINK
+    BE = BE + weak_halo * (E_PAIR / 2.0)
+
+    BE = BE - jitter_tax(Z, N, power)
+    BE = BE - dangling_port_tax(Z, N)
+    return np.where(valid, BE, 0.0)
+
+
+def graph_diameter(A):
+    """get_discrete_graph_diameter: номер слоя + доля его заполнения."""
+    A = np.asarray(A, dtype=np.int64)
+    diameter = 1 + np.searchsorted(_MAGIC, A, side="left")
+    current_base = np.where(diameter > 1, _MAGIC[np.clip(diameter - 2, 0, len(_MAGIC) - 1)], 0)
+    next_base = np.where(diameter <= len(_MAGIC), _MAGIC[np.clip(diameter - 1, 0, len(_MAGIC) - 1)], A)
+    return diameter + (A - current_base) / np.maximum(1, next_base - current_base)
+
+
+def matrix_energy(Z, N, power=JITTER_POWER, outside=0.0):
+    """
+    Профит топологии минус кулоновский налог маршрутизации C_TAX * Z(Z-1)/2 / диаметр.
+    outside - значение вне Z > 0, N > 0 (0 для get_total_matrix_energy, -inf для бета-каскада).
+    """
+    Z, N = np.broadcast_arrays(np.asarray(Z, dtype=np.int64), np.asarray(N, dtype=np.int64))
+    valid = (Z > 0) & (N > 0)
+    coulomb = C_TAX * ((Z * (Z - 1)) / 2.0) / graph_diameter(np.maximum(Z + N, 1))
+    return np.where(valid, topological_profit(Z, N, power) - coulomb, outside)
+
+
+def profit_surface(z_max, n_max, power=JITTER_POWER):
+    """Общая карта calculate_topological_profit (0 вне Z > 0, N > 0)."""
+    return shared_surface(("topological-profit", power), lambda Z, N: topological_profit(Z, N, power), z_max, n_max)
+
+
+def matrix_surface(z_max, n_max, power=JITTER_POWER, outside=0.0):
+    """Общая карта get_total_matrix_energy / get_beta_profit."""
+    key = ("matrix-energy", power, outside)
+    return shared_surface(key, lambda Z, N: matrix_energy(Z, N, power, outside), z_max, n_max)
+
+
+def beta_surface(A_max, power=JITTER_POWER):
+    """Карта профита бета-каскада (-inf вне Z > 0, N > 0) для всех изобар до A_max."""
+    return matrix_surface(A_max, A_max, power, outside=-np.inf)
+